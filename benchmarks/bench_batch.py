@@ -0,0 +1,58 @@
+"""
+Benchmark of evaluating a batch of expressions, some of them invalid, with
+`evaluate_many()` and with a loop calling `evaluate()` for every expression.
+
+Run with `python -m benchmarks.bench_batch`.
+"""
+import random
+import time
+
+from core.batch import evaluate_many
+from main import evaluate
+
+
+def batch(size: int = 20_000) -> list[str]:
+    """Generate time differences and arithmetic, one in ten of them failing."""
+    generator = random.Random(0)
+    expressions = []
+    for number in range(size):
+        start, end = sorted(generator.sample(range(6 * 60, 22 * 60), 2))
+        if number % 10 == 0:
+            expressions.append(f'{generator.randint(1, 9)} / 0')
+        elif number % 2:
+            expressions.append(f'{end // 60}:{end % 60:02} - {start // 60}:{start % 60:02}')
+        else:
+            expressions.append(f'{generator.randint(1, 12)} * {generator.randint(10, 60)}')
+    return expressions
+
+
+def naive(expressions: list[str]) -> int:
+    """Evaluate expressions in a loop, catching errors of each, and count the failed."""
+    failed = 0
+    for code in expressions:
+        try:
+            evaluate(code)
+        except Exception: # pylint: disable=broad-exception-caught # noqa: BLE001
+            failed += 1
+    return failed
+
+
+def batched(expressions: list[str]) -> int:
+    """Evaluate expressions in a batch and count the failed."""
+    return sum(not result.ok for result in evaluate_many(expressions))
+
+
+def main(rounds: int = 5) -> None:
+    """Print throughput of both ways, the best of `rounds` runs."""
+    expressions = batch()
+    for name, function in (('naive loop', naive), ('evaluate_many', batched)):
+        best = float('inf')
+        for _ in range(rounds):
+            start = time.perf_counter()
+            function(expressions)
+            best = min(best, time.perf_counter() - start)
+        print(f'{name:>13}: {len(expressions) / best:12,.0f} expressions/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""
+Benchmark of evaluating already parsed expressions repeatedly, walking the AST
+versus running the expression compiled into Python code.
+
+Run with `python -m benchmarks.bench_compiler`.
+"""
+import timeit
+from functools import partial
+
+from core.compiler import compile_expression
+from core.interpreter import Interpreter
+
+EXPRESSIONS = [
+    '9:30 - 8:00',
+    '10 - 10 + 10 * 10 / 2',
+    '1 + 2 * 3 - 4 / 5 + 6 ^ 2 - 7 * 8 + 9 / 10 - 11 + 12 * 13',
+    'if 10 * 3 < 30 ^ 2 then "Hi, µLang"',
+]
+
+
+def main(repeat: int = 5, number: int = 20_000) -> None:
+    """Print per-evaluation latency of both ways of evaluating each expression."""
+    interpreter = Interpreter()
+    for code in EXPRESSIONS:
+        tree = interpreter.parse(code)
+        compile_time = min(timeit.repeat(partial(compile_expression, tree), number=100))
+        compiled = compile_expression(tree)
+        tree_time = min(timeit.repeat(tree.eval, repeat=repeat, number=number))
+        compiled_time = min(timeit.repeat(compiled, repeat=repeat, number=number))
+        print(code)
+        print(
+            f'    tree-walking {tree_time / number * 1e6:7.3f} µs, '
+            f'compiled {compiled_time / number * 1e6:7.3f} µs '
+            f'({tree_time / compiled_time:5.1f}x), '
+            f'compilation {compile_time / 100 * 1e6:7.1f} µs once'
+        )
+
+
+if __name__ == '__main__':
+    main()
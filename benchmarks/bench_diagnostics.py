@@ -0,0 +1,57 @@
+"""
+Benchmark of evaluating a batch of expressions, half of which warn, e.g.
+redeclare variables or subtract later times, with warnings raised (strict)
+versus collected as diagnostics, with every backend.
+
+Run with `python -m benchmarks.bench_diagnostics`.
+"""
+import random
+import time
+
+from core.batch import evaluate_many
+from core.diagnostics import Diagnostics
+from core.interpreter import Backend, Interpreter
+from core.symbol_table_manager import SymbolTableManager
+
+
+def batch(size: int = 20_000) -> list[str]:
+    """Generate declarations and time differences, every other one warning."""
+    generator = random.Random(0)
+    expressions = []
+    for number in range(size):
+        start, end = sorted(generator.sample(range(6 * 60, 22 * 60), 2))
+        start_text, end_text = f'{start // 60}:{start % 60:02}', f'{end // 60}:{end % 60:02}'
+        if number % 4 == 0:
+            # Redeclares one of a few variables, which warns after the first time.
+            expressions.append(f'var shift_{number % 8} = {end_text} - {start_text}')
+        elif number % 4 == 1:
+            expressions.append(f'{start_text} - {end_text}')
+        else:
+            expressions.append(f'{end_text} - {start_text}')
+    return expressions
+
+
+def main(rounds: int = 5) -> None:
+    """Print throughput and the number of warnings of both modes, the best of `rounds` runs."""
+    expressions = batch()
+    for backend in Backend:
+        for name, diagnostics in (('strict', None), ('collected', Diagnostics())):
+            best = float('inf')
+            warnings = 0
+            for _ in range(rounds):
+                interpreter = Interpreter(
+                    SymbolTableManager(), backend=backend, diagnostics=diagnostics,
+                )
+                start = time.perf_counter()
+                results = list(evaluate_many(expressions, interpreter))
+                best = min(best, time.perf_counter() - start)
+                warnings = sum(
+                    len(result.diagnostics) if diagnostics is not None else not result.ok
+                    for result in results
+                )
+            print(f'{backend.value:>8} {name:>9}: {len(expressions) / best:10,.0f} expressions/s, '
+                  f'{warnings:,} warnings')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmark of evaluating left-associative chains of additions of growing depth
+with every backend: time of evaluating an already parsed chain, including
+linearizing or compiling it, and peak memory it allocates, or the error
+a backend fails with.
+
+Run with `python -m benchmarks.bench_evaluator [terms ...]`.
+"""
+import sys
+import time
+import tracemalloc
+
+from core.interpreter import Backend, Interpreter
+
+DEFAULT_TERMS = [100, 500, 10_000, 100_000, 1_000_000]
+
+
+def evaluate(interpreter: Interpreter, tree: object, backend: Backend) -> tuple[float, float]:
+    """Evaluate `tree` once and return the wall time and the peak of allocated MiB."""
+    start = time.perf_counter()
+    interpreter.execute(tree, backend)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    try:
+        interpreter.execute(tree, backend)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return elapsed, peak / 2 ** 20
+
+
+def main(counts: list[int]) -> None:
+    """Print time and peak memory of evaluating a chain of each length with each backend."""
+    interpreter = Interpreter(optimize=False)
+    interpreter.evaluate('var hour = 1')
+    for terms in counts:
+        start = time.perf_counter()
+        tree = interpreter.parse(' + '.join(['hour'] * terms))
+        print(f'{terms:,} terms, parsed in {time.perf_counter() - start:.2f} s')
+        for backend in Backend:
+            try:
+                elapsed, peak = evaluate(interpreter, tree, backend)
+            except (RecursionError, MemoryError, SyntaxError) as e:
+                print(f'    {backend.value:>8}: {type(e).__name__}')
+                continue
+            print(
+                f'    {backend.value:>8}: {elapsed * 1e3:10.1f} ms, '
+                f'{elapsed / terms * 1e9:7.0f} ns per term, peak {peak:8.2f} MiB'
+            )
+
+
+if __name__ == '__main__':
+    main([int(argument) for argument in sys.argv[1:]] or DEFAULT_TERMS)
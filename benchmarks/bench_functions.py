@@ -0,0 +1,44 @@
+"""
+Benchmark of a recursive µLang function, the naive Fibonacci, called with and
+without memoization.
+
+Run with `python -m benchmarks.bench_functions`.
+"""
+import time
+
+from core.interpreter import Backend, Interpreter
+
+FIBONACCI = 'fun fib(n) = if n < 2 then n else fib(n - 1) + fib(n - 2)'
+
+
+def timed(interpreter: Interpreter, code: str) -> tuple[float, object]:
+    """Evaluate code, returning the duration in seconds and the result."""
+    start = time.perf_counter()
+    result = interpreter.evaluate(code)
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    """Print the duration of a call of `fib` with every backend, memoized and not."""
+    for backend in Backend:
+        print(f'{backend.value}:')
+        for n in (15, 20, 25):
+            interpreter = Interpreter(backend=backend)
+            interpreter.evaluate(FIBONACCI)
+            naive, expected = timed(interpreter, f'fib({n})')
+
+            interpreter = Interpreter(backend=backend)
+            interpreter.evaluate(FIBONACCI)
+            interpreter.memoize('fib')
+            cold, result = timed(interpreter, f'fib({n})')
+            warm, _ = timed(interpreter, f'fib({n})')
+            assert result == expected
+            print(
+                f'    fib({n}): naive {naive * 1e3:9.2f} ms, '
+                f'memoized {cold * 1e3:6.3f} ms ({naive / cold:7,.0f}x), '
+                f'cached {warm * 1e3:6.3f} ms'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""
+Benchmark of the overhead of instrumentation: evaluating cached expressions
+without the instrumentation check at all, with instrumentation disabled and
+with it enabled.
+
+Run with `python -m benchmarks.bench_instrumentation`.
+"""
+import timeit
+
+from core.instrumentation import Statistics
+from core.interpreter import Interpreter
+
+EXPRESSIONS = ['9:30 - 8:00', '10 - 10 + 10 * 10 / 2', 'if 10 < 30 then "Hi, µLang"']
+
+
+def main(repeat: int = 20) -> None:
+    """Print the time of one evaluation in every variant."""
+    disabled = Interpreter()
+    enabled = Interpreter(instrument=Statistics().record)
+
+    def unchecked() -> None:
+        for code in EXPRESSIONS:
+            disabled.execute(disabled.parse(code))
+
+    def evaluate_disabled() -> None:
+        for code in EXPRESSIONS:
+            disabled.evaluate(code)
+
+    def evaluate_enabled() -> None:
+        for code in EXPRESSIONS:
+            enabled.evaluate(code)
+
+    variants = {'no check': unchecked, 'disabled': evaluate_disabled, 'enabled': evaluate_enabled}
+    timers = {name: timeit.Timer(function) for name, function in variants.items()}
+    number, _ = timers['no check'].autorange()
+    best = dict.fromkeys(variants, float('inf'))
+    # Rounds of the variants are interleaved, so a noisy neighbour slows all down.
+    for _ in range(repeat):
+        for name, timer in timers.items():
+            best[name] = min(best[name], timer.timeit(number) / number / len(EXPRESSIONS))
+
+    for name, duration in best.items():
+        overhead = duration / best['no check'] - 1
+        print(f'{name:>8}: {duration * 1e6:7.3f} µs per evaluation ({overhead:+6.1%})')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""
+Benchmark of per-call latency of `evaluate()`, comparing building the lexer and
+the parser on every call with reusing the grammar shared by interpreters.
+
+Run with `python -m benchmarks.bench_interpreter`.
+"""
+import timeit
+
+from core.interpreter import Interpreter
+from core.lexer import Lexer
+from core.parser import Parser
+from main import evaluate
+
+CODE = '9:30 - 8:00'
+
+
+def evaluate_rebuilding_grammar(code: str) -> object:
+    """Evaluate code the way `evaluate()` used to: with a brand-new grammar."""
+    parser_generator = Parser()
+    parser_generator.parse()
+    interpreter = Interpreter(
+        lexer=Lexer().get_lexer(),
+        parser=parser_generator.get_parser(),
+    )
+    return interpreter.evaluate(code)
+
+
+def main(repeat: int = 5, number: int = 2_000) -> None:
+    """Print the best per-call latency of every way of evaluating `CODE`."""
+    interpreter = Interpreter()
+    candidates = {
+        'rebuilding grammar per call': lambda: evaluate_rebuilding_grammar(CODE),
+        'evaluate() with shared grammar': lambda: evaluate(CODE),
+        'reused Interpreter': lambda: interpreter.evaluate(CODE),
+    }
+    for name, candidate in candidates.items():
+        best = min(timeit.repeat(candidate, repeat=repeat, number=number))
+        print(f'{name:>32}: {best / number * 1e6:9.2f} µs per call')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""
+Benchmark of tokenizing a large source code with the single-pass lexer, the
+rule-by-rule lexer and the `rply` lexer.
+
+Run with `python -m benchmarks.bench_lexer`.
+"""
+import random
+import time
+
+from core.lexer import Lexer
+
+
+def source(lines: int = 50_000) -> str:
+    """Generate lines of declarations, conditions, time differences and arithmetic."""
+    generator = random.Random(0)
+    templates = [
+        'var shift_{n} = {h}:{m:02} - 7:30',
+        'if {h} >= 8 then "overtime on day {n}"',
+        '({h} * 60 + {m}) / 2.5 ^ 2 - -{n}.5e1',
+    ]
+    return '\n'.join(
+        generator.choice(templates).format(
+            n=n, h=generator.randint(8, 20), m=generator.randint(0, 59)
+        )
+        for n in range(lines)
+    )
+
+
+def main(rounds: int = 3) -> None:
+    """Print tokens per second of every lexer, the best of `rounds` runs."""
+    code = source()
+    lexers = (
+        ('single pass', Lexer().get_lexer()),
+        ('rule by rule', Lexer().get_lexer(single_pass=False)),
+        ('rply', Lexer().get_rules().build_rply()),
+    )
+    print(f'{len(code) / 2 ** 20:.1f} MiB of code')
+    for name, lexer in lexers:
+        best = float('inf')
+        for _ in range(rounds):
+            start = time.perf_counter()
+            count = sum(1 for _ in lexer.lex(code))
+            best = min(best, time.perf_counter() - start)
+        print(f'{name:>12}: {count / best:12,.0f} tokens/s')
+
+
+if __name__ == '__main__':
+    main()
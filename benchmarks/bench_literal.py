@@ -0,0 +1,42 @@
+"""
+Micro-benchmark of constructing a million times and subtracting them, as
+evaluating time differences does.
+
+Run with `python -m benchmarks.bench_literal`.
+"""
+import random
+import time
+
+from core.tokens.literal import Time
+
+
+def main(count: int = 1_000_000) -> None:
+    """Print the time of constructing and of subtracting `count` times."""
+    generator = random.Random(0)
+    minutes = [generator.randrange(24 * 60) for _ in range(count)]
+    texts = [f'{minute // 60}:{minute % 60:02}' for minute in minutes]
+
+    start = time.perf_counter()
+    times = [Time(text) for text in texts]
+    parsing = time.perf_counter() - start
+
+    start = time.perf_counter()
+    [Time(minute) for minute in minutes] # pylint: disable=expression-not-assigned
+    from_minutes = time.perf_counter() - start
+
+    pairs = [(max(a, b), min(a, b)) for a, b in zip(times, reversed(times))]
+    start = time.perf_counter()
+    for later, earlier in pairs:
+        _ = later - earlier
+    subtracting = time.perf_counter() - start
+
+    for name, elapsed in (
+        ('construct from text', parsing),
+        ('construct from minutes', from_minutes),
+        ('subtract', subtracting),
+    ):
+        print(f'{name:>22}: {elapsed * 1e3:8.1f} ms, {elapsed / count * 1e9:6.0f} ns each')
+
+
+if __name__ == '__main__':
+    main()
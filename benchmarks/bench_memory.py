@@ -0,0 +1,49 @@
+"""
+Benchmark of memory taken by ASTs of a generated program of a hundred
+thousand lines, parsed without folding so every literal is kept, and by
+symbols of as many variables, traced with `tracemalloc`.
+
+Run with `python -m benchmarks.bench_memory [lines]`.
+"""
+import os
+import sys
+import tempfile
+import tracemalloc
+
+from benchmarks.bench_script import generate
+from core.interpreter import Interpreter
+from core.optimizer import count_nodes
+from core.script import split_statements
+from core.symbol_table_manager import Symbol, SymbolTableManager, SymbolType
+
+
+def main(lines: int = 100_000) -> None:
+    """Generate a program and print bytes per node of its ASTs and bytes per symbol."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'generated.u')
+        generate(path, lines)
+        with open(path, encoding='utf-8') as file:
+            codes = [code for _, code in split_statements(file)]
+
+    interpreter = Interpreter(optimize=False)
+    interpreter.prepare(codes[0])  # Builds the grammar before tracing.
+    tracemalloc.start()
+    trees = [interpreter.prepare(code) for code in codes]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    nodes = sum(count_nodes(tree) for tree in trees)
+    print(f'{lines:,} lines, {nodes:,} nodes: {size / 2 ** 20:6.1f} MiB, '
+          f'{size / nodes:5.1f} bytes per node')
+
+    names = [f'hours_{number}' for number in range(lines)]
+    symbol_table = SymbolTableManager()
+    tracemalloc.start()
+    for name in names:
+        symbol_table.declare(Symbol(name, SymbolType.VARIABLE, 8.0))
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f'{lines:,} symbols: {size / 2 ** 20:6.1f} MiB, {size / lines:5.1f} bytes per symbol')
+
+
+if __name__ == '__main__':
+    main(*(int(argument) for argument in sys.argv[1:2]))
@@ -0,0 +1,37 @@
+"""
+Benchmark of integer-heavy arithmetic in every numeric mode, with every
+backend: an unoptimized chain of integer literals and a formula of integer
+variables, both evaluated from already parsed ASTs, or compiled ones.
+
+Run with `python -m benchmarks.bench_numeric`.
+"""
+import timeit
+from functools import partial
+
+from core.interpreter import Backend, Interpreter
+from core.tokens.literal import Numeric
+
+LITERALS = '1' + ''.join(f' {"+-*"[n % 3]} {n % 97 + 2}' for n in range(60))
+FORMULA = 'hours * 60 + minutes - breaks * 15 + hours * hours - minutes * 2 + 1000'
+VARIABLES = {'hours': 8, 'minutes': 45, 'breaks': 3}
+
+
+def main(repeat: int = 5, number: int = 2_000) -> None:
+    """Print per-evaluation latency of both expressions in each mode with each backend."""
+    for name, code in (('60 literals', LITERALS), ('formula of variables', FORMULA)):
+        print(name)
+        for numeric in Numeric:
+            timings = []
+            for backend in Backend:
+                interpreter = Interpreter(optimize=False, numeric=numeric, backend=backend)
+                for variable, value in VARIABLES.items():
+                    interpreter.evaluate(f'var {variable} = {value}')
+                evaluate = interpreter.compile(code) if backend is not Backend.TREE \
+                    else partial(interpreter.execute, interpreter.parse(code))
+                best = min(timeit.repeat(evaluate, repeat=repeat, number=number))
+                timings.append(f'{backend.value} {best / number * 1e6:7.2f} µs')
+            print(f'    {numeric.value:>8}: {", ".join(timings)}')
+
+
+if __name__ == '__main__':
+    main()
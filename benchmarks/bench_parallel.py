@@ -0,0 +1,49 @@
+"""
+Benchmark of evaluating a synthetic corpus of independent programs with 1, 2,
+4 and 8 worker processes, and as many worker threads sharing one parser.
+
+Run with `python -m benchmarks.bench_parallel`.
+"""
+import os
+import random
+import sys
+import time
+
+from core.parallel import evaluate_parallel
+
+
+def corpus(size: int = 20_000) -> list[str]:
+    """Generate small programs: declarations, time differences and arithmetic."""
+    generator = random.Random(0)
+    programs = []
+    for number in range(size):
+        start, end = sorted(generator.sample(range(6 * 60, 22 * 60), 2))
+        programs.append(
+            f'var shift = {end // 60}:{end % 60:02} - {start // 60}:{start % 60:02}\n'
+            f'{generator.randint(1, 12)} * {generator.randint(10, 60)} - {number} / 4\n'
+            'shift'
+        )
+    return programs
+
+
+def main(workers: tuple[int, ...] = (1, 2, 4, 8)) -> None:
+    """Print throughput and speedup for every number of worker processes and threads."""
+    programs = corpus()
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f'{len(programs):,} programs, {os.cpu_count()} CPUs, GIL {"on" if gil else "off"}')
+    for kind, threads in (('processes', False), ('threads', True)):
+        baseline = None
+        for count in workers:
+            start = time.perf_counter()
+            for _ in evaluate_parallel(programs, workers=count, threads=threads):
+                pass
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(
+                f'{count} {kind:>9}: {len(programs) / elapsed:10,.0f} programs/s, '
+                f'speedup {baseline / elapsed:4.2f}x'
+            )
+
+
+if __name__ == '__main__':
+    main()
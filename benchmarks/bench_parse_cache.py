@@ -0,0 +1,49 @@
+"""
+Benchmark of evaluating a working set of a few hundred expressions over and
+over, with and without the cache of parsed ASTs.
+
+Run with `python -m benchmarks.bench_parse_cache`.
+"""
+import random
+import time
+
+from core.cache import ParseCache
+from core.interpreter import Interpreter
+
+
+def working_set(size: int = 300) -> list[str]:
+    """Generate shift-length formulas and time differences."""
+    generator = random.Random(0)
+    expressions = []
+    for _ in range(size // 2):
+        start, end = sorted(generator.sample(range(6 * 60, 22 * 60), 2))
+        expressions.append(f'{end // 60}:{end % 60:02} - {start // 60}:{start % 60:02}')
+        expressions.append(
+            f'{generator.randint(1, 12)} * {generator.randint(10, 60)} - '
+            f'{generator.randint(0, 30)} / {generator.randint(1, 4)}'
+        )
+    return expressions
+
+
+def run(interpreter: Interpreter, expressions: list[str], rounds: int) -> float:
+    """Evaluate all expressions `rounds` times and return evaluations per second."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for code in expressions:
+            interpreter.evaluate(code)
+    return rounds * len(expressions) / (time.perf_counter() - start)
+
+
+def main(rounds: int = 50) -> None:
+    """Print throughput with and without caching."""
+    expressions = working_set()
+    cache = ParseCache(capacity=1024)
+    uncached = run(Interpreter(parse_cache=ParseCache(0)), expressions, rounds)
+    cached = run(Interpreter(parse_cache=cache), expressions, rounds)
+    print(f'without cache: {uncached:12,.0f} evaluations/s')
+    print(f'   with cache: {cached:12,.0f} evaluations/s ({cached / uncached:.1f}x)')
+    print(f'  cache stats: {cache.stats()}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""
+Benchmark of running a generated program of a hundred thousand lines without
+the on-disk cache of parsed programs, the first time with it, i.e. parsing and
+writing the cache, and the second time, i.e. loading the cache. Each run is
+a fresh process, so startup is included.
+
+Run with `python -m benchmarks.bench_program_cache [lines]`.
+"""
+import os
+import sys
+import tempfile
+
+from benchmarks.bench_script import generate, measure
+
+RUN = 'import sys; from collections import deque; from core.script import run_file; ' \
+    'deque(run_file(sys.argv[1], cache={cache}), maxlen=0)'
+# Only loads or parses the statements, without evaluating them.
+PREPARE = 'import sys; from core import program_cache; from core.interpreter import Interpreter; ' \
+    'from core.script import split_statements; interpreter = Interpreter(); ' \
+    'source = open(sys.argv[1], "rb").read(); ' \
+    'statements = program_cache.load(program_cache.cache_path(sys.argv[1], interpreter), ' \
+    'program_cache.program_key(source, interpreter)) if {cache} else ' \
+    '[interpreter.prepare(code) for _, code in ' \
+    'split_statements(source.decode().splitlines(keepends=True))]'
+
+
+def main(lines: int = 100_000) -> None:
+    """Generate a program and print time and peak memory of every kind of run."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'generated.u')
+        generate(path, lines)
+        print(f'{lines:,} lines, {os.path.getsize(path) / 2 ** 20:.1f} MiB')
+        for name, code in (
+            ('no cache', RUN.format(cache=False)),
+            ('first run', RUN.format(cache=True)),
+            ('second run', RUN.format(cache=True)),
+            ('parse only', PREPARE.format(cache=False)),
+            ('load only', PREPARE.format(cache=True)),
+        ):
+            elapsed, peak = measure(code, path)
+            print(f'{name:>10}: {elapsed:6.2f} s, peak memory {peak:7.1f} MiB')
+        for cached in os.listdir(os.path.join(directory, '__ucache__')):
+            size = os.path.getsize(os.path.join(directory, '__ucache__', cached))
+            print(f'{cached}: {size / 2 ** 20:.1f} MiB')
+
+
+if __name__ == '__main__':
+    main(*(int(argument) for argument in sys.argv[1:2]))
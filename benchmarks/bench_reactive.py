@@ -0,0 +1,49 @@
+"""
+Benchmark of redeclaring a variable in a reactive session, showing that the
+cost follows the number of variables depending on it, not the number of
+variables in the session.
+
+Run with `python -m benchmarks.bench_reactive`.
+"""
+import timeit
+
+from core.interpreter import Interpreter
+
+
+def session(unrelated: int, dependents: int) -> Interpreter:
+    """Declare `start`, a chain of variables depending on it and unrelated variables."""
+    interpreter = Interpreter(reactive=True)
+    interpreter.evaluate('var start = 8:00')
+    interpreter.evaluate('var link_0 = 17:30 - start')
+    for n in range(1, dependents):
+        interpreter.evaluate(f'var link_{n} = link_{n - 1} + link_0')
+    for n in range(unrelated):
+        interpreter.evaluate(f'var other_{n} = {n} * 8')
+    return interpreter
+
+
+def redeclaration(interpreter: Interpreter, repeat: int = 5) -> float:
+    """Time of redeclaring `start`, the best of `repeat` rounds."""
+    number = 200
+    codes = ['var start = 9:00', 'var start = 8:00'] * (number // 2)
+
+    def redeclare() -> None:
+        for code in codes:
+            interpreter.evaluate(code)
+    return min(timeit.repeat(redeclare, repeat=repeat, number=1)) / number
+
+
+def main() -> None:
+    """Print the time of a redeclaration for growing sessions and growing dependents."""
+    print('Growing session, 10 dependents:')
+    for unrelated in (1_000, 4_000, 16_000):
+        print(f'    {unrelated:>6} other variables: '
+              f'{redeclaration(session(unrelated, 10)) * 1e6:8.1f} µs')
+    print('Growing dependents, 1000 other variables:')
+    for dependents in (10, 100, 1_000):
+        print(f'    {dependents:>6} dependents: '
+              f'{redeclaration(session(1_000, dependents)) * 1e6:8.1f} µs')
+
+
+if __name__ == '__main__':
+    main()
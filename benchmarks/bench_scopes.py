@@ -0,0 +1,53 @@
+"""
+Benchmark of evaluating expressions full of variables, with the variables
+resolved to slots of the symbol table versus looked up by their names.
+
+Run with `python -m benchmarks.bench_scopes`.
+"""
+import timeit
+
+from core.compiler import compile_expression
+from core.interpreter import Interpreter
+from core.symbol_table_manager import SymbolTableManager, active_symbol_table
+
+EXPRESSIONS = [
+    'hours',
+    'rate * hours * days + bonus',
+    'rate * hours - rate / days + hours * hours - bonus + days ^ 2 - rate * 1.5',
+    'if hours * days > 38 then rate * hours * days * 1.25 + bonus',
+]
+
+
+def main(repeat: int = 5, number: int = 20_000) -> None:
+    """Print per-evaluation latency of both ways of reading variables, with both backends."""
+    global_scope = SymbolTableManager()
+    Interpreter(global_scope).evaluate('var rate = 21.5')
+    Interpreter(global_scope).evaluate('var hours = 8')
+    # Variables of the global scope are resolved one scope up.
+    interpreter = Interpreter(SymbolTableManager(global_scope))
+    interpreter.evaluate('var days = 5')
+    interpreter.evaluate('var bonus = 120')
+    active_symbol_table.set(interpreter.symbol_table)
+
+    for code in EXPRESSIONS:
+        # Parsed with no variables declared, so every name is looked up.
+        by_name = Interpreter().parse(code)
+        resolved = interpreter.parse(code)
+        assert by_name.eval() == resolved.eval()
+        print(code)
+        for backend, functions in (
+            ('tree', (by_name.eval, resolved.eval)),
+            ('compiled', (compile_expression(by_name), compile_expression(resolved))),
+        ):
+            by_name_time, slots_time = (
+                min(timeit.repeat(function, repeat=repeat, number=number)) / number
+                for function in functions
+            )
+            print(
+                f'    {backend:>8}: by name {by_name_time * 1e6:7.3f} µs, '
+                f'slots {slots_time * 1e6:7.3f} µs ({by_name_time / slots_time:4.2f}x)'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark of running a generated script of a million lines, streaming it
+statement by statement versus reading it whole first, with peak memory of each.
+
+Run with `python -m benchmarks.bench_script [lines]`.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+STREAMED = 'import sys; from core.script import run_file; ' \
+    'from collections import deque; deque(run_file(sys.argv[1]), maxlen=0)'
+READ_WHOLE = 'import sys; from core.script import run_script; ' \
+    'results = list(run_script(open(sys.argv[1], encoding="utf-8").read().splitlines()))'
+PEAK_MEMORY = '; import resource; print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)'
+
+
+def generate(path: str, lines: int) -> None:
+    """Write a script of time differences, arithmetic and some declarations."""
+    with open(path, 'w', encoding='utf-8') as file:
+        for number in range(lines):
+            if number % 1000 == 0:
+                file.write(f'var shift_{number} = {number % 24}:00 - 0:00\n')
+            elif number % 3 == 0:
+                file.write(f'{8 + number % 12}:{number % 60:02} - 7:{number % 30:02}\n')
+            elif number % 3 == 1:
+                file.write(f'{number % 97} * 8 - {number % 13} / 2; 2 ^ {number % 10}\n')
+            else:
+                file.write(f'if {number % 7} < 3 then "short shift"\n')
+
+
+def measure(code: str, path: str) -> tuple[float, float]:
+    """Run `code` in a fresh process and return its wall time and peak memory in MiB."""
+    start = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, '-c', code + PEAK_MEMORY, path],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    elapsed = time.perf_counter() - start
+    # Peak resident memory is reported in KiB on Linux.
+    return elapsed, int(process.stdout) / 1024
+
+
+def main(lines: int = 1_000_000) -> None:
+    """Generate a script and print time and peak memory of both ways of running it."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'generated.u')
+        generate(path, lines)
+        print(f'{lines:,} lines, {os.path.getsize(path) / 2 ** 20:.1f} MiB')
+        for name, code in (('streamed', STREAMED), ('read whole', READ_WHOLE)):
+            elapsed, peak = measure(code, path)
+            print(f'{name:>10}: {elapsed:6.2f} s, {lines / elapsed:9,.0f} lines/s, '
+                  f'peak memory {peak:7.1f} MiB')
+
+
+if __name__ == '__main__':
+    main(*(int(argument) for argument in sys.argv[1:]))
@@ -0,0 +1,63 @@
+"""
+Benchmark of saving and restoring a session of many variables: snapshots
+versus pickling the symbols, with the size of each file.
+
+Run with `python -m benchmarks.bench_snapshot [variables]`.
+"""
+import os
+import pickle
+import sys
+import tempfile
+import timeit
+from functools import partial
+
+from core.snapshot import load, save
+from core.symbol_table_manager import Symbol, SymbolTableManager, SymbolType
+from core.tokens.literal import Duration, Time
+
+
+def session(variables: int) -> SymbolTableManager:
+    """Supply a symbol table of times, durations, numbers, strings and booleans."""
+    values = [Time(570), Duration(95), 21.5, 'overtime', True]
+    symbol_table = SymbolTableManager()
+    symbol_table.declare_many(
+        Symbol(f'shift_{n}', SymbolType.VARIABLE, values[n % len(values)]) for n in range(variables)
+    )
+    return symbol_table
+
+
+def pickle_save(symbol_table: SymbolTableManager, path: str) -> None:
+    """Pickle the symbols, the obvious alternative to snapshots."""
+    with open(path, 'wb') as file:
+        pickle.dump(symbol_table.slots, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def pickle_load(path: str) -> SymbolTableManager:
+    """Unpickle symbols into a new symbol table."""
+    symbol_table = SymbolTableManager()
+    with open(path, 'rb') as file:
+        symbol_table.declare_many(pickle.load(file))
+    return symbol_table
+
+
+def main(variables: int = 100_000, repeat: int = 5) -> None:
+    """Print the best time of saving and restoring, and the file size, of each way."""
+    symbol_table = session(variables)
+    print(f'{variables:,} variables')
+    with tempfile.TemporaryDirectory() as directory:
+        for name, saver, loader in (
+            ('snapshot', save, load),
+            ('pickle', pickle_save, pickle_load),
+        ):
+            path = os.path.join(directory, name)
+            saving = min(timeit.repeat(partial(saver, symbol_table, path), repeat=repeat, number=1))
+            loading = min(timeit.repeat(partial(loader, path), repeat=repeat, number=1))
+            assert len(loader(path).slots) == variables
+            print(
+                f'{name:>10}: save {saving * 1e3:7.1f} ms, load {loading * 1e3:7.1f} ms, '
+                f'{os.path.getsize(path) / 2 ** 20:6.2f} MiB'
+            )
+
+
+if __name__ == '__main__':
+    main(*(int(argument) for argument in sys.argv[1:2]))
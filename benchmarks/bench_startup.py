@@ -0,0 +1,60 @@
+"""
+Benchmark of the cold start of µLang: a fresh process importing the interpreter
+and evaluating one expression, with the precomputed parse tables and with
+the tables constructed by `rply` at startup.
+
+Run with `python -m benchmarks.bench_startup`.
+"""
+import statistics
+import subprocess
+import sys
+import time
+
+PRECOMPUTED = "from main import evaluate; evaluate('9:30 - 8:00')"
+CONSTRUCTED = (
+    "import rply; from main import evaluate; from core.interpreter import Interpreter; "
+    "from core.parser import Parser; parser = Parser(); parser.parse(); "
+    "evaluate('9:30 - 8:00', Interpreter(parser=parser.get_parser(precomputed=False)))"
+)
+
+
+def cold_start(code: str) -> float:
+    """Run `code` in a fresh interpreter process and return the wall-clock time."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', code], check=True)
+    return time.perf_counter() - start
+
+
+def import_times(code: str, top: int = 8) -> list[tuple[int, str]]:
+    """Supply the modules with the highest cumulative import time, as with `-X importtime`."""
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    times = []
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, module = line.removeprefix('import time:').split('|')
+        times.append((int(cumulative), module.strip()))
+    return sorted(times, reverse=True)[:top]
+
+
+def main(runs: int = 40) -> None:
+    """Print cold start times of both variants and import times of the faster one."""
+    for name, code in (('precomputed tables', PRECOMPUTED), ('rply at startup', CONSTRUCTED)):
+        times = [cold_start(code) for _ in range(runs)]
+        print(
+            f'{name:>20}: min {min(times) * 1e3:7.2f} ms, '
+            f'median {statistics.median(times) * 1e3:7.2f} ms'
+        )
+
+    print('\nSlowest imports with precomputed tables (cumulative µs):')
+    for cumulative, module in import_times(PRECOMPUTED):
+        print(f'{cumulative:>10}  {module}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark of aggregating a generated timesheet of ten million rows, streamed
+through a compiled expression versus read whole and evaluated row by row as
+code, with throughput and peak memory of each.
+
+Run with `python -m benchmarks.bench_timesheet [rows [baseline_rows]]`.
+"""
+import os
+import sys
+import tempfile
+
+from benchmarks.bench_script import measure
+
+STREAMED = 'import sys; from core.timesheet import Timesheet, summarize; ' \
+    'summarize(sys.argv[1], Timesheet(group_by="employee"))'
+READ_WHOLE = 'import csv, sys; from core.interpreter import Interpreter; ' \
+    'from core.timesheet import Aggregate; interpreter, total = Interpreter(), Aggregate(); ' \
+    'rows = list(csv.DictReader(open(sys.argv[1], encoding="utf-8"))); ' \
+    '[total.add(interpreter.evaluate(f"{row[\'end\']} - {row[\'start\']}")) for row in rows]'
+EMPLOYEES = 500
+
+
+def generate(path: str, rows: int) -> None:
+    """Write shifts of employees, starting between 6:00 and 10:59 and lasting 4 to 10 hours."""
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write('employee,date,start,end\n')
+        for number in range(rows):
+            start = 360 + number * 37 % 300
+            end = start + 240 + number * 53 % 361
+            file.write(
+                f'employee_{number % EMPLOYEES},2024-{1 + number // 28 % 12:02}-'
+                f'{1 + number % 28:02},{start // 60}:{start % 60:02},{end // 60}:{end % 60:02}\n'
+            )
+
+
+def main(rows: int = 10_000_000, baseline_rows: int = 1_000_000) -> None:
+    """
+    Generate a timesheet and print time and peak memory of streaming it, and
+    of reading whole a prefix of `baseline_rows` rows.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'shifts.csv')
+        generate(path, rows)
+        print(f'{rows:,} rows, {os.path.getsize(path) / 2 ** 20:.1f} MiB')
+        elapsed, peak = measure(STREAMED, path)
+        print(f'{"streamed":>10}: {elapsed:6.2f} s, {rows / elapsed:9,.0f} rows/s, '
+              f'peak memory {peak:7.1f} MiB')
+        baseline_rows = min(rows, baseline_rows)
+        prefix = os.path.join(directory, 'prefix.csv')
+        generate(prefix, baseline_rows)
+        elapsed, peak = measure(READ_WHOLE, prefix)
+        print(f'{"read whole":>10}: {elapsed:6.2f} s, {baseline_rows / elapsed:9,.0f} rows/s, '
+              f'peak memory {peak:7.1f} MiB ({baseline_rows:,} rows)')
+
+
+if __name__ == '__main__':
+    main(*(int(argument) for argument in sys.argv[1:3]))
@@ -0,0 +1,54 @@
+"""
+Benchmark of applying one formula to every row of a table of a million rows,
+vectorized over NumPy columns and with an `evaluate()` call per row.
+
+Run with `python -m benchmarks.bench_vectorize [rows]`.
+"""
+import sys
+import time
+
+import numpy
+
+from core.interpreter import Interpreter
+from core.symbol_table_manager import Symbol, SymbolTableManager, SymbolType
+
+FORMULAS = ('rate * hours - 10', 'if hours > 8 then rate * 1.5 ^ 2 * hours')
+
+
+def per_row(code: str, rate: list[float], hours: list[float]) -> list:
+    """Evaluate the formula with a symbol table of its own for every row."""
+    results = []
+    for row_rate, row_hours in zip(rate, hours):
+        symbol_table = SymbolTableManager()
+        symbol_table['rate'] = Symbol('rate', SymbolType.VARIABLE, row_rate)
+        symbol_table['hours'] = Symbol('hours', SymbolType.VARIABLE, row_hours)
+        results.append(Interpreter(symbol_table).evaluate(code))
+    return results
+
+
+def main(rows: int = 1_000_000) -> None:
+    """Print rows per second of both ways for every formula."""
+    generator = numpy.random.default_rng(0)
+    rate = generator.uniform(10, 40, rows)
+    hours = generator.integers(0, 12, rows).astype(float)
+    print(f'{rows:,} rows')
+    for code in FORMULAS:
+        start = time.perf_counter()
+        vectorized = Interpreter().vectorize(code)({'rate': rate, 'hours': hours})
+        vectorized_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        looped = per_row(code, rate.tolist(), hours.tolist())
+        looped_time = time.perf_counter() - start
+
+        assert vectorized.tolist() == looped
+        print(
+            f'{code}\n'
+            f'  vectorized: {rows / vectorized_time:14,.0f} rows/s\n'
+            f'     per row: {rows / looped_time:14,.0f} rows/s '
+            f'({looped_time / vectorized_time:.0f}x slower)'
+        )
+
+
+if __name__ == '__main__':
+    main(*(int(argument) for argument in sys.argv[1:]))
@@ -0,0 +1,95 @@
+"""
+Load test of the µLang server: many concurrent sessions, each sending requests
+one after another, reporting requests per second and tail latency.
+
+Run with `python -m benchmarks.load_server [--sessions N] [--requests N]`.
+A server is started in a subprocess unless `--connect HOST:PORT` is given.
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+# A session declares its own variables and then evaluates code using them.
+SESSION = [
+    'var start = 8:{minute:02}',
+    'var end = 17:30',
+    'var rate = {minute} + 20',
+    'end - start',
+    'rate * 8 - {minute} / 2.5 ^ 2',
+    'if rate > 30 then "senior"',
+    '17:00 - 8:00 + 12:30 - 12:00',
+]
+
+
+async def session(host: str, port: int, number: int, requests: int, latencies: list[float]) -> int:
+    """Send requests of one session, recording latencies. Return the number of errors."""
+    reader, writer = await asyncio.open_connection(host, port)
+    errors = 0
+    try:
+        for n in range(requests):
+            code = SESSION[n % len(SESSION)].format(minute=number % 60)
+            start = time.perf_counter()
+            writer.write(code.encode() + b'\n')
+            line = await reader.readline()
+            latencies.append(time.perf_counter() - start)
+            # Redeclarations are warnings, anything else is unexpected.
+            errors += json.loads(line)['status'] not in ('ok', 'warning')
+    finally:
+        writer.close()
+        await writer.wait_closed()
+    return errors
+
+
+async def load(host: str, port: int, sessions: int, requests: int) -> None:
+    """Run concurrent sessions and print throughput and latency percentiles."""
+    latencies: list[float] = []
+    start = time.perf_counter()
+    errors = sum(await asyncio.gather(*(
+        session(host, port, number, requests, latencies) for number in range(sessions)
+    )))
+    elapsed = time.perf_counter() - start
+    percentiles = statistics.quantiles(latencies, n=1000)
+    print(
+        f'{sessions} sessions, {len(latencies)} requests, {errors} errors\n'
+        f'  throughput: {len(latencies) / elapsed:10,.0f} requests/s\n'
+        f'     latency: p50 {percentiles[499] * 1e3:.2f} ms, '
+        f'p99 {percentiles[989] * 1e3:.2f} ms, '
+        f'p99.9 {percentiles[998] * 1e3:.2f} ms, '
+        f'max {max(latencies) * 1e3:.2f} ms'
+    )
+
+
+def main() -> None:
+    """Start a server if needed and load it."""
+    argument_parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    argument_parser.add_argument('--sessions', type=int, default=100)
+    argument_parser.add_argument('--requests', type=int, default=200, help='per session')
+    argument_parser.add_argument('--connect', metavar='HOST:PORT')
+    options = argument_parser.parse_args()
+
+    server = None
+    address = options.connect
+    if address is None:
+        server = subprocess.Popen( # pylint: disable=consider-using-with
+            [sys.executable, '-m', 'core.server', '--port', '0'],
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        assert server.stdout is not None
+        # µLang server listening on HOST:PORT.
+        address = server.stdout.readline().split()[-1].rstrip('.')
+    host, port = address.rsplit(':', maxsplit=1)
+    try:
+        asyncio.run(load(host, int(port), options.sessions, options.requests))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == '__main__':
+    main()
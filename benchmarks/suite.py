@@ -0,0 +1,226 @@
+"""
+Suite of benchmarks of every phase of µLang, with stored baselines to catch
+performance regressions. Every metric is the time of one operation, e.g. of
+lexing one token, in the best of several repeats, so the lower the better.
+
+Run with `python -m benchmarks.suite` to print the metrics next to the
+baselines, `python -m benchmarks.suite --check` to fail if any metric is slower
+than its baseline by more than the threshold, and `python -m benchmarks.suite
+--update` to store the current metrics as the baselines. Baselines are only
+comparable on the machine they were measured on.
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+
+from core.cache import ParseCache
+from core.interpreter import Interpreter
+from core.lexer import Lexer
+from core.parser import Parser
+
+BASELINES_PATH = Path(__file__).with_name('baselines.json')
+DEFAULT_THRESHOLD = 0.25
+CONFIRMATIONS = 2
+
+SOURCE = '\n'.join(
+    f'var shift_{n} = {8 + n % 12}:{n % 60:02} - 7:30\n'
+    f'if {n % 12} > 8 then "overtime on day {n}"\n'
+    f'{n % 60} * 60 + {n} / 2.5 ^ 2 - -{n}.5e1'
+    for n in range(2000)
+)
+PROGRAMS = SOURCE.splitlines()
+
+
+def measure(function: Callable[[], object], repeat: int = 7) -> float:
+    """
+    Supply the time of one call of `function`, the best of `repeat` rounds.
+    Like `timeit`, every round lasts at least 0.2 seconds and runs with
+    the garbage collector disabled.
+    """
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def lexing() -> float:
+    """Time of lexing one token."""
+    lexer = Lexer().get_lexer()
+    count = sum(1 for _ in lexer.lex(SOURCE))
+    return measure(lambda: sum(1 for _ in lexer.lex(SOURCE))) / count
+
+
+def parsing() -> float:
+    """Time of parsing one line of code from its tokens."""
+    parser_generator = Parser()
+    parser_generator.parse()
+    parser = parser_generator.get_parser()
+    lexer = Lexer().get_lexer()
+    tokens = [list(lexer.lex(program)) for program in PROGRAMS]
+
+    def parse_all() -> None:
+        for program in tokens:
+            parser.parse(iter(program))
+    return measure(parse_all) / len(tokens)
+
+
+def deep_arithmetic() -> float:
+    """Time of evaluating an arithmetic tree of 400 operators."""
+    interpreter = Interpreter(optimize=False)
+    operators = ['+', '*', '-', '/']
+    code = '1' + ''.join(f' {operators[n % 4]} {n % 7 + 1}' for n in range(400))
+    tree = interpreter.parse(code)
+    return measure(lambda: interpreter.execute(tree))
+
+
+def time_arithmetic() -> float:
+    """Time of evaluating a chain of time and duration arithmetic."""
+    interpreter = Interpreter(optimize=False)
+    tree = interpreter.parse('17:00 - 8:00 + 12:30 - 12:00 + 13:00 - 12:45')
+    return measure(lambda: interpreter.execute(tree))
+
+
+def variable_arithmetic() -> float:
+    """Time of evaluating an arithmetic tree of 12 variables."""
+    interpreter = Interpreter(optimize=False)
+    for name, value in (('rate', 21.5), ('hours', 8), ('days', 5)):
+        interpreter.evaluate(f'var {name} = {value}')
+    tree = interpreter.parse(
+        'rate * hours - rate / days + hours * hours - days ^ 2 + rate * days * hours - rate'
+    )
+    return measure(lambda: interpreter.execute(tree))
+
+
+def declarations() -> float:
+    """Time of lexing, parsing and evaluating one variable declaration."""
+    codes = [f'var hours_{n} = {n} * 8 - 0.5' for n in range(1000)]
+
+    def declare_all() -> None:
+        interpreter = Interpreter(parse_cache=ParseCache(0))
+        for code in codes:
+            interpreter.evaluate(code)
+    return measure(declare_all) / len(codes)
+
+
+def grammar_build() -> float:
+    """Time of building the lexer and the grammar and loading the parse tables."""
+    def build() -> None:
+        Lexer().get_lexer()
+        parser_generator = Parser()
+        parser_generator.parse()
+        parser_generator.get_parser()
+    return measure(build)
+
+
+def cold_start() -> float:
+    """Time of starting a process, which imports µLang and evaluates an expression."""
+    code = "from main import evaluate; evaluate('9:30 - 8:00')"
+    return measure(lambda: subprocess.run([sys.executable, '-c', code], check=True))
+
+
+METRICS: dict[str, Callable[[], float]] = {
+    'lexing per token': lexing,
+    'parsing per line': parsing,
+    'deep arithmetic evaluation': deep_arithmetic,
+    'time arithmetic evaluation': time_arithmetic,
+    'variable arithmetic evaluation': variable_arithmetic,
+    'variable declaration': declarations,
+    'grammar build': grammar_build,
+    'cold start': cold_start,
+}
+
+
+def machine() -> dict[str, str]:
+    """Describe the machine and interpreter metrics are measured on."""
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'processor': platform.machine(),
+    }
+
+
+def regressions(
+    metrics: dict[str, float],
+    baselines: dict[str, float],
+    threshold: float,
+) -> list[str]:
+    """
+    Find metrics slower than their baselines by more than the threshold.
+
+    Parameters
+    ----------
+    metrics : dict[str, float]
+        Current metrics.
+    baselines : dict[str, float]
+        Stored metrics. Metrics without a baseline are not compared.
+    threshold : float
+        Allowed slowdown, e.g. 0.25 for 25%.
+
+    Returns
+    -------
+    list[str]
+        Names of regressed metrics.
+    """
+    return [
+        name for name, value in metrics.items()
+        if name in baselines and value > baselines[name] * (1 + threshold)
+    ]
+
+
+def main(arguments: list[str] | None = None) -> int:
+    """Run the suite, print the metrics and compare or store them. Return the exit status."""
+    argument_parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    mode = argument_parser.add_mutually_exclusive_group()
+    mode.add_argument('--check', action='store_true', help='fail on regressions')
+    mode.add_argument('--update', action='store_true', help='store metrics as baselines')
+    argument_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    argument_parser.add_argument('--only', nargs='+', choices=METRICS, metavar='METRIC')
+    options = argument_parser.parse_args(arguments)
+
+    stored = {}
+    if BASELINES_PATH.exists():
+        stored = json.loads(BASELINES_PATH.read_text(encoding='utf-8'))
+    baselines = stored.get('metrics', {})
+    if stored and stored.get('machine') != machine():
+        print('Baselines were measured on another machine, comparisons may be off.')
+
+    metrics = {}
+    for name in options.only or METRICS:
+        # Baselines are the best of as many runs as confirm a regression.
+        runs = 1 + CONFIRMATIONS if options.update else 1
+        metrics[name] = min(METRICS[name]() for _ in range(runs))
+        line = f'{name:>30}: {metrics[name] * 1e6:12.2f} µs'
+        if name in baselines:
+            line += f' (baseline {baselines[name] * 1e6:12.2f} µs, ' \
+                f'{metrics[name] / baselines[name] - 1:+7.1%})'
+        print(line)
+
+    if options.update:
+        BASELINES_PATH.write_text(json.dumps(
+            {'machine': machine(), 'metrics': baselines | metrics}, indent=4
+        ) + '\n', encoding='utf-8')
+        print(f'Baselines stored in {BASELINES_PATH}.')
+    elif options.check:
+        regressed = regressions(metrics, baselines, options.threshold)
+        # A noisy neighbour slows a single run down; a regression persists.
+        for _ in range(CONFIRMATIONS):
+            if not regressed:
+                break
+            print(f'Measuring again: {", ".join(regressed)}.')
+            for name in regressed:
+                metrics[name] = min(metrics[name], METRICS[name]())
+            regressed = regressions(metrics, baselines, options.threshold)
+        if regressed:
+            print(f'Regressed by more than {options.threshold:.0%}: {", ".join(regressed)}.')
+            return 1
+        print(f'No metric regressed by more than {options.threshold:.0%}.')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
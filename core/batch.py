@@ -0,0 +1,148 @@
+"""
+Module evaluating many µLang expressions in a batch with one interpreter.
+Errors of single expressions are reported as results instead of stopping
+the batch. Warnings are errors too, unless the interpreter collects them
+(see `core.diagnostics`), in which case they are attached to results.
+"""
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+from core.diagnostics import Diagnostic
+from core.interpreter import Backend, Interpreter
+from core.lexer import LexingError
+
+
+class Status(Enum):
+    """Outcomes of evaluating an expression."""
+    OK = 'ok'
+    """Evaluated successfully."""
+    LEXING_ERROR = 'lexing error'
+    """Contains a character sequence that is not a token."""
+    OVERFLOW = 'overflow'
+    """A number grew out of range."""
+    WARNING = 'warning'
+    """Probably a mistake, e.g. subtracting a later time from an earlier one."""
+    ERROR = 'error'
+    """Any other error, e.g. a syntax error or division by zero."""
+    TIMEOUT = 'timeout'
+    """Took too long to evaluate, reported by the server."""
+
+
+@dataclass(frozen=True, slots=True)
+class Result:
+    """Result of evaluating one expression of a batch."""
+    index: int
+    """Position of the expression in the batch."""
+    source: str
+    """The evaluated expression."""
+    status: Status
+    value: Any = None
+    """Result of the evaluation, `None` unless the status is `Status.OK`."""
+    error: Exception | None = None
+    """Error raised by the evaluation, if any."""
+    diagnostics: tuple[Diagnostic, ...] = ()
+    """
+    Warnings, and the error, reported by the evaluation, if the interpreter
+    collects diagnostics.
+    """
+
+    @property
+    def ok(self) -> bool:
+        """Whether the expression was evaluated successfully."""
+        return self.status is Status.OK
+
+    @property
+    def message(self) -> str:
+        """Human-readable description of the error, empty if there is none."""
+        return describe(self.error) if self.error is not None else ''
+
+
+def classify(error: Exception) -> Status:
+    """
+    Tell the kind of an error raised by μLang code.
+
+    Parameters
+    ----------
+    error : Exception
+        The raised error.
+
+    Returns
+    -------
+    Status
+        Outcome of the evaluation which raised it.
+    """
+    if isinstance(error, LexingError):
+        return Status.LEXING_ERROR
+    if isinstance(error, OverflowError):
+        return Status.OVERFLOW
+    if isinstance(error, UserWarning):
+        return Status.WARNING
+    return Status.ERROR
+
+
+def describe(error: Exception) -> str:
+    """
+    Describe an error raised by μLang code in the way REPL reports it.
+
+    Parameters
+    ----------
+    error : Exception
+        The raised error.
+
+    Returns
+    -------
+    str
+        Message of the error.
+    """
+    if isinstance(error, LexingError):
+        position = error.source_pos
+        return f'Unrecognised thing at line {position.lineno}, column {position.colno}'
+    if isinstance(error, OverflowError) and len(error.args) > 1:
+        return str(error.args[1])
+    return str(error)
+
+
+def evaluate_many(
+    sources: Iterable[str],
+    interpreter: Interpreter | None = None,
+    backend: Backend | None = None,
+) -> Iterator[Result]:
+    """
+    Evaluate μLang expressions one by one, sharing one interpreter.
+
+    Parameters
+    ----------
+    sources : Iterable[str]
+        μLang expressions, read lazily.
+    interpreter : Interpreter | None
+        Interpreter holding the symbol table shared by the expressions.
+        A fresh one is used if not given.
+    backend : Backend | None
+        Way of evaluating the expressions. Defaults to the interpreter's
+        backend.
+
+    Returns
+    -------
+    Iterator[Result]
+        Result of every expression, in order, as soon as it is evaluated.
+    """
+    if interpreter is None:
+        interpreter = Interpreter()
+    parse, execute = interpreter.parse, interpreter.execute
+    diagnostics = interpreter.diagnostics
+    for index, source in enumerate(sources):
+        try:
+            value = execute(parse(source), backend)
+        except Exception as e: # pylint: disable=broad-exception-caught # noqa: BLE001
+            if diagnostics is None:
+                yield Result(index, source, classify(e), error=e)
+                continue
+            diagnostics.error(e)
+            reported = tuple(diagnostics.drain())
+            yield Result(index, source, classify(e), error=e, diagnostics=reported)
+        else:
+            reported = tuple(diagnostics.drain()) if diagnostics is not None else ()
+            yield Result(index, source, Status.OK, value, diagnostics=reported)
@@ -0,0 +1,242 @@
+"""
+Module with bounded least-recently-used (LRU) caches: of parsed ASTs, so code
+evaluated many times is lexed and parsed only once, and of results of
+functions, so a function called with the same arguments computes once.
+
+Both caches may be shared by threads without locks: every change of entries is
+a single operation of the `OrderedDict`, which is atomic, and an entry removed
+by another thread in between is treated as missing. Counters are not
+synchronized, so on free-threaded builds of Python they may miss a few
+concurrent calls.
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+SHAPES_PER_CODE = 8
+"""Maximal number of shapes of symbol tables the parse cache keeps ASTs of for one code."""
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of counters of a cache."""
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    size: int
+    capacity: int
+
+
+def _evict(entries: OrderedDict, capacity: int, key: Hashable) -> int:
+    """
+    Mark an entry as the most recently used one and evict the least recently
+    used entries beyond the capacity, tolerating entries removed by other
+    threads meanwhile. Return the number of evicted entries.
+    """
+    try:
+        entries.move_to_end(key)
+    except KeyError:
+        pass
+    evicted = 0
+    while len(entries) > capacity:
+        try:
+            entries.popitem(last=False)
+        except KeyError:
+            break
+        evicted += 1
+    return evicted
+
+
+class ParseCache:
+    """
+    Bounded LRU cache mapping source code to its AST.
+
+    An AST is valid only for the shape of the symbol table it was parsed with
+    (see `SymbolTableManager.shape`), so every code keeps ASTs of up to
+    `SHAPES_PER_CODE` shapes, the most recently cached first. Interpreters
+    sharing the cache with different variables, e.g. sessions of a server,
+    thus find ASTs of their own shapes rather than replacing each other's.
+    A lookup of code cached only for other shapes, e.g. after a new variable
+    was declared, counts as an invalidation.
+
+    Parameters
+    ----------
+    capacity : int
+        Maximal number of codes kept. Zero disables caching.
+    """
+    def __init__(self, capacity: int = 1024) -> None:
+        if capacity < 0:
+            raise ValueError(f"Capacity of a cache cannot be negative. Received {capacity}.")
+        self.capacity = capacity
+        # Entries are replaced rather than changed, so threads see them whole.
+        self._entries: OrderedDict[Hashable, tuple[tuple[Hashable, Any], ...]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable, shape: Hashable) -> Any | None:
+        """
+        Supply the AST cached under `key` for a shape, marking it as recently used.
+
+        Parameters
+        ----------
+        key : Hashable
+            Source code, possibly combined with parsing options.
+        shape : Hashable
+            Current shape of the symbol table.
+
+        Returns
+        -------
+        Any | None
+            The cached AST or `None` if there is none for the shape.
+        """
+        variants = self._entries.get(key)
+        if variants is None:
+            self.misses += 1
+            return None
+
+        for entry_shape, tree in variants:
+            if entry_shape is shape or entry_shape == shape:
+                break
+        else:
+            self.invalidations += 1
+            self.misses += 1
+            return None
+
+        try:
+            self._entries.move_to_end(key)
+        except KeyError:
+            pass # Evicted by another thread meanwhile, the AST is valid still.
+        self.hits += 1
+        return tree
+
+    def put(self, key: Hashable, shape: Hashable, tree: Any) -> None:
+        """
+        Cache an AST, evicting the least recently used code if the cache is
+        full, or the least recently cached shape of the code if it has too
+        many.
+
+        Parameters
+        ----------
+        key : Hashable
+            Source code, possibly combined with parsing options.
+        shape : Hashable
+            Shape of the symbol table the AST was parsed with.
+        tree : Any
+            The AST. It must not be modified afterwards, as it is shared.
+        """
+        if self.capacity == 0:
+            return
+        others = [
+            variant for variant in self._entries.get(key, ())
+            if variant[0] is not shape and variant[0] != shape
+        ]
+        kept = others[:SHAPES_PER_CODE - 1]
+        self._entries[key] = ((shape, tree), *kept)
+        self.evictions += len(others) - len(kept)
+        self.evictions += _evict(self._entries, self.capacity, key)
+
+    def clear(self) -> None:
+        """Remove all entries, keeping the counters."""
+        self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        """
+        Supply counters of the cache.
+
+        Returns
+        -------
+        CacheStats
+            Hits, misses, evictions, invalidations, size and capacity.
+        """
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            invalidations=self.invalidations,
+            size=len(self._entries),
+            capacity=self.capacity,
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class MemoCache:
+    """
+    Bounded LRU cache of results of a pure function, keyed on its arguments.
+
+    Parameters
+    ----------
+    capacity : int
+        Maximal number of results kept. Zero disables caching.
+    """
+    def __init__(self, capacity: int = 128) -> None:
+        if capacity < 0:
+            raise ValueError(f"Capacity of a cache cannot be negative. Received {capacity}.")
+        self.capacity = capacity
+        self._entries: OrderedDict[tuple, Any] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def call(self, function: Callable[..., Any], arguments: tuple) -> Any:
+        """
+        Supply the result of `function(*arguments)`, computing it only if it is
+        not cached. Errors are raised and not cached.
+
+        Parameters
+        ----------
+        function : Callable[..., Any]
+            The pure function.
+        arguments : tuple
+            Hashable arguments.
+
+        Returns
+        -------
+        Any
+            Result of the function.
+        """
+        try:
+            result = self._entries[arguments]
+        except KeyError:
+            self.misses += 1
+        else:
+            try:
+                self._entries.move_to_end(arguments)
+            except KeyError:
+                pass # Evicted by another thread meanwhile.
+            self.hits += 1
+            return result
+
+        result = function(*arguments)
+        if self.capacity:
+            self._entries[arguments] = result
+            self.evictions += _evict(self._entries, self.capacity, arguments)
+        return result
+
+    def stats(self) -> CacheStats:
+        """
+        Supply counters of the cache.
+
+        Returns
+        -------
+        CacheStats
+            Hits, misses, evictions, size and capacity. Results are never
+            invalidated.
+        """
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            invalidations=0,
+            size=len(self._entries),
+            capacity=self.capacity,
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
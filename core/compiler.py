@@ -0,0 +1,160 @@
+"""
+Module compiling µLang expressions into Python code objects, so evaluating
+the same expression repeatedly runs at the speed of native Python instead of
+walking the AST.
+"""
+
+import math
+from collections.abc import Callable
+from typing import Any
+
+from core.symbol_table_manager import active_symbol_table, lookup
+from core.tokens.arthmetic import (
+    Addition,
+    Division,
+    Exponentiation,
+    Multiplication,
+    Subtraction,
+    power,
+)
+from core.tokens.literal import Duration, Number, String, Time
+from core.tokens.logic import (
+    EqualTo,
+    GreaterOrEqualTo,
+    GreaterThan,
+    IfStatement,
+    LessOrEqualTo,
+    LessThan,
+)
+from core.tokens.statement import FunctionCall, SlotInvocation, SymbolInvocation, call
+
+# Python operators and their precedence. Only the precedence needed to decide
+# where to put parentheses is encoded, the higher the tighter an operator binds.
+_CONDITIONAL = 0
+_COMPARISON = 1
+_UNARY = 4
+_ATOM = 6
+_OPERATORS: dict[type, tuple[str, int]] = {
+    EqualTo: ('==', _COMPARISON),
+    LessThan: ('<', _COMPARISON),
+    LessOrEqualTo: ('<=', _COMPARISON),
+    GreaterOrEqualTo: ('>=', _COMPARISON),
+    GreaterThan: ('>', _COMPARISON),
+    Addition: ('+', 2),
+    Subtraction: ('-', 2),
+    Multiplication: ('*', 3),
+    Division: ('/', 3),
+}
+
+
+def _nonzero(divisor: Any) -> Any:
+    if divisor == 0:
+        raise ZeroDivisionError("You cannot divide by 0.")
+    return divisor
+
+
+class _Compiler:
+    """
+    Translator of an AST into the source of a Python expression. Variables
+    resolved to slots are read from the slots, unless `slots` is false.
+    """
+    def __init__(self, slots: bool = True) -> None:
+        self.slots = slots
+        self.namespace: dict[str, Any] = {
+            '_nonzero': _nonzero,
+            '_lookup': lookup,
+            '_active': active_symbol_table.get,
+            '_call': call,
+            '_power': power,
+        }
+
+    def constant(self, value: Any) -> tuple[str, int]:
+        """Bind a value to a name in the namespace of the compiled code."""
+        name = f'_c{len(self.namespace)}'
+        self.namespace[name] = value
+        return name, _ATOM
+
+    def emit(self, node: Any) -> tuple[str, int]: # pylint: disable=too-many-return-statements
+        """
+        Translate a node into Python source.
+
+        Returns
+        -------
+        tuple[str, int]
+            Source of the expression and precedence of its outermost operator.
+        """
+        node_type = type(node)
+        if node_type is Exponentiation:
+            # Powers are bounded, see `power()`.
+            return f'_power({self.emit(node.left)[0]}, {self.emit(node.right)[0]})', _ATOM
+
+        if node_type in _OPERATORS:
+            symbol, precedence = _OPERATORS[node_type]
+            # µLang operators are left-associative.
+            left = self.operand(node.left, precedence, parenthesize_equal=False)
+            right = self.operand(node.right, precedence, parenthesize_equal=True)
+            if node_type is Division:
+                right = f'_nonzero({right})'
+            return f'{left} {symbol} {right}', precedence
+
+        if node_type is Number:
+            value = node.eval()
+            if isinstance(value, int) or (isinstance(value, float) and math.isfinite(value)):
+                return repr(value), _UNARY if value < 0 else _ATOM
+            return self.constant(value)
+
+        if node_type is SlotInvocation and self.slots:
+            scope = '_active()' + '.parent' * node.depth
+            return f'{scope}.slots[{node.index}].value', _ATOM
+
+        if node_type in (SlotInvocation, SymbolInvocation):
+            return f'_lookup({node.name!r})', _ATOM
+
+        if node_type is FunctionCall:
+            arguments = ''.join(f', {self.emit(argument)[0]}' for argument in node.arguments)
+            return f'_call({node.name!r}{arguments})', _ATOM
+
+        if node_type is IfStatement:
+            instructions = self.operand(node.instructions, _CONDITIONAL, parenthesize_equal=True)
+            condition = self.operand(node.condition, _CONDITIONAL, parenthesize_equal=True)
+            alternative = 'None'
+            if node.alternative is not None:
+                alternative = self.operand(node.alternative, _CONDITIONAL, parenthesize_equal=True)
+            return f'{instructions} if {condition} else {alternative}', _CONDITIONAL
+
+        # Literals are evaluated once, unknown nodes keep being walked.
+        if node_type in (Duration, String, Time):
+            return self.constant(node.eval())
+        return f'{self.constant(node)[0]}.eval()', _ATOM
+
+    def operand(self, node: Any, precedence: int, parenthesize_equal: bool) -> str:
+        """Translate an operand, parenthesizing it if its operator binds looser."""
+        source, operand_precedence = self.emit(node)
+        if operand_precedence < precedence or (
+            parenthesize_equal and operand_precedence == precedence
+        ):
+            return f'({source})'
+        return source
+
+
+def compile_expression(tree: Any, slots: bool = True) -> Callable[[], Any]:
+    """
+    Compile an expression into a Python function evaluating it.
+
+    Parameters
+    ----------
+    tree : Any
+        Root of the AST of an expression.
+    slots : bool
+        Whether to read variables resolved to slots from the slots of the
+        active symbol table rather than to look them up by name.
+
+    Returns
+    -------
+    Callable[[], Any]
+        Function returning the same value as `tree.eval()`.
+    """
+    compiler = _Compiler(slots)
+    source, _ = compiler.emit(tree)
+    code = compile(f'lambda: {source}', '<µLang>', 'eval')
+    return eval(code, compiler.namespace) # pylint: disable=eval-used
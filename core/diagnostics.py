@@ -0,0 +1,147 @@
+"""
+Module collecting diagnostics, i.e. warnings and errors with their positions in
+source code, reported while µLang code is evaluated.
+
+A warning is a probable mistake, e.g. redeclaring a variable or subtracting
+a later time from an earlier one, after which evaluation may go on. Warnings
+are reported with `warn()`, which raises them as `UserWarning` unless
+diagnostics are collected (see `Diagnostics`), so evaluation is not aborted
+and no exception is unwound for them.
+"""
+
+from collections.abc import Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import Enum
+
+
+class Severity(Enum):
+    """Severities of diagnostics."""
+    WARNING = 'warning'
+    """Probably a mistake, evaluation went on nonetheless."""
+    ERROR = 'error'
+    """Evaluation failed."""
+
+
+@dataclass(frozen=True, slots=True)
+class Diagnostic:
+    """Warning or error reported while evaluating code."""
+    severity: Severity
+    message: str
+    line: int | None = None
+    """Line of the source code, if known."""
+    column: int | None = None
+    """Column of the line, if known."""
+
+    @classmethod
+    def from_error(cls, error: Exception, line: int | None = None) -> 'Diagnostic':
+        """
+        Describe an error, at the position of the token or character it was
+        raised for, e.g. by the lexer or the parser.
+
+        Parameters
+        ----------
+        error : Exception
+            The raised error.
+        line : int | None
+            Line the evaluated statement starts at. Lines of the position are
+            counted from it.
+
+        Returns
+        -------
+        Diagnostic
+            Diagnostic of the error.
+        """
+        position = getattr(error, 'source_pos', None)
+        if position is None:
+            return cls(Severity.ERROR, str(error), line)
+        if line is not None:
+            return cls(Severity.ERROR, str(error), line + position.lineno - 1, position.colno)
+        return cls(Severity.ERROR, str(error), position.lineno, position.colno)
+
+    def __str__(self) -> str:
+        if self.line is None:
+            return f'{self.severity.value}: {self.message}'
+        if self.column is None:
+            return f'{self.severity.value} at line {self.line}: {self.message}'
+        return f'{self.severity.value} at line {self.line}, column {self.column}: {self.message}'
+
+
+class Diagnostics:
+    """
+    Diagnostics of evaluations, e.g. of a script or a batch, in order of
+    reporting.
+
+    Parameters
+    ----------
+    strict : bool
+        Whether warnings are raised as `UserWarning` instead of being
+        collected, as without diagnostics.
+    """
+    def __init__(self, strict: bool = False) -> None:
+        self.strict = strict
+        self.line: int | None = None
+        """Line the evaluated statement starts at, set by whoever evaluates it."""
+        self.items: list[Diagnostic] = []
+
+    def warn(self, message: str) -> None:
+        """
+        Report a warning at the line of the evaluated statement.
+
+        Raises
+        ------
+        UserWarning
+            Raised if diagnostics are strict.
+        """
+        if self.strict:
+            raise UserWarning(message)
+        self.items.append(Diagnostic(Severity.WARNING, message, self.line))
+
+    def error(self, error: Exception) -> None:
+        """Report an error which stopped the evaluation of a statement."""
+        self.items.append(Diagnostic.from_error(error, self.line))
+
+    def drain(self) -> list[Diagnostic]:
+        """Supply the diagnostics reported so far and forget them."""
+        items, self.items = self.items, []
+        return items
+
+    @property
+    def warnings(self) -> list[Diagnostic]:
+        """Reported warnings."""
+        return [item for item in self.items if item.severity is Severity.WARNING]
+
+    @property
+    def errors(self) -> list[Diagnostic]:
+        """Reported errors."""
+        return [item for item in self.items if item.severity is Severity.ERROR]
+
+    def __iter__(self) -> Iterator[Diagnostic]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+active_diagnostics: ContextVar[Diagnostics | None] = ContextVar('active_diagnostics', default=None)
+"""Diagnostics of the code being evaluated, warnings are raised if there are none."""
+
+
+def warn(message: str) -> None:
+    """
+    Report a warning to the active diagnostics.
+
+    Parameters
+    ----------
+    message : str
+        Description of the probable mistake.
+
+    Raises
+    ------
+    UserWarning
+        Raised if no diagnostics are active, or they are strict.
+    """
+    diagnostics = active_diagnostics.get()
+    if diagnostics is None:
+        raise UserWarning(message)
+    diagnostics.warn(message)
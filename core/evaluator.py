@@ -0,0 +1,218 @@
+"""
+Module evaluating µLang expressions without recursion. An AST is linearized
+into a flat program of stack operations in post-order, with jumps for
+conditions, and the program is run in a loop over a stack of values, so
+expressions nested as deep as memory allows are evaluated, e.g. a chain of
+a million additions, which `eval()` of the nodes cannot do within the
+recursion limit of Python.
+
+Results and errors are the same as of `eval()`, as every operator applies
+the same Python operation to its already evaluated operands.
+"""
+
+import operator
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any
+
+from core.tokens.arthmetic import (
+    Addition,
+    Division,
+    Exponentiation,
+    Multiplication,
+    Subtraction,
+    power,
+)
+from core.tokens.literal import Constant, Duration, Number, String, Time
+from core.tokens.logic import (
+    EqualTo,
+    GreaterOrEqualTo,
+    GreaterThan,
+    IfStatement,
+    LessOrEqualTo,
+    LessThan,
+)
+from core.tokens.statement import FunctionCall, call
+
+# Operations of a program, each with an argument.
+_PUSH = 0
+"""Push the argument, an already evaluated literal."""
+_BINARY = 1
+"""Replace the two topmost values with the argument applied to them."""
+_EVALUATE = 2
+"""Push the value of the argument, a node evaluated with `eval()`, e.g. a variable."""
+_JUMP_IF_FALSE = 3
+"""Pop a condition and continue at the argument if it does not hold."""
+_JUMP = 4
+"""Continue at the argument."""
+_CALL = 5
+"""Replace as many topmost values as the function takes with its result."""
+_TARGET = -1
+"""Not emitted: marks the position the argument, a list, is set to during linearization."""
+
+
+def _divide(dividend: Any, divisor: Any) -> Any:
+    if divisor == 0:
+        raise ZeroDivisionError("You cannot divide by 0.")
+    return dividend / divisor
+
+
+_OPERATIONS: dict[type, Callable[[Any, Any], Any]] = {
+    Addition: operator.add,
+    Subtraction: operator.sub,
+    Multiplication: operator.mul,
+    Division: _divide,
+    Exponentiation: power,
+    EqualTo: operator.eq,
+    LessThan: operator.lt,
+    LessOrEqualTo: operator.le,
+    GreaterOrEqualTo: operator.ge,
+    GreaterThan: operator.gt,
+}
+# Shared pairs, so linearization does not allocate one for every operator.
+_BINARY_OPERATIONS = {kind: (_BINARY, operation) for kind, operation in _OPERATIONS.items()}
+_LITERALS = (Constant, Duration, Number, String, Time)
+
+
+@dataclass(slots=True)
+class Program:
+    """
+    Linearized expression: operations and their arguments in two parallel
+    lists, which take less memory than a list of pairs.
+    """
+    operations: list[int] = field(default_factory=list)
+    arguments: list[Any] = field(default_factory=list)
+
+    def emit(self, operation: int, argument: Any = None) -> int:
+        """Append an operation, returning its position."""
+        self.operations.append(operation)
+        self.arguments.append(argument)
+        return len(self.operations) - 1
+
+    def __len__(self) -> int:
+        return len(self.operations)
+
+
+def linearize(tree: Any) -> Program:
+    """
+    Translate an expression into a program of stack operations, without
+    recursion.
+
+    Parameters
+    ----------
+    tree : Any
+        Root of the AST of an expression.
+
+    Returns
+    -------
+    Program
+        Program leaving the value of the expression on the stack.
+    """
+    program = Program()
+    operations, arguments = program.operations, program.arguments
+    jumps: list[tuple[int, list[int]]] = []
+    # Nodes to visit and, as pairs, operations to emit after their operands,
+    # jumps to emit and targets of jumps to mark, in reverse order.
+    tasks: list[Any] = [tree]
+    while tasks:
+        item = tasks.pop()
+        kind = type(item)
+        if kind in _BINARY_OPERATIONS:
+            tasks += (_BINARY_OPERATIONS[kind], item.right, item.left)
+        elif kind is tuple:
+            operation, argument = item
+            if operation == _TARGET:
+                argument.append(len(program))
+            elif operation in (_JUMP, _JUMP_IF_FALSE):
+                jumps.append((program.emit(operation), argument))
+            else:
+                operations.append(operation)
+                arguments.append(argument)
+        elif isinstance(item, _LITERALS):
+            operations.append(_PUSH)
+            arguments.append(item.eval())
+        elif isinstance(item, IfStatement):
+            alternative: list[int] = []
+            end: list[int] = []
+            tasks += (
+                (_TARGET, end),
+                item.alternative if item.alternative is not None else (_PUSH, None),
+                (_TARGET, alternative),
+                (_JUMP, end),
+                item.instructions,
+                (_JUMP_IF_FALSE, alternative),
+                item.condition,
+            )
+        elif isinstance(item, FunctionCall):
+            tasks.append((_CALL, (item.name, len(item.arguments))))
+            tasks.extend(reversed(item.arguments))
+        else:
+            operations.append(_EVALUATE)
+            arguments.append(item)
+
+    for position, target in jumps:
+        program.arguments[position] = target[0]
+    return program
+
+
+def run(program: Program) -> Any:
+    """
+    Run a program in a loop over a stack of values.
+
+    Parameters
+    ----------
+    program : Program
+        Program returned by `linearize()`.
+
+    Returns
+    -------
+    Any
+        Value of the expression.
+    """
+    operations = program.operations
+    arguments = program.arguments
+    stack: list[Any] = []
+    push = stack.append
+    pop = stack.pop
+    position = 0
+    end = len(operations)
+    while position < end:
+        operation = operations[position]
+        argument = arguments[position]
+        position += 1
+        if operation == _BINARY:
+            right = pop()
+            stack[-1] = argument(stack[-1], right)
+        elif operation == _PUSH:
+            push(argument)
+        elif operation == _EVALUATE:
+            push(argument.eval())
+        elif operation == _JUMP_IF_FALSE:
+            if not pop():
+                position = argument
+        elif operation == _JUMP:
+            position = argument
+        else:
+            name, count = argument
+            values = stack[len(stack) - count:]
+            del stack[len(stack) - count:]
+            push(call(name, *values))
+    return stack[-1]
+
+
+def compile_stack(tree: Any) -> Callable[[], Any]:
+    """
+    Linearize an expression into a function running it on a stack.
+
+    Parameters
+    ----------
+    tree : Any
+        Root of the AST of an expression.
+
+    Returns
+    -------
+    Callable[[], Any]
+        Function returning the same value as `tree.eval()`.
+    """
+    return partial(run, linearize(tree))
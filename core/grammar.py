@@ -0,0 +1,158 @@
+"""
+Module with the µLang grammar definition and the table-driven LALR parser
+running it. Neither needs `rply`, which is only used to generate the tables.
+"""
+
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from core.lexer import Token
+
+Action = Callable[[list[Any]], Any]
+"""Function building an AST node from the symbols of a production rule."""
+Production = tuple[str, list[str], Action, str | None]
+
+
+class ParsingError(ValueError):
+    """Raised if a token cannot follow the tokens before it."""
+    def __init__(self, token: Token) -> None:
+        position = token.source_pos
+        if token.name == '$end':
+            message = 'Unexpected end of code'
+        else:
+            message = f'Unexpected `{token.value}`'
+            if position is not None:
+                message += f' at line {position.lineno}, column {position.colno}'
+        super().__init__(message)
+        self.token = token
+        self.source_pos = position
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Rebuilt from the token, e.g. when sent back from a worker process.
+        return type(self), (self.token,), self.__dict__
+
+
+class GrammarDefinition:
+    """
+    Tokens, precedence and production rules of a grammar.
+
+    Production rules are registered with decorators, as with `rply`'s
+    `ParserGenerator`, e.g. `@grammar.production("program : expression")`.
+    """
+    def __init__(self, tokens: list[str], precedence: list[tuple[str, list[str]]]) -> None:
+        self.tokens = tokens
+        self.precedence = precedence
+        self.productions: list[Production] = []
+        self.error_handler: Callable[[Token], Any] | None = None
+
+    def production(self, rule: str, precedence: str | None = None) -> Callable:
+        """
+        Register the decorated function as a production rule or rules,
+        if alternatives are separated by `|`.
+        """
+        parts = rule.split()
+        name = parts[0]
+        if parts[1] != ':':
+            raise ValueError(f"Expecting `:` in production rule `{rule}`.")
+        alternatives = ' '.join(parts[2:]).split('|')
+
+        def inner(func: Action) -> Action:
+            for alternative in alternatives:
+                self.productions.append((name, alternative.split(), func, precedence))
+            return func
+        return inner
+
+    def error(self, func: Callable[[Token], Any]) -> Callable[[Token], Any]:
+        """Register the decorated function as a handler of syntax errors."""
+        self.error_handler = func
+        return func
+
+
+class TableParser: # pylint: disable=too-few-public-methods
+    """
+    LALR parser driven by precomputed tables.
+
+    Parameters
+    ----------
+    grammar : GrammarDefinition
+        Grammar supplying production rules called on reductions.
+    lr_action : list[dict[str, int]]
+        Action per state and terminal: positive numbers shift to a state,
+        negative ones reduce by a production, zero accepts.
+    lr_goto : list[dict[str, int]]
+        State to go to per state and nonterminal after a reduction.
+    default_reductions : list[int]
+        Reduction to perform in a state regardless of the lookahead, or zero.
+    """
+    def __init__(
+        self,
+        grammar: GrammarDefinition,
+        lr_action: list[dict[str, int]],
+        lr_goto: list[dict[str, int]],
+        default_reductions: list[int],
+    ) -> None:
+        # Production 0 is the augmented start rule, which is never reduced.
+        self._productions: list[tuple[str, int, Action | None]] = [
+            ('', 0, None)
+        ]
+        self._productions.extend(
+            (name, len(symbols), func) for name, symbols, func, _ in grammar.productions
+        )
+        self._error_handler = grammar.error_handler
+        self._lr_action = lr_action
+        self._lr_goto = lr_goto
+        self._default_reductions = default_reductions
+
+    def parse(self, tokens: Iterator[Token]) -> Any:
+        """
+        Build an AST from tokens.
+
+        Parameters
+        ----------
+        tokens : Iterator[Token]
+            Tokens supplied by a lexer.
+
+        Returns
+        -------
+        Any
+            Value returned by the production rule of the start symbol.
+
+        Raises
+        ------
+        ParsingError
+            Raised if the tokens do not match the grammar, unless the error
+            handler raises otherwise.
+        """
+        lookahead: Token | None = None
+        state_stack = [0]
+        symbol_stack: list[Any] = [Token('$end', '$end')]
+        current_state = 0
+        while True:
+            reduction = self._default_reductions[current_state]
+            if not reduction:
+                if lookahead is None:
+                    lookahead = next(tokens, None) or Token('$end', '$end')
+
+                action = self._lr_action[current_state].get(lookahead.name)
+                if action is None:
+                    if self._error_handler is not None:
+                        self._error_handler(lookahead)
+                    raise ParsingError(lookahead)
+                if action == 0:
+                    return symbol_stack[-1]
+                if action > 0:
+                    state_stack.append(action)
+                    symbol_stack.append(lookahead)
+                    current_state = action
+                    lookahead = None
+                    continue
+                reduction = action
+
+            name, length, func = self._productions[-reduction]
+            start = len(symbol_stack) - length
+            arguments = symbol_stack[start:]
+            del symbol_stack[start:]
+            del state_stack[start:]
+            symbol_stack.append(func(arguments)) # type: ignore
+            current_state = self._lr_goto[state_stack[-1]][name]
+            state_stack.append(current_state)
@@ -0,0 +1,104 @@
+"""
+Module with instrumentation of the interpreter: durations of lexing, parsing,
+optimizing and evaluating code, counts of tokens and AST nodes, and durations
+of building the lexer and the parser.
+
+Instrumentation is off unless an interpreter is given a callback, e.g.
+`Interpreter(instrument=Statistics().record)`, which receives
+a `Measurement` of every evaluated piece of code.
+"""
+
+from dataclasses import dataclass, field
+
+from core.cache import CacheStats
+
+grammar_timings: dict[str, float] = {}
+"""Seconds it took to build the shared lexer and the shared parser, by name."""
+
+
+@dataclass(slots=True)
+class Measurement: # pylint: disable=too-many-instance-attributes
+    """Durations in seconds and counts of evaluating one piece of code."""
+    code: str
+    cache_hit: bool
+    """Whether the AST was found in the parse cache, so it was not lexed nor parsed."""
+    lookup: float
+    """Duration of looking the AST up in the parse cache."""
+    lexing: float
+    parsing: float
+    optimizing: float
+    evaluation: float
+    tokens: int
+    """Number of tokens, zero if the AST was cached."""
+    nodes: int
+    """Number of nodes of the evaluated AST."""
+
+    @property
+    def total(self) -> float:
+        """Duration of all phases."""
+        return self.lookup + self.lexing + self.parsing + self.optimizing + self.evaluation
+
+    def __str__(self) -> str:
+        phases = ', '.join(
+            f'{name} {duration * 1e6:.1f} µs' for name, duration in (
+                ('lookup', self.lookup),
+                ('lexing', self.lexing),
+                ('parsing', self.parsing),
+                ('optimizing', self.optimizing),
+                ('evaluation', self.evaluation),
+            )
+        )
+        cache = 'cache hit' if self.cache_hit else f'cache miss, {self.tokens} tokens'
+        return f'{self.total * 1e6:.1f} µs ({phases}); {cache}, {self.nodes} nodes'
+
+
+@dataclass
+class Statistics:
+    """Totals of measurements, to be passed as a callback to an interpreter."""
+    evaluations: int = 0
+    cache_hits: int = 0
+    tokens: int = 0
+    nodes: int = 0
+    durations: dict[str, float] = field(default_factory=lambda: dict.fromkeys(
+        ('lookup', 'lexing', 'parsing', 'optimizing', 'evaluation'), 0.0
+    ))
+    last: Measurement | None = None
+
+    def record(self, measurement: Measurement) -> None:
+        """Add a measurement to the totals."""
+        self.evaluations += 1
+        self.cache_hits += measurement.cache_hit
+        self.tokens += measurement.tokens
+        self.nodes += measurement.nodes
+        for phase in self.durations:
+            self.durations[phase] += getattr(measurement, phase)
+        self.last = measurement
+
+    def report(self, cache: CacheStats | None = None) -> str:
+        """
+        Describe the totals.
+
+        Parameters
+        ----------
+        cache : CacheStats | None
+            Counters of the parse cache to include.
+
+        Returns
+        -------
+        str
+            Human-readable summary, one fact per line.
+        """
+        lines = [f'evaluations: {self.evaluations} ({self.cache_hits} parse cache hits)']
+        for phase, duration in self.durations.items():
+            mean = duration / self.evaluations if self.evaluations else 0.0
+            lines.append(f'{phase}: {duration * 1e3:.3f} ms total, {mean * 1e6:.1f} µs mean')
+        lines.append(f'tokens: {self.tokens}, AST nodes: {self.nodes}')
+        for name, duration in grammar_timings.items():
+            lines.append(f'{name} build: {duration * 1e3:.3f} ms')
+        if cache is not None:
+            lines.append(
+                f'parse cache: {cache.size}/{cache.capacity} entries, {cache.hits} hits, '
+                f'{cache.misses} misses, {cache.evictions} evictions, '
+                f'{cache.invalidations} invalidations'
+            )
+        return '\n'.join(lines)
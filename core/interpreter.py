@@ -0,0 +1,592 @@
+"""
+Module with a reusable µLang interpreter. The lexer and the parser are built
+once per process and shared by every interpreter, while each interpreter keeps
+its own symbol table.
+
+The lexer and the parser keep no state between calls, and the symbol table
+being evaluated is held by a context variable, so interpreters of different
+threads share them, and the parse cache, safely. An interpreter itself, with
+its symbol table, belongs to one thread at a time.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from enum import Enum
+from functools import cache, wraps
+from os import PathLike
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from core.cache import MemoCache, ParseCache
+from core.compiler import compile_expression
+from core.diagnostics import Diagnostics, active_diagnostics
+from core.grammar import TableParser
+from core.instrumentation import Measurement, grammar_timings
+from core.lexer import Lexer, MasterLexer, RuleLexer
+from core.optimizer import convert_numbers, count_nodes, dump, fold, resolve
+from core.parser import Parser
+from core.symbol_table_manager import (
+    Symbol,
+    SymbolTableManager,
+    SymbolType,
+    active_symbol_table,
+)
+from core.tokens.literal import Numeric
+from core.tokens.statement import Function, FunctionDeclaration, VariableDeclaration
+
+if TYPE_CHECKING:
+    from core.reactive import DependencyGraph
+    from core.vectorize import VectorizedExpression
+
+_T = TypeVar('_T')
+_BUILD_LOCK = threading.RLock()
+
+
+def _once(build: Callable[[], _T]) -> Callable[[], _T]:
+    """
+    Cache the result of a function without arguments. Unlike with `cache()`
+    alone, the function is called only once even if threads first need the
+    result at the same time, while later calls do not take the lock.
+    """
+    built = cache(build)
+
+    @cache
+    @wraps(build)
+    def supply() -> _T:
+        with _BUILD_LOCK:
+            return built()
+    return supply
+
+
+@_once
+def shared_lexer() -> MasterLexer | RuleLexer:
+    """
+    Supply the lexer shared by all interpreters, building it on the first use.
+
+    Returns
+    -------
+    MasterLexer | RuleLexer
+        An instance of a lexer.
+    """
+    start = time.perf_counter()
+    lexer = Lexer().get_lexer()
+    grammar_timings['lexer'] = time.perf_counter() - start
+    return lexer
+
+
+@_once
+def shared_parser() -> TableParser:
+    """
+    Supply the parser shared by all interpreters, building its grammar on the
+    first use.
+
+    Returns
+    -------
+    TableParser
+        An instance of a parser.
+    """
+    start = time.perf_counter()
+    parser_generator = Parser()
+    parser_generator.parse()
+    parser = parser_generator.get_parser()
+    grammar_timings['parser'] = time.perf_counter() - start
+    return parser
+
+
+@_once
+def shared_parse_cache() -> ParseCache:
+    """
+    Supply the cache of parsed ASTs shared by all interpreters.
+
+    Returns
+    -------
+    ParseCache
+        An instance of a cache.
+    """
+    return ParseCache()
+
+
+@_once
+def shared_compile_cache() -> MemoCache:
+    """
+    Supply the cache of compiled ASTs shared by all interpreters, keyed on
+    the AST and the compiler, so an AST cached by the parse cache is compiled
+    or linearized once rather than on every evaluation.
+
+    Returns
+    -------
+    MemoCache
+        An instance of a cache.
+    """
+    return MemoCache(capacity=1024)
+
+
+def _compile_stack(tree: Any) -> Callable[[], Any]:
+    # Imported on demand, so starting the interpreter does not import it.
+    from core.evaluator import compile_stack  # pylint: disable=import-outside-toplevel
+    return compile_stack(tree)
+
+
+def _dependency_graph() -> 'DependencyGraph':
+    from core.reactive import DependencyGraph  # pylint: disable=import-outside-toplevel
+    return DependencyGraph()
+
+
+def _apply(compiler: Callable[[Any], Callable[[], Any]], tree: Any) -> Callable[[], Any]:
+    return compiler(tree)
+
+
+class Backend(Enum):
+    """Ways of evaluating an AST."""
+    TREE = 'tree'
+    """Walk the AST calling `eval()` of every node."""
+    COMPILED = 'compiled'
+    """Compile the AST into a Python code object first."""
+    STACK = 'stack'
+    """
+    Linearize the AST into stack operations first, so expressions of any
+    depth are evaluated without recursion.
+    """
+
+
+_COMPILERS: dict[Backend, Callable[[Any], Callable[[], Any]]] = {
+    Backend.COMPILED: compile_expression,
+    Backend.STACK: _compile_stack,
+}
+
+
+class Interpreter: # pylint: disable=too-many-instance-attributes
+    """
+    µLang interpreter, which may be reused across many evaluations.
+
+    Parameters
+    ----------
+    symbol_table : SymbolTableManager | None
+        Symbol table to evaluate code with, possibly a nested scope, e.g.
+        `SymbolTableManager(parent)`. A new, empty one is created if not given.
+    lexer : MasterLexer | RuleLexer | None
+        Lexer to tokenize code with. Defaults to the shared lexer.
+    parser : TableParser | None
+        Parser to build ASTs with. Defaults to the shared parser.
+    backend : Backend
+        Default way of evaluating ASTs.
+    optimize : bool
+        Whether to fold constant subtrees of ASTs before evaluating them.
+    parse_cache : ParseCache | None
+        Cache of parsed ASTs. Defaults to the shared cache, or to a new one if
+        a lexer or a parser is given.
+    instrument : Callable[[Measurement], None] | None
+        Callback receiving durations of phases and counts of every evaluation,
+        e.g. `Statistics().record`. Nothing is measured if not given.
+    reactive : bool
+        Whether redeclaring a variable recomputes the variables declared from
+        it, e.g. `var worked = end - start` after `var start = 9:00`.
+    numeric : Numeric
+        Type numbers are evaluated to, e.g. exact integers with
+        `Numeric.INTEGER` or decimals with `Numeric.DECIMAL`.
+    diagnostics : Diagnostics | None
+        Diagnostics collecting warnings of evaluations, e.g. redeclared
+        variables, so evaluation goes on after them. Warnings go to the
+        diagnostics active already, e.g. of an enclosing evaluation, if not
+        given, and are raised if there are none.
+    """
+    def __init__( # pylint: disable=too-many-arguments
+        self,
+        symbol_table: SymbolTableManager | None = None,
+        *,
+        lexer: MasterLexer | RuleLexer | None = None,
+        parser: TableParser | None = None,
+        backend: Backend = Backend.TREE,
+        optimize: bool = True,
+        parse_cache: ParseCache | None = None,
+        instrument: Callable[[Measurement], None] | None = None,
+        reactive: bool = False,
+        numeric: Numeric = Numeric.FLOAT,
+        diagnostics: Diagnostics | None = None,
+    ) -> None:
+        if symbol_table is None:
+            symbol_table = SymbolTableManager()
+        self.symbol_table = symbol_table
+        self._lexer = lexer if lexer is not None else shared_lexer()
+        self._parser = parser if parser is not None else shared_parser()
+        self.backend = backend
+        self.optimize = optimize
+        if parse_cache is None:
+            # ASTs of the shared cache come from the shared grammar, so code
+            # is parsed with a lexer or a parser of its own into a new cache.
+            own_grammar = lexer is not None or parser is not None
+            parse_cache = ParseCache() if own_grammar else shared_parse_cache()
+        self.parse_cache = parse_cache
+        self.instrument = instrument
+        self.dependency_graph = _dependency_graph() if reactive else None
+        self.numeric = numeric
+        self.diagnostics = diagnostics
+
+    def parse(self, code: str) -> Any:
+        """
+        Parse μLang code into an AST without evaluating it. The AST is
+        optimized, unless the interpreter was created with `optimize=False`,
+        its variables are resolved to slots of the symbol table, and it is
+        cached, so parsing the same code again is a lookup.
+
+        Parameters
+        ----------
+        code : str
+            μLang code to be parsed.
+
+        Returns
+        -------
+        Any
+            Root of the AST, either an expression or a statement.
+        """
+        key = (code, self.optimize, self.numeric)
+        shape = self.symbol_table.shape
+        tree = self.parse_cache.get(key, shape)
+        if tree is None:
+            tree = self._optimize(self._parser.parse(self._lexer.lex(code)))
+            self.parse_cache.put(key, shape, tree)
+        return tree
+
+    def prepare(self, code: str) -> Any:
+        """
+        Parse μLang code into an AST which does not depend on any symbol table,
+        e.g. to be stored and evaluated later. The AST is optimized, unless
+        the interpreter was created with `optimize=False`, but its variables
+        are not resolved. Evaluate it with `execute(resolve(tree))`.
+
+        Parameters
+        ----------
+        code : str
+            μLang code to be parsed.
+
+        Returns
+        -------
+        Any
+            Root of the AST, either an expression or a statement.
+        """
+        tree = convert_numbers(self._parser.parse(self._lexer.lex(code)), self.numeric)
+        return fold(tree) if self.optimize else tree
+
+    def resolve(self, tree: Any, code: str | None = None) -> Any:
+        """
+        Resolve variables of an AST returned by `prepare()` to slots of the
+        symbol table, as `parse()` does. If the code the AST was prepared
+        from is given, the resolved AST is cached as `parse()` caches it,
+        so resolving the same code again is a lookup and its compiled form
+        is reused.
+
+        Parameters
+        ----------
+        tree : Any
+            Root of the AST.
+        code : str | None
+            μLang code the AST was prepared from by this interpreter.
+
+        Returns
+        -------
+        Any
+            Root of the resolved AST. The original AST is left unchanged.
+        """
+        if code is None:
+            return resolve(tree, self.symbol_table)
+        key = (code, self.optimize, self.numeric)
+        shape = self.symbol_table.shape
+        resolved = self.parse_cache.get(key, shape)
+        if resolved is None:
+            resolved = resolve(tree, self.symbol_table)
+            self.parse_cache.put(key, shape, resolved)
+        return resolved
+
+    def dump(self, code: str) -> str:
+        """
+        Render the AST of μLang code, as it would be evaluated.
+
+        Parameters
+        ----------
+        code : str
+            μLang code to be parsed.
+
+        Returns
+        -------
+        str
+            Indented textual representation of the AST, one node per line.
+        """
+        return dump(self.parse(code))
+
+    def compile(self, code: str) -> Callable[[], Any]:
+        """
+        Parse and compile μLang code once, so it can be evaluated many times.
+        Code is linearized into stack operations if the interpreter's backend
+        is `Backend.STACK`, otherwise it is compiled into Python code.
+
+        Parameters
+        ----------
+        code : str
+            μLang code to be compiled.
+
+        Returns
+        -------
+        Callable[[], Any]
+            Function evaluating the code against the symbol table on each call.
+        """
+        function = self._compile(
+            self.parse(code), _COMPILERS.get(self.backend, compile_expression)
+        )
+
+        diagnostics = self.diagnostics
+
+        def evaluate() -> Any:
+            token = active_symbol_table.set(self.symbol_table)
+            reporting = active_diagnostics.set(diagnostics) if diagnostics is not None else None
+            try:
+                return function()
+            finally:
+                if reporting is not None:
+                    active_diagnostics.reset(reporting)
+                active_symbol_table.reset(token)
+        return evaluate
+
+    def vectorize(self, code: str) -> 'VectorizedExpression':
+        """
+        Compile a μLang expression once to evaluate it over columns of values,
+        e.g. `rate * hours - 10` over NumPy arrays bound to `rate` and `hours`.
+        Requires NumPy to be installed.
+
+        Parameters
+        ----------
+        code : str
+            μLang expression to be compiled.
+
+        Returns
+        -------
+        VectorizedExpression
+            Function evaluating the expression for every row of the columns it
+            is called with. Names not bound to columns are looked up in the
+            symbol table.
+        """
+        from core.vectorize import VectorizedExpression  # pylint: disable=import-outside-toplevel
+        return VectorizedExpression(self.parse(code), self.symbol_table, self.numeric)
+
+    def memoize(self, name: str, capacity: int = 128) -> MemoCache:
+        """
+        Cache results of a declared function, so calling it again with the
+        same arguments does not evaluate its body. Only functions whose
+        results depend on nothing but their arguments should be memoized.
+        Redeclaring the function drops the cache.
+
+        Parameters
+        ----------
+        name : str
+            Name of the function.
+        capacity : int
+            Maximal number of cached results, the least recently used ones
+            are evicted first.
+
+        Returns
+        -------
+        MemoCache
+            The cache of the function, a new one unless it is memoized already.
+
+        Raises
+        ------
+        TypeError
+            Raised if there is no function with the name.
+        """
+        symbol = self.symbol_table[name]
+        function = symbol.value if symbol is not None else None
+        if not isinstance(function, Function):
+            raise TypeError(f"`{name}` is not a function.")
+        if function.memo is None:
+            function.memo = MemoCache(capacity)
+        return function.memo
+
+    def save(self, path: str | PathLike[str]) -> list[str]:
+        """
+        Save variables of the symbol table into a snapshot file (see
+        `core.snapshot`).
+
+        Parameters
+        ----------
+        path : str | PathLike[str]
+            Path of the snapshot file, replaced if it exists.
+
+        Returns
+        -------
+        list[str]
+            Names of functions, which are not saved.
+        """
+        # Imported on demand, so starting the interpreter does not import it.
+        from core import snapshot  # pylint: disable=import-outside-toplevel
+        return snapshot.save(self.symbol_table, path)
+
+    def restore(self, path: str | PathLike[str]) -> int:
+        """
+        Declare variables saved into a snapshot file, replacing variables with
+        the same names. Restored variables are plain values, even in
+        a reactive interpreter.
+
+        Parameters
+        ----------
+        path : str | PathLike[str]
+            Path of the snapshot file.
+
+        Returns
+        -------
+        int
+            Number of restored variables.
+
+        Raises
+        ------
+        ValueError
+            Raised if the file is not a compatible snapshot.
+        """
+        from core import snapshot  # pylint: disable=import-outside-toplevel
+        restored = snapshot.load(path).slots
+        if self.dependency_graph is not None:
+            self.dependency_graph.forget(
+                previous for symbol in restored
+                if (previous := self.symbol_table.local(symbol.name)) is not None
+            )
+        self.symbol_table.declare_many(restored)
+        return len(restored)
+
+    def execute(self, tree: Any, backend: Backend | None = None) -> Any:
+        """
+        Evaluate an already parsed AST against the symbol table.
+
+        Parameters
+        ----------
+        tree : Any
+            Root of the AST returned by `parse()`.
+        backend : Backend | None
+            Way of evaluating the AST. Defaults to the interpreter's backend.
+
+        Returns
+        -------
+        Any
+            Result of the evaluation.
+        """
+        token = active_symbol_table.set(self.symbol_table)
+        diagnostics = self.diagnostics
+        reporting = active_diagnostics.set(diagnostics) if diagnostics is not None else None
+        try:
+            compiler = _COMPILERS.get(backend or self.backend)
+            if compiler is not None:
+                return self._compile(tree, compiler)()
+            if isinstance(tree, VariableDeclaration):
+                return self._declare_variable(tree.name, tree.value.eval(), tree.value)
+            if isinstance(tree, FunctionDeclaration):
+                return self._declare_function(tree, tree.body.eval)
+            return tree.eval()
+        finally:
+            if reporting is not None:
+                active_diagnostics.reset(reporting)
+            active_symbol_table.reset(token)
+
+    def evaluate(self, code: str, backend: Backend | None = None) -> Any:
+        """
+        Evaluate μLang code.
+
+        Parameters
+        ----------
+        code : str
+            μLang code to be evaluated.
+        backend : Backend | None
+            Way of evaluating the code. Defaults to the interpreter's backend.
+
+        Returns
+        -------
+        Any
+            Result of the evaluation.
+        """
+        if self.instrument is not None:
+            return self._evaluate_instrumented(code, backend, self.instrument)
+        return self.execute(self.parse(code), backend)
+
+    def _evaluate_instrumented( # pylint: disable=too-many-locals
+        self,
+        code: str,
+        backend: Backend | None,
+        instrument: Callable[[Measurement], None],
+    ) -> Any:
+        clock = time.perf_counter
+        key = (code, self.optimize, self.numeric)
+        shape = self.symbol_table.shape
+        start = clock()
+        tree = self.parse_cache.get(key, shape)
+        looked_up = lexed = parsed = optimized = clock()
+        cache_hit = tree is not None
+        tokens = []
+        if not cache_hit:
+            tokens = list(self._lexer.lex(code))
+            lexed = clock()
+            tree = self._parser.parse(iter(tokens))
+            parsed = clock()
+            tree = self._optimize(tree)
+            optimized = clock()
+            self.parse_cache.put(key, shape, tree)
+
+        evaluation_start = clock()
+        result = self.execute(tree, backend)
+        evaluated = clock()
+        instrument(Measurement(
+            code=code,
+            cache_hit=cache_hit,
+            lookup=looked_up - start,
+            lexing=lexed - looked_up,
+            parsing=parsed - lexed,
+            optimizing=optimized - parsed,
+            evaluation=evaluated - evaluation_start,
+            tokens=len(tokens),
+            nodes=count_nodes(tree),
+        ))
+        return result
+
+    def _optimize(self, tree: Any) -> Any:
+        tree = convert_numbers(tree, self.numeric)
+        if self.optimize:
+            tree = fold(tree)
+        return resolve(tree, self.symbol_table)
+
+    def _compile(
+        self,
+        tree: Any,
+        compiler: Callable[[Any], Callable[[], Any]],
+    ) -> Callable[[], Any]:
+        # Compiled expressions do not depend on the interpreter, so they are
+        # shared, unlike declarations, which are bound to this symbol table.
+        compiled = shared_compile_cache().call
+        if isinstance(tree, VariableDeclaration):
+            name, expression = tree.name, tree.value
+            value = compiled(_apply, (compiler, expression))
+            return lambda: self._declare_variable(name, value(), expression)
+        if isinstance(tree, FunctionDeclaration):
+            body = compiled(_apply, (compiler, tree.body))
+            return lambda: self._declare_function(tree, body)
+        return compiled(_apply, (compiler, tree))
+
+    def _declare_function(self, tree: FunctionDeclaration, evaluate: Callable[[], Any]) -> str:
+        function = Function(tree.name, tree.parameters, tree.body, self.symbol_table, evaluate)
+        symbol = Symbol(name=tree.name, value=function, type=SymbolType.FUNCTION)
+        if self.dependency_graph is None:
+            self.symbol_table.declare(symbol)
+            return str(function)
+
+        from core.reactive import dependencies  # pylint: disable=import-outside-toplevel
+        # Recursive calls are no dependency, the function is declared at once.
+        symbol.dependencies = dependencies(tree.body, (*tree.parameters, tree.name))
+        updated = self.dependency_graph.declare(self.symbol_table, symbol)
+        variables = (f"{variable.name} = {variable.value}" for variable in updated[1:])
+        return '\n'.join([str(function), *variables])
+
+    def _declare_variable(self, name: str, value: Any, expression: Any) -> str:
+        symbol = Symbol(name=name, value=value, type=SymbolType.VARIABLE)
+        if self.dependency_graph is None:
+            self.symbol_table.declare(symbol)
+            return f"{symbol.name} = {symbol.value}"
+
+        from core.reactive import dependencies  # pylint: disable=import-outside-toplevel
+        symbol.expression = expression
+        symbol.dependencies = dependencies(expression)
+        updated = self.dependency_graph.declare(self.symbol_table, symbol)
+        return '\n'.join(f"{symbol.name} = {symbol.value}" for symbol in updated)
@@ -1,16 +1,280 @@
 """Module containg µLang lexer."""
-from rply import lexer, LexerGenerator
+import re
+from collections.abc import Iterator
+from typing import Any
+
+
+class SourcePosition: # pylint: disable=too-few-public-methods
+    """Position of a character in a source code."""
+    __slots__ = ('colno', 'idx', 'lineno')
+
+    def __init__(self, idx: int, lineno: int, colno: int) -> None:
+        self.idx = idx
+        self.lineno = lineno
+        self.colno = colno
+
+    def __repr__(self) -> str:
+        return f"SourcePosition(idx={self.idx}, lineno={self.lineno}, colno={self.colno})"
+
+
+class Token:
+    """Syntactically relevant piece of a source code, e.g. a number or a keyword."""
+    __slots__ = ('name', 'source_pos', 'value')
+
+    def __init__(self, name: str, value: str, source_pos: SourcePosition | None = None) -> None:
+        self.name = name
+        self.value = value
+        self.source_pos = source_pos
+
+    def gettokentype(self) -> str:
+        """Supply the type of the token, i.e. the name of the rule it matched."""
+        return self.name
+
+    def getstr(self) -> str:
+        """Supply the text represented by the token."""
+        return self.value
+
+    def getsourcepos(self) -> SourcePosition | None:
+        """Supply the position of the first character of the token."""
+        return self.source_pos
+
+    def __repr__(self) -> str:
+        return f"Token({self.name!r}, {self.value!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Token):
+            return self.name == other.name and self.value == other.value
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.name, self.value))
+
+
+class LexingError(Exception):
+    """Raised if no token rule matches a source code at some position."""
+    def __init__(self, message: str | None, source_pos: SourcePosition) -> None:
+        super().__init__(message, source_pos)
+        self.message = message
+        self.source_pos = source_pos
+
+    def getsourcepos(self) -> SourcePosition:
+        """Supply the position at which the error occurred."""
+        return self.source_pos
+
+
+class TokenRules:
+    """Ordered set of token rules. In case of ambiguity, the first added rule wins."""
+    def __init__(self) -> None:
+        self.rules: list[tuple[str, str]] = []
+        self.ignore_rules: list[str] = []
+
+    def add(self, name: str, pattern: str) -> None:
+        """Add a rule producing tokens named `name`."""
+        self.rules.append((name, pattern))
+
+    def ignore(self, pattern: str) -> None:
+        """Add a rule, whose matches are skipped. Ignored rules are matched first."""
+        self.ignore_rules.append(pattern)
+
+    def build(self, single_pass: bool = True) -> 'MasterLexer | RuleLexer':
+        """
+        Build a lexer from the rules.
+
+        Parameters
+        ----------
+        single_pass : bool
+            Whether to match all rules at once with one combined regular
+            expression, instead of trying them one by one.
+
+        Returns
+        -------
+        MasterLexer | RuleLexer
+            An instance of a lexer.
+        """
+        if single_pass:
+            return MasterLexer(self.rules, self.ignore_rules)
+        return RuleLexer(self.rules, self.ignore_rules)
+
+    def build_rply(self) -> Any:
+        """
+        Build the `rply` lexer from the rules, the reference the other lexers
+        are verified and measured against. Requires `rply` to be installed.
+
+        Returns
+        -------
+        rply.lexer.Lexer
+            An instance of a lexer.
+        """
+        import rply  # pylint: disable=import-outside-toplevel
+
+        generator = rply.LexerGenerator()
+        for name, pattern in self.rules:
+            generator.add(name, pattern)
+        for pattern in self.ignore_rules:
+            generator.ignore(pattern)
+        return generator.build()
+
+
+class RuleLexer: # pylint: disable=too-few-public-methods
+    """Lexer trying every rule in order at each position of a source code."""
+    def __init__(self, rules: list[tuple[str, str]], ignore_rules: list[str]) -> None:
+        self._rules = [(name, re.compile(pattern)) for name, pattern in rules]
+        self._ignore_rules = [re.compile(pattern) for pattern in ignore_rules]
+
+    def lex(self, code: str) -> Iterator[Token]:
+        """
+        Split a source code into tokens lazily.
+
+        Parameters
+        ----------
+        code : str
+            Source code to be tokenized.
+
+        Returns
+        -------
+        Iterator[Token]
+            Tokens in order of occurrence.
+
+        Raises
+        ------
+        LexingError
+            Raised if no rule matches the code at some position.
+        """
+        idx = 0
+        lineno = 1
+        length = len(code)
+        while True:
+            matched = True
+            while matched and idx < length:
+                matched = False
+                for ignore_rule in self._ignore_rules:
+                    match = ignore_rule.match(code, idx)
+                    if match:
+                        lineno += code.count('\n', idx, match.end())
+                        idx = match.end()
+                        matched = True
+                        break
+            if idx >= length:
+                return
+
+            colno = idx - code.rfind('\n', 0, idx)
+            for name, rule in self._rules:
+                match = rule.match(code, idx)
+                if match:
+                    token = Token(name, match.group(), SourcePosition(idx, lineno, colno))
+                    lineno += code.count('\n', idx, match.end())
+                    idx = match.end()
+                    yield token
+                    break
+            else:
+                raise LexingError(None, SourcePosition(idx, lineno, colno))
+
+
+def _literal(pattern: str) -> str | None:
+    """Supply the text matched by a pattern without special characters, if it has none."""
+    if re.search(r'[.^$*+?{}\[\]|()]|\\\w', re.sub(r'\\\W', '', pattern)):
+        return None
+    return re.sub(r'\\(\W)', r'\1', pattern)
+
+
+class MasterLexer: # pylint: disable=too-few-public-methods
+    """
+    Lexer matching all rules at once with one regular expression, which
+    alternates them in order of priority, so the first added rule still wins.
+    Ignored text preceding a token is consumed by the same match.
+
+    Adjacent rules matching plain text, e.g. keywords and operators, share one
+    alternative and their tokens are named by looking the matched text up in
+    a table.
+    """
+    def __init__(self, rules: list[tuple[str, str]], ignore_rules: list[str]) -> None:
+        # Name of each group of the regular expression and what it produces:
+        # a name of tokens, a table of names by text or nothing at the end.
+        self._groups: dict[str, str | dict[str, str]] = {}
+        alternatives: list[str] = []
+        for name, pattern in rules:
+            literal = _literal(pattern)
+            previous = self._groups.get(f'_{len(self._groups) - 1}')
+            if literal is not None and isinstance(previous, dict) and literal not in previous:
+                previous[literal] = name
+                alternatives[-1] += f'|{pattern}'
+                continue
+            self._groups[f'_{len(self._groups)}'] = {literal: name} if literal is not None else name
+            alternatives.append(pattern)
+        self._groups['_end'] = ''
+        alternatives.append(r'\Z')
+
+        # Repeating ignored text possessively skips it the way trying every
+        # ignore rule in a loop does, without backtracking into it.
+        ignored = '|'.join(f'(?:{pattern})' for pattern in ignore_rules)
+        skip = f'(?:{ignored})*+' if ignore_rules else ''
+        self._skip = re.compile(skip)
+        self._pattern = re.compile(skip + '(?:' + '|'.join(
+            f'(?P<{group}>{alternative})'
+            for group, alternative in zip(self._groups, alternatives)
+        ) + ')')
+
+    def lex(self, code: str) -> Iterator[Token]:
+        """
+        Split a source code into tokens lazily.
+
+        Parameters
+        ----------
+        code : str
+            Source code to be tokenized.
+
+        Returns
+        -------
+        Iterator[Token]
+            Tokens in order of occurrence.
+
+        Raises
+        ------
+        LexingError
+            Raised if no rule matches the code at some position.
+        """
+        match_at = self._pattern.match
+        groups = self._groups
+        idx = 0
+        lineno = 1
+        line_start = 0
+        while True:
+            match = match_at(code, idx)
+            if match is None:
+                # Skip ignored text only to point at the unrecognised character.
+                match = self._skip.match(code, idx)
+            group = match.lastgroup # type: ignore[union-attr]
+            start = match.start(group) if group else match.end() # type: ignore[union-attr]
+            newlines = code.count('\n', idx, start)
+            if newlines:
+                lineno += newlines
+                line_start = code.rfind('\n', idx, start) + 1
+            if group is None:
+                raise LexingError(None, SourcePosition(start, lineno, start - line_start + 1))
+
+            produced = groups[group]
+            if not produced:
+                return
+            idx = match.end() # type: ignore[union-attr]
+            text = code[start:idx]
+            name = produced if isinstance(produced, str) else produced[text]
+            yield Token(name, text, SourcePosition(start, lineno, start - line_start + 1))
+            newlines = code.count('\n', start, idx)
+            if newlines:
+                lineno += newlines
+                line_start = code.rfind('\n', start, idx) + 1
 
 
 class Lexer(): # pylint: disable=too-few-public-methods
     "Lexer, which recognises pattern in a source code and returns a sequence of tokens."
     def __init__(self) -> None:
-        self._lexer = LexerGenerator()
+        self._lexer = TokenRules()
 
     def _add_tokens(self) -> None:
         self._lexer.add('string', r'"[^"]*"')
         self._lexer.add('if', r'if')
         self._lexer.add('then', r'then')
+        self._lexer.add('else', r'else')
         self._lexer.add('var', r'var')
         self._lexer.add('fun', r'fun')
         self._lexer.add('time', r'\d{1,2}:\d{2}')
@@ -29,6 +293,7 @@ class Lexer(): # pylint: disable=too-few-public-methods
         # self.lexer.add('print', r'print')
         self._lexer.add('opening_parenthesis', r'\(')
         self._lexer.add('closing_parenthesis', r'\)')
+        self._lexer.add('comma', r',')
         # self.lexer.add('semicolon', r'\;')
 
         self._lexer.add('addition', r'\+')
@@ -39,14 +304,32 @@ class Lexer(): # pylint: disable=too-few-public-methods
 
         self._lexer.ignore(r'\s+')
 
-    def get_lexer(self) -> lexer.Lexer:
+    def get_rules(self) -> TokenRules:
+        """
+        Supply µLang token rules without building a lexer.
+
+        Returns
+        -------
+        TokenRules
+            Token rules in order of priority.
+        """
+        self._add_tokens()
+        return self._lexer
+
+    def get_lexer(self, single_pass: bool = True) -> MasterLexer | RuleLexer:
         """
         Supply a µLang-complient lexer.
 
+        Parameters
+        ----------
+        single_pass : bool
+            Whether to match all token rules at once with one regular
+            expression, instead of trying them one by one at every position.
+            Both lexers produce the same tokens.
+
         Returns
         -------
-        Lexer
+        MasterLexer | RuleLexer
             An instance of a lexer.
         """
-        self._add_tokens()
-        return self._lexer.build()
+        return self.get_rules().build(single_pass)
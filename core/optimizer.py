@@ -0,0 +1,309 @@
+"""
+Module with the optimizer, a pass between parsing and evaluation which folds
+subtrees made of literals into single literals, so they are computed once
+instead of on every evaluation, and the resolver, a pass which binds names of
+variables to slots of a symbol table.
+"""
+
+from collections.abc import Callable
+from decimal import Decimal
+from typing import Any
+
+from core.diagnostics import active_diagnostics
+from core.symbol_table_manager import Symbol, SymbolTableManager, SymbolType
+from core.tokens.arthmetic import BinaryOperator
+from core.tokens.literal import (
+    Constant,
+    Duration,
+    Number,
+    Numeric,
+    String,
+    Time,
+    number_literal,
+)
+from core.tokens.logic import IfStatement
+from core.tokens.statement import (
+    FunctionCall,
+    FunctionDeclaration,
+    SlotInvocation,
+    SymbolInvocation,
+    VariableDeclaration,
+)
+
+_LITERALS = (Constant, Duration, Number, String, Time)
+
+
+_NUMERIC_TYPES = {float: Numeric.FLOAT, int: Numeric.INTEGER, Decimal: Numeric.DECIMAL}
+
+
+def _literal(value: Any) -> Any:
+    """Wrap an evaluated value in a literal token."""
+    if isinstance(value, (Duration, Time)):
+        return value
+    numeric = _NUMERIC_TYPES.get(type(value))
+    if numeric is not None:
+        return number_literal(repr(value) if numeric is Numeric.FLOAT else str(value), numeric)
+    return Constant(value)
+
+
+def _transform(
+    tree: Any,
+    rebuild: Callable[[Any, list[Any]], Any],
+    descend: Callable[[Any], list[Any]] | None = None,
+) -> Any:
+    """
+    Transform an AST bottom-up without recursion, so ASTs of any depth, e.g.
+    chains of a million additions, are transformed.
+
+    Parameters
+    ----------
+    tree : Any
+        Root of an AST.
+    rebuild : Callable[[Any, list[Any]], Any]
+        Function receiving a node and its already transformed children and
+        returning the transformed node.
+    descend : Callable[[Any], list[Any]] | None
+        Function supplying children of a node to transform first. Defaults to
+        `children()`.
+
+    Returns
+    -------
+    Any
+        Root of the transformed AST.
+    """
+    descend = descend or children
+    results: list[Any] = []
+    # A node is on the stack with -1 until its children are pushed, then with
+    # the number of its children, whose results are on top of `results`.
+    stack: list[tuple[Any, int]] = [(tree, -1)]
+    while stack:
+        node, count = stack.pop()
+        if count < 0:
+            nodes = descend(node)
+            if nodes:
+                stack.append((node, len(nodes)))
+                stack.extend([(child, -1) for child in reversed(nodes)])
+                continue
+            results.append(rebuild(node, nodes))
+            continue
+        operands = results[-count:]
+        del results[-count:]
+        results.append(rebuild(node, operands))
+    return results[0]
+
+
+def _with_children(node: Any, operands: list[Any]) -> Any:
+    """Copy a node with other children, given in the order of `children()`."""
+    if isinstance(node, VariableDeclaration):
+        return VariableDeclaration(node.name, *operands)
+    if isinstance(node, BinaryOperator):
+        return type(node)(*operands)
+    if isinstance(node, IfStatement):
+        return IfStatement(*operands)
+    if isinstance(node, FunctionDeclaration):
+        return FunctionDeclaration(node.name, node.parameters, *operands)
+    if isinstance(node, FunctionCall):
+        return FunctionCall(node.name, operands)
+    return node
+
+
+def convert_numbers(tree: Any, numeric: Numeric) -> Any:
+    """
+    Parse number literals of an AST into the type of a numeric mode.
+
+    Parameters
+    ----------
+    tree : Any
+        Root of an AST, parsed with numbers of `Numeric.FLOAT`.
+    numeric : Numeric
+        The numeric mode.
+
+    Returns
+    -------
+    Any
+        Root of the converted AST. The original AST is left unchanged.
+    """
+    if numeric is Numeric.FLOAT:
+        return tree
+
+    def convert(node: Any, operands: list[Any]) -> Any:
+        if isinstance(node, Number):
+            return number_literal(node.value, numeric)
+        return _with_children(node, operands)
+    return _transform(tree, convert)
+
+
+def fold(tree: Any) -> Any:
+    """
+    Fold constant subtrees of an AST into literals.
+
+    A subtree whose evaluation raises, e.g. division by zero, overflow or
+    the warning of subtracting a later time from an earlier one, is kept as
+    it is, so the error is raised on evaluation, as without the optimizer.
+    Warnings are raised while folding even if diagnostics are collected, so
+    they are reported on every evaluation rather than once, when parsing.
+
+    Parameters
+    ----------
+    tree : Any
+        Root of an AST, either an expression or a statement.
+
+    Returns
+    -------
+    Any
+        Root of the optimized AST. The original AST is left unchanged.
+    """
+    token = active_diagnostics.set(None)
+    try:
+        return _transform(tree, _fold_node)
+    finally:
+        active_diagnostics.reset(token)
+
+
+def _fold_node(node: Any, operands: list[Any]) -> Any:
+    if isinstance(node, BinaryOperator):
+        left, right = operands
+        folded = type(node)(left, right)
+        if isinstance(left, _LITERALS) and isinstance(right, _LITERALS):
+            try:
+                folded = _literal(folded.eval())
+            except Exception: # pylint: disable=broad-exception-caught # noqa: BLE001, S110
+                pass
+        return folded
+
+    if isinstance(node, IfStatement):
+        condition, instructions, *alternative = operands
+        if isinstance(condition, _LITERALS):
+            if condition.eval():
+                return instructions
+            return alternative[0] if alternative else Constant(None)
+        return IfStatement(condition, instructions, *alternative)
+
+    return _with_children(node, operands)
+
+
+def resolve(tree: Any, symbol_table: SymbolTableManager) -> Any:
+    """
+    Resolve invocations of declared variables to their slots in a symbol table.
+
+    The resolved AST has to be evaluated against a symbol table of the same
+    shape (see `SymbolTableManager.shape`). Names not declared yet are left to
+    be looked up on evaluation. Bodies of functions are resolved against
+    a scope of their parameters, nested in the symbol table.
+
+    Parameters
+    ----------
+    tree : Any
+        Root of an AST, either an expression or a statement.
+    symbol_table : SymbolTableManager
+        Scope the AST is going to be evaluated in.
+
+    Returns
+    -------
+    Any
+        Root of the resolved AST. The original AST is left unchanged.
+    """
+    def resolve_node(node: Any, operands: list[Any]) -> Any:
+        if isinstance(node, SymbolInvocation):
+            slot = symbol_table.resolve(node.name)
+            return node if slot is None else SlotInvocation(node.name, *slot)
+        if isinstance(node, FunctionDeclaration):
+            # Calls bind parameters in the same order, see `Function`.
+            scope = SymbolTableManager(symbol_table)
+            for parameter in node.parameters:
+                scope.declare(Symbol(parameter, SymbolType.VARIABLE, None))
+            return FunctionDeclaration(node.name, node.parameters, resolve(node.body, scope))
+        return _with_children(node, operands)
+
+    def descend(node: Any) -> list[Any]:
+        # Bodies of functions are resolved in a scope of their own.
+        return [] if isinstance(node, FunctionDeclaration) else children(node)
+
+    return _transform(tree, resolve_node, descend)
+
+
+def dump(tree: Any, indent: int = 0) -> str:
+    """
+    Render an AST as indented text, one node per line. Nodes are visited
+    without recursion, as in `_transform()`, so ASTs of any depth are rendered.
+
+    Parameters
+    ----------
+    tree : Any
+        Root of an AST.
+    indent : int
+        Indentation of the root.
+
+    Returns
+    -------
+    str
+        Textual representation of the AST.
+    """
+    lines = []
+    stack = [(tree, indent)]
+    while stack:
+        node, depth = stack.pop()
+        name = type(node).__name__
+        if isinstance(node, String):
+            lines.append(f'{" " * depth}{name} "{node.value}"')
+            continue
+        if isinstance(node, _LITERALS):
+            lines.append(f"{' ' * depth}{name} {node}")
+            continue
+        if hasattr(node, 'name'):
+            name = f'{name} {node.name}'
+        lines.append(f"{' ' * depth}{name}")
+        # Pushed in reverse, so the first child is rendered first.
+        stack.extend((child, depth + 2) for child in reversed(children(node)))
+    return '\n'.join(lines)
+
+
+def children(tree: Any) -> list[Any]: # pylint: disable=too-many-return-statements
+    """
+    Supply direct children of an AST node.
+
+    Parameters
+    ----------
+    tree : Any
+        A node of an AST.
+
+    Returns
+    -------
+    list[Any]
+        Children in order of evaluation, empty for leaves.
+    """
+    if isinstance(tree, BinaryOperator):
+        return [tree.left, tree.right]
+    if isinstance(tree, IfStatement):
+        if tree.alternative is not None:
+            return [tree.condition, tree.instructions, tree.alternative]
+        return [tree.condition, tree.instructions]
+    if isinstance(tree, VariableDeclaration):
+        return [tree.value]
+    if isinstance(tree, FunctionDeclaration):
+        return [tree.body]
+    if isinstance(tree, FunctionCall):
+        return list(tree.arguments)
+    return []
+
+
+def count_nodes(tree: Any) -> int:
+    """
+    Count nodes of an AST.
+
+    Parameters
+    ----------
+    tree : Any
+        Root of an AST.
+
+    Returns
+    -------
+    int
+        Number of nodes, including the root.
+    """
+    count = 0
+    stack = [tree]
+    while stack:
+        count += 1
+        stack.extend(children(stack.pop()))
+    return count
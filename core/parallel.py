@@ -0,0 +1,103 @@
+"""
+Module evaluating many independent µLang programs in parallel, in a pool of
+worker processes or threads. Every worker process builds the grammar once,
+when it starts, while worker threads share the grammar and the parse cache of
+this process. Each program is evaluated with a symbol table of its own.
+"""
+
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from core.batch import Result, Status, classify
+from core.interpreter import Interpreter, shared_lexer, shared_parser
+from core.script import run_script
+
+
+def _warm_up() -> None:
+    """Build the lexer and the parser of a worker before it receives any program."""
+    shared_lexer()
+    shared_parser()
+
+
+def evaluate_program(index: int, source: str) -> Result:
+    """
+    Evaluate a program, i.e. statements separated by newlines or semicolons,
+    with a fresh interpreter.
+
+    Parameters
+    ----------
+    index : int
+        Position of the program among all evaluated programs.
+    source : str
+        μLang code of the program.
+
+    Returns
+    -------
+    Result
+        Result whose value is the list of results of the statements. An error
+        stops the program and is reported in the result instead.
+    """
+    try:
+        values = list(run_script(source.splitlines(keepends=True), Interpreter()))
+    except Exception as e: # pylint: disable=broad-exception-caught # noqa: BLE001
+        return Result(index, source, classify(e), error=e)
+    return Result(index, source, Status.OK, values)
+
+
+def _evaluate_program(task: tuple[int, str]) -> Result:
+    return evaluate_program(*task)
+
+
+def evaluate_parallel(
+    sources: Iterable[str],
+    workers: int | None = None,
+    chunksize: int = 64,
+    threads: bool = False,
+) -> Iterator[Result]:
+    """
+    Evaluate independent μLang programs in worker processes.
+
+    Parameters
+    ----------
+    sources : Iterable[str]
+        μLang code of the programs.
+    workers : int | None
+        Number of workers. Defaults to the number of CPUs. With one worker,
+        programs are evaluated in the current thread.
+    chunksize : int
+        Number of programs sent to a worker process at once. Larger chunks
+        cost less communication, smaller ones balance work better.
+    threads : bool
+        Whether workers are threads rather than processes. Threads start at
+        once and pass programs and results without pickling, but evaluate in
+        parallel only on free-threaded builds of Python.
+
+    Returns
+    -------
+    Iterator[Result]
+        Result of every program, in the order of `sources`.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"Number of workers has to be positive. Received {workers}.")
+    if chunksize < 1:
+        raise ValueError(f"Size of a chunk has to be positive. Received {chunksize}.")
+
+    if workers == 1:
+        return map(_evaluate_program, enumerate(sources))
+    if threads:
+        return _evaluate_in_threads(sources, workers)
+    return _evaluate_in_pool(sources, workers, chunksize)
+
+
+def _evaluate_in_pool(sources: Iterable[str], workers: int, chunksize: int) -> Iterator[Result]:
+    with ProcessPoolExecutor(max_workers=workers, initializer=_warm_up) as executor:
+        yield from executor.map(_evaluate_program, enumerate(sources), chunksize=chunksize)
+
+
+def _evaluate_in_threads(sources: Iterable[str], workers: int) -> Iterator[Result]:
+    _warm_up()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_evaluate_program, enumerate(sources))
@@ -0,0 +1,366 @@
+"""
+Precomputed LALR tables of the µLang grammar.
+
+Generated by `python -m core.tables`. Do not edit.
+"""
+# pylint: skip-file
+
+FORMAT_VERSION = 1
+GRAMMAR_HASH = 'dfafa7f268461cb1a66cc8d041ab5f42b4feb3a07ac216ea45ab62cc72ea9d62'
+
+LR_ACTION = [{'fun': 8,
+  'if': 3,
+  'number': 6,
+  'string': 11,
+  'symbol_name': 1,
+  'time': 13,
+  'var': 7},
+ {'$end': -20,
+  'addition': -20,
+  'closing_parenthesis': -20,
+  'comma': -20,
+  'division': -20,
+  'else': -20,
+  'equal_to': -20,
+  'exponentiation': -20,
+  'greater_or_equal_to': -20,
+  'greater_than': -20,
+  'less_or_equal_to': -20,
+  'less_than': -20,
+  'multiplication': -20,
+  'opening_parenthesis': 14,
+  'subtraction': -20,
+  'then': -20},
+ {'$end': -17, 'closing_parenthesis': -17, 'comma': -17, 'else': -17},
+ {'number': 6, 'symbol_name': 1, 'time': 13},
+ {'$end': -3},
+ {'$end': -1},
+ {'$end': -18,
+  'addition': -18,
+  'closing_parenthesis': -18,
+  'comma': -18,
+  'division': -18,
+  'else': -18,
+  'equal_to': -18,
+  'exponentiation': -18,
+  'greater_or_equal_to': -18,
+  'greater_than': -18,
+  'less_or_equal_to': -18,
+  'less_than': -18,
+  'multiplication': -18,
+  'subtraction': -18,
+  'then': -18},
+ {'symbol_name': 17},
+ {'symbol_name': 18},
+ {'$end': -2},
+ {'$end': -16,
+  'addition': 24,
+  'closing_parenthesis': -16,
+  'comma': -16,
+  'division': 20,
+  'else': -16,
+  'equal_to': 28,
+  'exponentiation': 22,
+  'greater_or_equal_to': 23,
+  'greater_than': 26,
+  'less_or_equal_to': 19,
+  'less_than': 27,
+  'multiplication': 21,
+  'subtraction': 25},
+ {'$end': -25, 'closing_parenthesis': -25, 'comma': -25, 'else': -25},
+ {'$end': 0},
+ {'$end': -19,
+  'addition': -19,
+  'closing_parenthesis': -19,
+  'comma': -19,
+  'division': -19,
+  'else': -19,
+  'equal_to': -19,
+  'exponentiation': -19,
+  'greater_or_equal_to': -19,
+  'greater_than': -19,
+  'less_or_equal_to': -19,
+  'less_than': -19,
+  'multiplication': -19,
+  'subtraction': -19,
+  'then': -19},
+ {'closing_parenthesis': 29,
+  'if': 3,
+  'number': 6,
+  'string': 11,
+  'symbol_name': 1,
+  'time': 13},
+ {'then': 32},
+ {'addition': 24,
+  'division': 20,
+  'equal_to': 28,
+  'exponentiation': 22,
+  'greater_or_equal_to': 23,
+  'greater_than': 26,
+  'less_or_equal_to': 19,
+  'less_than': 27,
+  'multiplication': 21,
+  'subtraction': 25},
+ {'assign': 33},
+ {'opening_parenthesis': 34},
+ {'number': 6, 'symbol_name': 1, 'time': 13},
+ {'number': 6, 'symbol_name': 1, 'time': 13},
+ {'number': 6, 'symbol_name': 1, 'time': 13},
+ {'number': 6, 'symbol_name': 1, 'time': 13},
+ {'number': 6, 'symbol_name': 1, 'time': 13},
+ {'number': 6, 'symbol_name': 1, 'time': 13},
+ {'number': 6, 'symbol_name': 1, 'time': 13},
+ {'number': 6, 'symbol_name': 1, 'time': 13},
+ {'number': 6, 'symbol_name': 1, 'time': 13},
+ {'number': 6, 'symbol_name': 1, 'time': 13},
+ {'$end': -22,
+  'addition': -22,
+  'closing_parenthesis': -22,
+  'comma': -22,
+  'division': -22,
+  'else': -22,
+  'equal_to': -22,
+  'exponentiation': -22,
+  'greater_or_equal_to': -22,
+  'greater_than': -22,
+  'less_or_equal_to': -22,
+  'less_than': -22,
+  'multiplication': -22,
+  'subtraction': -22,
+  'then': -22},
+ {'closing_parenthesis': -23, 'comma': -23},
+ {'closing_parenthesis': 46, 'comma': 45},
+ {'if': 3, 'number': 6, 'string': 11, 'symbol_name': 1, 'time': 13},
+ {'if': 3, 'number': 6, 'string': 11, 'symbol_name': 1, 'time': 13},
+ {'closing_parenthesis': 51, 'symbol_name': 49},
+ {'$end': -13,
+  'addition': 24,
+  'closing_parenthesis': -13,
+  'comma': -13,
+  'division': 20,
+  'else': -13,
+  'exponentiation': 22,
+  'multiplication': 21,
+  'subtraction': 25,
+  'then': -13},
+ {'$end': -7,
+  'addition': -7,
+  'closing_parenthesis': -7,
+  'comma': -7,
+  'division': -7,
+  'else': -7,
+  'equal_to': -7,
+  'exponentiation': 22,
+  'greater_or_equal_to': -7,
+  'greater_than': -7,
+  'less_or_equal_to': -7,
+  'less_than': -7,
+  'multiplication': -7,
+  'subtraction': -7,
+  'then': -7},
+ {'$end': -8,
+  'addition': -8,
+  'closing_parenthesis': -8,
+  'comma': -8,
+  'division': -8,
+  'else': -8,
+  'equal_to': -8,
+  'exponentiation': 22,
+  'greater_or_equal_to': -8,
+  'greater_than': -8,
+  'less_or_equal_to': -8,
+  'less_than': -8,
+  'multiplication': -8,
+  'subtraction': -8,
+  'then': -8},
+ {'$end': -6,
+  'addition': -6,
+  'closing_parenthesis': -6,
+  'comma': -6,
+  'division': -6,
+  'else': -6,
+  'equal_to': -6,
+  'exponentiation': -6,
+  'greater_or_equal_to': -6,
+  'greater_than': -6,
+  'less_or_equal_to': -6,
+  'less_than': -6,
+  'multiplication': -6,
+  'subtraction': -6,
+  'then': -6},
+ {'$end': -12,
+  'addition': 24,
+  'closing_parenthesis': -12,
+  'comma': -12,
+  'division': 20,
+  'else': -12,
+  'exponentiation': 22,
+  'multiplication': 21,
+  'subtraction': 25,
+  'then': -12},
+ {'$end': -9,
+  'addition': -9,
+  'closing_parenthesis': -9,
+  'comma': -9,
+  'division': 20,
+  'else': -9,
+  'equal_to': -9,
+  'exponentiation': 22,
+  'greater_or_equal_to': -9,
+  'greater_than': -9,
+  'less_or_equal_to': -9,
+  'less_than': -9,
+  'multiplication': 21,
+  'subtraction': -9,
+  'then': -9},
+ {'$end': -10,
+  'addition': -10,
+  'closing_parenthesis': -10,
+  'comma': -10,
+  'division': 20,
+  'else': -10,
+  'equal_to': -10,
+  'exponentiation': 22,
+  'greater_or_equal_to': -10,
+  'greater_than': -10,
+  'less_or_equal_to': -10,
+  'less_than': -10,
+  'multiplication': 21,
+  'subtraction': -10,
+  'then': -10},
+ {'$end': -11,
+  'addition': 24,
+  'closing_parenthesis': -11,
+  'comma': -11,
+  'division': 20,
+  'else': -11,
+  'exponentiation': 22,
+  'multiplication': 21,
+  'subtraction': 25,
+  'then': -11},
+ {'$end': -14,
+  'addition': 24,
+  'closing_parenthesis': -14,
+  'comma': -14,
+  'division': 20,
+  'else': -14,
+  'exponentiation': 22,
+  'multiplication': 21,
+  'subtraction': 25,
+  'then': -14},
+ {'$end': -15,
+  'addition': 24,
+  'closing_parenthesis': -15,
+  'comma': -15,
+  'division': 20,
+  'else': -15,
+  'exponentiation': 22,
+  'multiplication': 21,
+  'subtraction': 25,
+  'then': -15},
+ {'if': 3, 'number': 6, 'string': 11, 'symbol_name': 1, 'time': 13},
+ {'$end': -21,
+  'addition': -21,
+  'closing_parenthesis': -21,
+  'comma': -21,
+  'division': -21,
+  'else': -21,
+  'equal_to': -21,
+  'exponentiation': -21,
+  'greater_or_equal_to': -21,
+  'greater_than': -21,
+  'less_or_equal_to': -21,
+  'less_than': -21,
+  'multiplication': -21,
+  'subtraction': -21,
+  'then': -21},
+ {'$end': -4, 'closing_parenthesis': -4, 'comma': -4, 'else': 53},
+ {'$end': -26},
+ {'closing_parenthesis': -29, 'comma': -29},
+ {'closing_parenthesis': 55, 'comma': 54},
+ {'assign': 56},
+ {'closing_parenthesis': -24, 'comma': -24},
+ {'if': 3, 'number': 6, 'string': 11, 'symbol_name': 1, 'time': 13},
+ {'symbol_name': 58},
+ {'assign': 59},
+ {'if': 3, 'number': 6, 'string': 11, 'symbol_name': 1, 'time': 13},
+ {'$end': -5, 'closing_parenthesis': -5, 'comma': -5, 'else': -5},
+ {'closing_parenthesis': -30, 'comma': -30},
+ {'if': 3, 'number': 6, 'string': 11, 'symbol_name': 1, 'time': 13},
+ {'$end': -28},
+ {'$end': -27}]
+
+LR_GOTO = [{'arthmetic_expression': 10,
+  'boolean_expression': 2,
+  'expression': 5,
+  'function_declaration': 4,
+  'program': 12,
+  'variable_declaration': 9},
+ {},
+ {},
+ {'arthmetic_expression': 16, 'boolean_expression': 15},
+ {},
+ {},
+ {},
+ {},
+ {},
+ {},
+ {},
+ {},
+ {},
+ {},
+ {'arguments': 31,
+  'arthmetic_expression': 10,
+  'boolean_expression': 2,
+  'expression': 30},
+ {},
+ {},
+ {},
+ {},
+ {'arthmetic_expression': 35},
+ {'arthmetic_expression': 36},
+ {'arthmetic_expression': 37},
+ {'arthmetic_expression': 38},
+ {'arthmetic_expression': 39},
+ {'arthmetic_expression': 40},
+ {'arthmetic_expression': 41},
+ {'arthmetic_expression': 42},
+ {'arthmetic_expression': 43},
+ {'arthmetic_expression': 44},
+ {},
+ {},
+ {},
+ {'arthmetic_expression': 10, 'boolean_expression': 2, 'expression': 47},
+ {'arthmetic_expression': 10, 'boolean_expression': 2, 'expression': 48},
+ {'parameters': 50},
+ {},
+ {},
+ {},
+ {},
+ {},
+ {},
+ {},
+ {},
+ {},
+ {},
+ {'arthmetic_expression': 10, 'boolean_expression': 2, 'expression': 52},
+ {},
+ {},
+ {},
+ {},
+ {},
+ {},
+ {},
+ {'arthmetic_expression': 10, 'boolean_expression': 2, 'expression': 57},
+ {},
+ {},
+ {'arthmetic_expression': 10, 'boolean_expression': 2, 'expression': 60},
+ {},
+ {},
+ {'arthmetic_expression': 10, 'boolean_expression': 2, 'expression': 61},
+ {},
+ {}]
+
+DEFAULT_REDUCTIONS = [0, 0, -17, 0, -3, -1, -18, 0, 0, -2, 0, -25, 0, -19, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+ 0, 0, 0, 0, 0, 0, -22, -23, 0, 0, 0, 0, 0, 0, 0, -6, 0, 0, 0, 0, 0, 0, 0, -21,
+ 0, -26, -29, 0, 0, -24, 0, 0, 0, 0, -5, -30, 0, -28, -27]
@@ -4,9 +4,10 @@ Module implementing the µLang parser. Contains production rules for the languag
 
 from types import NoneType
 from typing import Any
-from rply import ParserGenerator
 
-from core.symbol_table_manager import Symbol, SymbolTableManager, SymbolType
+from core.grammar import GrammarDefinition, ParsingError, TableParser
+from core.lexer import Lexer
+from core.tables import build_tables, load_parser
 from core.tokens.arthmetic import (
     Addition,
     BinaryOperator,
@@ -15,6 +16,7 @@ from core.tokens.arthmetic import (
     Multiplication,
     Subtraction,
 )
+from core.tokens.literal import Time, number_literal, string_literal, time_literal
 from core.tokens.logic import (
     EqualTo,
     GreaterOrEqualTo,
@@ -23,13 +25,18 @@ from core.tokens.logic import (
     LessOrEqualTo,
     LessThan,
 )
-from core.tokens.literal import Duration, Number, String, Time
+from core.tokens.statement import (
+    FunctionCall,
+    FunctionDeclaration,
+    SymbolInvocation,
+    VariableDeclaration,
+)
 
 
 class Parser:
     """µLang Parser with production rules encoded."""
     def __init__(self):
-        self.pg = ParserGenerator(
+        self.pg = GrammarDefinition(
             tokens=[
                 "time",
                 "number",
@@ -41,17 +48,25 @@ class Parser:
                 "string",
                 "if",
                 "then",
+                "else",
                 "greater_than",
                 "greater_or_equal_to",
                 "less_than",
                 "less_or_equal_to",
                 "equal_to",
                 "var",
+                "fun",
                 "assign",
                 "symbol_name",
+                "opening_parenthesis",
+                "closing_parenthesis",
+                "comma",
             ],
 
             precedence=[
+                # `else` binds to the nearest `if`.
+                ('nonassoc', ['then']),
+                ('nonassoc', ['else']),
                 ('left', ['addition', 'subtraction']),
                 ('left', ['multiplication', 'division']),
                 ('left', ['exponentiation']),
@@ -59,8 +74,6 @@ class Parser:
             ],
         )
 
-        self._symbol_table = SymbolTableManager()
-
     def parse(self): # pylint: disable=too-many-locals
         """
         Parse tokens, build AST with production rules.
@@ -81,42 +94,26 @@ class Parser:
         """
         @self.pg.production("program : expression ")
         def one_liner(p) -> Any:
-            return p[0].eval()
-
-        @self.pg.production("program : symbol_name ")
-        def invoke_symbol(p) -> Symbol | None:
-            symbol = self._symbol_table[p[0].value]
-            if symbol is None:
-                raise NameError(f"No variable or function with the name `{p[0].value}` exists.")
-            return symbol.eval()
+            return p[0]
 
         @self.pg.production("program : variable_declaration ")
-        def declare_variable(p) -> object:
-            symbol = self._symbol_table[p[0].name]
-            if symbol is None:
-                raise KeyError(
-                    f"No variable of `{p[0].value}` found in the Symbol Table"
-                    ", even tough it was just created."
-                )
-
-            class Explanation: # pylint: disable=too-few-public-methods
-                """
-                Explanation of variable declaration action with `eval` function.
-                """
-                def __init__(self, symbol: Symbol) -> None:
-                    self.symbol = symbol
-
-                def eval(self) -> str:
-                    """Evaluate to explain a variable creation."""
-                    return f"{self.symbol.name} = {self.symbol.value}"
-
-            explanation = Explanation(symbol=symbol)
-            return explanation.eval()
+        def declare_variable(p) -> VariableDeclaration:
+            return p[0]
+
+        @self.pg.production("program : function_declaration ")
+        def declare_function(p) -> FunctionDeclaration:
+            return p[0]
 
         @self.pg.production("expression : if boolean_expression then expression")
         def condition(p):
             return IfStatement(p[1], p[3])
 
+        @self.pg.production(
+            "expression : if boolean_expression then expression else expression"
+        )
+        def condition_with_alternative(p):
+            return IfStatement(p[1], p[3], p[5])
+
         @self.pg.production(
             "arthmetic_expression : arthmetic_expression subtraction arthmetic_expression"
         )
@@ -186,20 +183,6 @@ class Parser:
             right_operand = p[2]
             return evaluation_type(left_operand, right_operand)
 
-        @self.pg.production('expression : duration')
-        def duration(p):
-            return Duration(p[0])
-
-        @self.pg.production('expression : time')
-        def time_to_expression(p):
-            return Time(p[0].value)
-
-        @self.pg.production('duration : time subtraction time')
-        def time_subtraction(p) -> Duration:
-            time1 = Time(p[0].value)
-            time2 = Time(p[2].value)
-            return time1 - time2
-
         @self.pg.production("expression : arthmetic_expression")
         def expression_from_arthmetic_expression(p):
             return p[0]
@@ -210,37 +193,82 @@ class Parser:
 
         @self.pg.production("arthmetic_expression : number")
         def number(p):
-            return Number(p[0].value)
+            return number_literal(p[0].value)
+
+        @self.pg.production("arthmetic_expression : time")
+        def time(p) -> Time:
+            return time_literal(p[0].value)
+
+        @self.pg.production("arthmetic_expression : symbol_name")
+        def invoke_symbol(p) -> SymbolInvocation:
+            return SymbolInvocation(p[0].value)
+
+        @self.pg.production(
+            "arthmetic_expression : symbol_name opening_parenthesis closing_parenthesis"
+        )
+        @self.pg.production(
+            "arthmetic_expression : symbol_name opening_parenthesis arguments closing_parenthesis"
+        )
+        def call_function(p) -> FunctionCall:
+            arguments = p[2] if len(p) == 4 else []
+            return FunctionCall(p[0].value, arguments)
+
+        @self.pg.production("arguments : expression")
+        def first_argument(p) -> list[Any]:
+            return [p[0]]
+
+        @self.pg.production("arguments : arguments comma expression")
+        def next_argument(p) -> list[Any]:
+            return [*p[0], p[2]]
 
         @self.pg.production("expression : string")
         def string(p):
-            return String(p[0].value)
+            return string_literal(p[0].value)
 
         @self.pg.production("variable_declaration : var symbol_name assign expression")
-        def create_variable(p):
-            variable_name = p[1].value
-            variable_value = p[3].eval()
-
-            symbol = Symbol(
-                name=variable_name,
-                value=variable_value,
-                type=SymbolType.VARIABLE,
-            )
-            self._symbol_table[variable_name] = symbol
-            return symbol
+        def create_variable(p) -> VariableDeclaration:
+            return VariableDeclaration(name=p[1].value, value=p[3])
+
+        @self.pg.production(
+            "function_declaration : fun symbol_name opening_parenthesis closing_parenthesis "
+            "assign expression"
+        )
+        @self.pg.production(
+            "function_declaration : fun symbol_name opening_parenthesis parameters "
+            "closing_parenthesis assign expression"
+        )
+        def create_function(p) -> FunctionDeclaration:
+            parameters = p[3] if len(p) == 7 else []
+            return FunctionDeclaration(name=p[1].value, parameters=parameters, body=p[-1])
+
+        @self.pg.production("parameters : symbol_name")
+        def first_parameter(p) -> list[str]:
+            return [p[0].value]
+
+        @self.pg.production("parameters : parameters comma symbol_name")
+        def next_parameter(p) -> list[str]:
+            return [*p[0], p[2].value]
 
         @self.pg.error
         def error_handle(token):
-            raise ValueError(token)
+            raise ParsingError(token)
 
-    def get_parser(self):
+    def get_parser(self, precomputed: bool = True) -> TableParser:
         """
         Supply an instance of a parser, using µLang production rules and
         tokens.
 
+        Parameters
+        ----------
+        precomputed : bool
+            Whether to use the tables precomputed at build time, if they match
+            the grammar. Otherwise, the tables are constructed with `rply`.
+
         Returns
         -------
-        LRParser
+        TableParser
             An instance of a parser.
         """
-        return self.pg.build()
+        if precomputed:
+            return load_parser(self.pg, Lexer().get_rules())
+        return TableParser(self.pg, **build_tables(self.pg))
@@ -0,0 +1,261 @@
+"""
+Module caching parsed µLang programs on disk, as `__pycache__` does for Python,
+so running the same `.u` file again loads its ASTs instead of lexing and
+parsing every statement.
+
+A cache file is kept in `__ucache__` next to the program, one per numeric mode
+and optimization setting. It is a header, i.e. a magic number, the version of
+the format, a key and a checksum, followed by the pickled statements: their
+lines, their code and their ASTs, which are not resolved to slots of a symbol
+table yet. The key is a hash of the source of the program, the grammar (see
+`core.tables`), the code of the modules building ASTs and the version of
+Python, so a cache is only used for the same program parsed in the same way.
+Cache files are written under another name first and then renamed, and
+a cache which cannot be read, e.g. a corrupted one, is ignored and rewritten.
+
+Cache files are unpickled, so they have to be as trusted as the programs.
+"""
+
+import hashlib
+import os
+import pickle
+import struct
+import sys
+import zlib
+from collections.abc import Iterable, Iterator
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from core import optimizer, parser, tables
+from core.interpreter import Interpreter
+from core.script import split_statements
+from core.snapshot import write_atomically
+from core.tokens import arthmetic, literal, logic, statement
+
+FORMAT_VERSION = 1
+"""Version of the format, increased on every incompatible change."""
+CACHE_DIRECTORY = '__ucache__'
+"""Name of the directory of cache files, next to programs."""
+
+_MAGIC = b'\x89uLC'
+# Magic number, format version, SHA-256 key and CRC-32 of the payload.
+_HEADER = struct.Struct('<4sH32sI')
+
+Statements = list[tuple[int, str, Any]]
+"""Line, code and AST of every statement of a program."""
+
+
+@cache
+def _implementation_digest() -> bytes:
+    """Hash the grammar, the modules building ASTs and the version of Python."""
+    digest = hashlib.sha256()
+    for module in (arthmetic, literal, logic, statement, optimizer, parser):
+        digest.update(Path(str(module.__file__)).read_bytes())
+    digest.update(repr((
+        FORMAT_VERSION, tables.stored_hash(), sys.implementation.cache_tag, pickle.HIGHEST_PROTOCOL,
+    )).encode())
+    return digest.digest()
+
+
+def program_key(source: bytes, interpreter: Interpreter) -> bytes:
+    """
+    Compute the key of a program parsed by an interpreter.
+
+    Parameters
+    ----------
+    source : bytes
+        Source code of the program.
+    interpreter : Interpreter
+        Interpreter parsing it, whose numeric mode and optimization change ASTs.
+
+    Returns
+    -------
+    bytes
+        SHA-256 digest.
+    """
+    digest = hashlib.sha256(_implementation_digest())
+    digest.update(repr((interpreter.optimize, interpreter.numeric.value)).encode())
+    digest.update(source)
+    return digest.digest()
+
+
+def cache_path(
+    path: str | os.PathLike[str],
+    interpreter: Interpreter,
+    directory: str | os.PathLike[str] | None = None,
+) -> Path:
+    """
+    Supply the path of the cache file of a program.
+
+    Parameters
+    ----------
+    path : str | os.PathLike[str]
+        Path of the program.
+    interpreter : Interpreter
+        Interpreter running it.
+    directory : str | os.PathLike[str] | None
+        Directory of cache files. Defaults to `__ucache__` next to the program.
+
+    Returns
+    -------
+    Path
+        Path of the cache file, which may not exist.
+    """
+    program = Path(path)
+    root = Path(directory) if directory is not None else program.parent / CACHE_DIRECTORY
+    variant = interpreter.numeric.value + ('' if interpreter.optimize else '.unoptimized')
+    return root / f'{program.name}.{variant}.ucache'
+
+
+def load(path: str | os.PathLike[str], key: bytes) -> Statements | None:
+    """
+    Read statements from a cache file.
+
+    Parameters
+    ----------
+    path : str | os.PathLike[str]
+        Path of the cache file.
+    key : bytes
+        Key of the program (see `program_key()`).
+
+    Returns
+    -------
+    Statements | None
+        Statements of the program, `None` if the file does not exist, has
+        another key or version, or is corrupted.
+    """
+    try:
+        data = Path(path).read_bytes()
+    except OSError:
+        return None
+    if len(data) < _HEADER.size:
+        return None
+    magic, version, stored_key, checksum = _HEADER.unpack_from(data)
+    payload = memoryview(data)[_HEADER.size:]
+    if magic != _MAGIC or version != FORMAT_VERSION or stored_key != key:
+        return None
+    if zlib.crc32(payload) != checksum:
+        return None
+    try:
+        return pickle.loads(payload)
+    except Exception: # pylint: disable=broad-exception-caught # noqa: BLE001
+        return None
+
+
+def store(path: str | os.PathLike[str], key: bytes, statements: Statements) -> bool:
+    """
+    Write statements into a cache file, replacing it atomically.
+
+    Parameters
+    ----------
+    path : str | os.PathLike[str]
+        Path of the cache file. Its directory is created if needed.
+    key : bytes
+        Key of the program (see `program_key()`).
+    statements : Statements
+        Statements of the program.
+
+    Returns
+    -------
+    bool
+        Whether the cache was written. It is not if ASTs are nested too deeply
+        to be pickled or the directory is not writable.
+    """
+    try:
+        payload = pickle.dumps(statements, protocol=pickle.HIGHEST_PROTOCOL)
+    except RecursionError:
+        return False
+    header = _HEADER.pack(_MAGIC, FORMAT_VERSION, key, zlib.crc32(payload))
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        write_atomically(path, (header, payload), prefix='.ucache-')
+    except OSError:
+        return False
+    return True
+
+
+def run_file(
+    path: str | os.PathLike[str],
+    interpreter: Interpreter | None = None,
+    directory: str | os.PathLike[str] | None = None,
+) -> Iterator[Any]:
+    """
+    Evaluate a `.u` file statement by statement, as `core.script.run_file()`
+    does, with its statements loaded from the cache if it is valid. Otherwise,
+    the statements are parsed as they are evaluated and cached once all of
+    them are evaluated.
+
+    Parameters
+    ----------
+    path : str | os.PathLike[str]
+        Path of the file.
+    interpreter : Interpreter | None
+        Interpreter to evaluate the file with. A fresh one is used if not
+        given.
+    directory : str | os.PathLike[str] | None
+        Directory of cache files. Defaults to `__ucache__` next to the file.
+
+    Returns
+    -------
+    Iterator[Any]
+        Result of every statement, as soon as it is evaluated.
+
+    Raises
+    ------
+    Exception
+        The first error raised by a statement stops the file. A note with
+        the line number of the statement is added to it.
+    """
+    if interpreter is None:
+        interpreter = Interpreter()
+    source = Path(path).read_bytes()
+    key = program_key(source, interpreter)
+    location = cache_path(path, interpreter, directory)
+    statements = load(location, key)
+    if statements is not None:
+        yield from _evaluate(statements, interpreter)
+        return
+
+    statements = []
+    lines = source.decode('utf-8').splitlines(keepends=True)
+    yield from _evaluate(_prepare(lines, interpreter, statements), interpreter)
+    store(location, key, statements)
+
+
+def _prepare(
+    lines: Iterable[str],
+    interpreter: Interpreter,
+    statements: Statements,
+) -> Iterator[tuple[int, str, Any]]:
+    # Statements repeated in a program are parsed once and share their AST.
+    prepared: dict[str, Any] = {}
+    for number, code in split_statements(lines):
+        tree = prepared.get(code)
+        if tree is None:
+            try:
+                tree = prepared[code] = interpreter.prepare(code)
+            except Exception as e:
+                e.add_note(f'In a statement at line {number}: {code}')
+                raise
+        statements.append((number, code, tree))
+        yield number, code, tree
+
+
+def _evaluate(
+    statements: Iterable[tuple[int, str, Any]],
+    interpreter: Interpreter,
+) -> Iterator[Any]:
+    execute, resolve = interpreter.execute, interpreter.resolve
+    diagnostics = interpreter.diagnostics
+    for number, code, tree in statements:
+        if diagnostics is not None:
+            diagnostics.line = number
+        try:
+            # Resolved through the parse cache, so every statement is resolved
+            # and compiled once per shape of the symbol table, as parsed code is.
+            result = execute(resolve(tree, code))
+        except Exception as e:
+            e.add_note(f'In a statement at line {number}: {code}')
+            raise
+        yield result
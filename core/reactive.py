@@ -0,0 +1,168 @@
+"""
+Module with reactive variables. A reactive interpreter remembers the
+expression of every declared variable and the variables it reads, e.g.
+`var worked = end - start` depends on `end` and `start`. Redeclaring
+a variable then recomputes the variables depending on it, and only those,
+in topological order, so no value is left stale.
+
+A variable computed by calling a function depends on the function, which
+in turn depends on the variables and functions its body reads, e.g. after
+`fun pay(hours) = hours * rate`, `var wage = pay(8)` is recomputed when
+either `pay` or `rate` is redeclared.
+"""
+
+from collections.abc import Iterable
+from typing import Any
+
+from core.optimizer import children
+from core.symbol_table_manager import Symbol, SymbolTableManager, SymbolType
+from core.tokens.statement import FunctionCall, SymbolInvocation
+
+
+def dependencies(tree: Any, parameters: Iterable[str] = ()) -> frozenset[str]:
+    """
+    Collect names of variables read and functions called by an expression.
+
+    Parameters
+    ----------
+    tree : Any
+        Root of the AST of an expression, e.g. the body of a function.
+    parameters : Iterable[str]
+        Names of parameters of the function, which shadow symbols.
+
+    Returns
+    -------
+    frozenset[str]
+        Names of invoked symbols and called functions.
+    """
+    names = set()
+    nodes = [tree]
+    while nodes:
+        node = nodes.pop()
+        if isinstance(node, (SymbolInvocation, FunctionCall)):
+            names.add(node.name)
+        nodes.extend(children(node))
+    return frozenset(names.difference(parameters))
+
+
+class DependencyGraph:
+    """
+    Graph of dependencies between variables and functions of one scope.
+
+    Every symbol keeps its own dependencies (see `Symbol.dependencies`),
+    while the graph indexes their reverse, the dependents of every variable,
+    so the variables affected by a change are found without visiting the
+    rest of the graph.
+    """
+    def __init__(self) -> None:
+        # Dictionaries, not sets, so dependents are visited in order of declaration.
+        self._dependents: dict[str, dict[str, None]] = {}
+
+    def affected(self, name: str) -> list[str]:
+        """
+        Find symbols depending on a symbol, directly or transitively.
+
+        Parameters
+        ----------
+        name : str
+            Name of the changed variable or function.
+
+        Returns
+        -------
+        list[str]
+            Names of the dependents in topological order, i.e. every variable
+            comes after all variables it depends on.
+        """
+        order = []
+        visited = {name}
+        # Depth-first search without recursion, as chains may be long.
+        stack = [(name, iter(self._dependents.get(name, ())))]
+        while stack:
+            node, dependents = stack[-1]
+            for dependent in dependents:
+                if dependent not in visited:
+                    visited.add(dependent)
+                    stack.append((dependent, iter(self._dependents.get(dependent, ()))))
+                    break
+            else:
+                stack.pop()
+                order.append(node)
+        order.pop()
+        order.reverse()
+        return order
+
+    def declare(self, symbol_table: SymbolTableManager, symbol: Symbol) -> list[Symbol]:
+        """
+        Declare or redeclare a variable or a function and recompute the
+        variables depending on it. Either all of them are updated or, if
+        recomputing one fails, none is.
+
+        Parameters
+        ----------
+        symbol_table : SymbolTableManager
+            Scope of the symbol, which has to be the active symbol table.
+        symbol : Symbol
+            The variable with its value already evaluated and its expression,
+            or the function.
+
+        Returns
+        -------
+        list[Symbol]
+            The symbol followed by the recomputed variables.
+
+        Raises
+        ------
+        ValueError
+            Raised if the symbol would depend on itself.
+        """
+        kind = 'Function' if symbol.type is SymbolType.FUNCTION else 'Variable'
+        affected = self.affected(symbol.name)
+        if symbol.name in symbol.dependencies:
+            raise ValueError(f"{kind} `{symbol.name}` cannot depend on itself.")
+        cycle = symbol.dependencies.intersection(affected)
+        if cycle:
+            raise ValueError(
+                f"{kind} `{symbol.name}` cannot depend on `{min(cycle)}`, "
+                f"which depends on `{symbol.name}`."
+            )
+
+        previous = symbol_table.local(symbol.name)
+        # Functions depending on the symbol are not recomputed, but variables
+        # calling them are, as they depend on the functions in turn.
+        dependents = [
+            dependent for name in affected
+            if (dependent := symbol_table.local(name)) is not None
+            and dependent.expression is not None
+        ]
+        values = [dependent.value for dependent in dependents]
+        symbol_table.declare(symbol, replace=True)
+        try:
+            for dependent in dependents:
+                dependent.value = dependent.expression.eval()
+        except Exception:
+            if previous is not None:
+                symbol_table.declare(previous, replace=True)
+            for dependent, value in zip(dependents, values):
+                dependent.value = value
+            raise
+
+        if previous is not None:
+            for name in previous.dependencies:
+                self._dependents[name].pop(symbol.name, None)
+        for name in symbol.dependencies:
+            self._dependents.setdefault(name, {})[symbol.name] = None
+        return [symbol, *dependents]
+
+    def forget(self, symbols: Iterable[Symbol]) -> None:
+        """
+        Drop dependencies of variables about to be replaced by plain values,
+        e.g. restored from a snapshot, so they are not recomputed anymore.
+
+        Parameters
+        ----------
+        symbols : Iterable[Symbol]
+            The replaced variables.
+        """
+        for symbol in symbols:
+            for name in symbol.dependencies:
+                self._dependents.get(name, {}).pop(symbol.name, None)
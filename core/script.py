@@ -0,0 +1,140 @@
+"""
+Module running µLang scripts, i.e. `.u` files with many statements separated by
+newlines or semicolons. Scripts are read and evaluated lazily, statement by
+statement, so results are streamed and memory use does not grow with the size
+of a script.
+"""
+
+import re
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from core.interpreter import Interpreter
+
+_DELIMITERS = re.compile(r'[";]')
+_READ_BUFFER_SIZE = 1024 * 1024
+
+
+def split_statements(lines: Iterable[str]) -> Iterator[tuple[int, str]]:
+    """
+    Split lines of source code into statements.
+
+    Statements are separated by newlines or semicolons, except for these inside
+    strings, which may span many lines.
+
+    Parameters
+    ----------
+    lines : Iterable[str]
+        Lines of source code, e.g. an open file.
+
+    Returns
+    -------
+    Iterator[tuple[int, str]]
+        Number of the line each statement starts at and the statement.
+    """
+    buffer = ''
+    start = 1
+    for number, line in enumerate(lines, start=1):
+        if not buffer:
+            start = number
+        text = buffer + line
+        buffer = ''
+        if '"' not in text and ';' not in text:
+            statement = text.strip()
+            if statement:
+                yield start, statement
+            continue
+
+        in_string = False
+        begin = 0
+        for match in _DELIMITERS.finditer(text):
+            if match.group() == '"':
+                in_string = not in_string
+            elif not in_string:
+                statement = text[begin:match.start()].strip()
+                if statement:
+                    yield start, statement
+                begin = match.end()
+                start = number
+
+        if in_string:
+            buffer = text[begin:]
+            continue
+        statement = text[begin:].strip()
+        if statement:
+            yield start, statement
+
+    if buffer.strip():
+        yield start, buffer.strip()
+
+
+def run_script(lines: Iterable[str], interpreter: Interpreter | None = None) -> Iterator[Any]:
+    """
+    Evaluate statements of a script one by one, sharing one symbol table.
+
+    Parameters
+    ----------
+    lines : Iterable[str]
+        Lines of source code, e.g. an open file.
+    interpreter : Interpreter | None
+        Interpreter to evaluate the script with. A fresh one is used if not
+        given.
+
+    Returns
+    -------
+    Iterator[Any]
+        Result of every statement, as soon as it is evaluated.
+
+    Raises
+    ------
+    Exception
+        The first error raised by a statement stops the script. A note with
+        the line number of the statement is added to it. Warnings collected by
+        the interpreter's diagnostics do not stop it and are reported at the
+        line of their statement.
+    """
+    if interpreter is None:
+        interpreter = Interpreter()
+    diagnostics = interpreter.diagnostics
+    for number, statement in split_statements(lines):
+        if diagnostics is not None:
+            diagnostics.line = number
+        try:
+            result = interpreter.evaluate(statement)
+        except Exception as e:
+            e.add_note(f'In a statement at line {number}: {statement}')
+            raise
+        yield result
+
+
+def run_file(
+    path: str,
+    interpreter: Interpreter | None = None,
+    cache: bool = False,
+) -> Iterator[Any]:
+    """
+    Evaluate a `.u` file statement by statement, reading it in chunks.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file.
+    interpreter : Interpreter | None
+        Interpreter to evaluate the file with. A fresh one is used if not
+        given.
+    cache : bool
+        Whether parsed statements are cached on disk and loaded from the cache
+        on later runs (see `core.program_cache`). The file is then read whole.
+
+    Returns
+    -------
+    Iterator[Any]
+        Result of every statement, as soon as it is evaluated.
+    """
+    if cache:
+        # Imported on demand, as it imports this module.
+        from core import program_cache  # pylint: disable=import-outside-toplevel
+        yield from program_cache.run_file(path, interpreter)
+        return
+    with open(path, encoding='utf-8', buffering=_READ_BUFFER_SIZE) as file:
+        yield from run_script(file, interpreter)
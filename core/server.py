@@ -0,0 +1,217 @@
+"""
+Module with an asyncio server evaluating µLang for many clients at once, over
+TCP or a Unix socket. Every connection is a session with a symbol table of
+its own, while all sessions share one lexer and one parser, built when the
+server starts.
+
+The protocol is line-based: a client sends one line of code per request and
+receives one line of JSON per response, in the order of requests, e.g.
+`{"status": "ok", "value": "1h30m"}` or `{"status": "error", "message":
+"You cannot divide by 0."}`. Statuses are values of `Status`.
+
+Run with `python -m core.server --port 8765` or `python -m core.server --unix
+/tmp/ulang.sock`.
+"""
+
+import asyncio
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from core.batch import Status, classify, describe
+from core.interpreter import Interpreter, shared_lexer, shared_parser
+from core.symbol_table_manager import SymbolTableManager
+
+DEFAULT_TIMEOUT = 1.0
+DEFAULT_WORKERS = 4
+DEFAULT_MAX_PENDING = 64
+DEFAULT_LINE_LIMIT = 2 ** 16
+
+
+def response(status: Status, value: Any = None, message: str = '') -> bytes:
+    """Encode a response as a line of JSON."""
+    body: dict[str, str] = {'status': status.value}
+    if status is Status.OK:
+        body['value'] = str(value)
+    else:
+        body['message'] = message
+    return json.dumps(body, ensure_ascii=False).encode() + b'\n'
+
+
+class Server:
+    """
+    Server of µLang sessions.
+
+    Evaluations run on a bounded pool of worker threads, so the event loop
+    keeps serving connections while code is evaluated. Requests of a session
+    are evaluated one at a time, in order, while sessions are evaluated
+    concurrently, so a slow evaluation, e.g. of a deeply recursive function,
+    occupies one worker and delays only its own session. With the GIL,
+    workers share one core, so they do not evaluate faster, but they take
+    turns.
+
+    Parameters
+    ----------
+    timeout : float
+        Seconds an evaluation may take, including waiting for a worker, before
+        the client receives a timeout. The evaluation itself cannot be
+        interrupted, so it still finishes, keeping its worker busy, and its
+        declarations take effect before the next request of the session is
+        evaluated.
+    max_pending : int
+        Maximal number of evaluations submitted to the workers at once. Sessions
+        over the limit stop reading requests until an evaluation finishes, so
+        clients sending faster than the server evaluates are slowed down by
+        TCP flow control instead of filling the memory of the server.
+    line_limit : int
+        Maximal length of a request in bytes. A longer request closes the
+        connection.
+    reactive : bool
+        Whether sessions recompute variables depending on redeclared ones.
+    workers : int
+        Number of worker threads, i.e. of sessions evaluated at once. Only as
+        many slow evaluations at once stall other sessions.
+    """
+    def __init__( # pylint: disable=too-many-arguments
+        self,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        line_limit: int = DEFAULT_LINE_LIMIT,
+        reactive: bool = False,
+        workers: int = DEFAULT_WORKERS,
+    ) -> None:
+        if timeout <= 0 or max_pending < 1 or line_limit < 1 or workers < 1:
+            raise ValueError(
+                "Timeout, pending evaluations, line limit and workers must be positive."
+            )
+        self.timeout = timeout
+        self.line_limit = line_limit
+        self.reactive = reactive
+        self._pending = asyncio.Semaphore(max_pending)
+        self._workers = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='µLang')
+        self.sessions = 0
+        # Built before the first session, so no request waits for the grammar.
+        shared_lexer()
+        shared_parser()
+
+    async def start(
+        self,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        path: str | None = None,
+    ) -> asyncio.Server:
+        """
+        Start listening for connections.
+
+        Parameters
+        ----------
+        host : str
+            Address to listen on.
+        port : int
+            TCP port to listen on, any free one if zero.
+        path : str | None
+            Path of a Unix socket to listen on instead of TCP.
+
+        Returns
+        -------
+        asyncio.Server
+            The listening server, whose `sockets` tell the address.
+        """
+        if path is not None:
+            return await asyncio.start_unix_server(self.handle, path, limit=self.line_limit)
+        return await asyncio.start_server(self.handle, host, port, limit=self.line_limit)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve requests of one connection until the client disconnects."""
+        interpreter = Interpreter(SymbolTableManager(), reactive=self.reactive)
+        evaluation: asyncio.Future | None = None
+        self.sessions += 1
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    writer.write(response(
+                        Status.ERROR,
+                        message=f"Request is longer than {self.line_limit} bytes.",
+                    ))
+                    break
+                if not line:
+                    break
+                if evaluation is not None:
+                    # An evaluation which timed out has to finish first.
+                    await asyncio.wait([evaluation])
+                code = line.decode(errors='replace').rstrip('\r\n')
+                async with self._pending:
+                    evaluation = asyncio.get_running_loop().run_in_executor(
+                        self._workers, interpreter.evaluate, code
+                    )
+                    writer.write(await self.respond(evaluation))
+                # Stop reading requests of a client that does not read responses.
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.sessions -= 1
+            writer.close()
+
+    async def respond(self, evaluation: asyncio.Future) -> bytes:
+        """Wait for an evaluation, at most for the timeout, and encode the response."""
+        try:
+            value = await asyncio.wait_for(asyncio.shield(evaluation), self.timeout)
+        except TimeoutError:
+            return response(
+                Status.TIMEOUT,
+                message=f"Evaluation took longer than {self.timeout} s.",
+            )
+        except Exception as e: # pylint: disable=broad-exception-caught # noqa: BLE001
+            return response(classify(e), message=describe(e))
+        return response(Status.OK, value)
+
+    def close(self) -> None:
+        """Stop the workers once evaluations in progress finish."""
+        self._workers.shutdown(wait=False, cancel_futures=True)
+
+
+async def serve(server: Server, host: str, port: int, path: str | None) -> None:
+    """Serve until cancelled."""
+    listening = await server.start(host, port, path)
+    address = path
+    if address is None:
+        host, port = listening.sockets[0].getsockname()[:2]
+        address = f'{host}:{port}'
+    print(f'µLang server listening on {address}.', flush=True)
+    try:
+        async with listening:
+            await listening.serve_forever()
+    finally:
+        server.close()
+
+
+def main(arguments: list[str] | None = None) -> int:
+    """Run the server until interrupted."""
+    import argparse  # pylint: disable=import-outside-toplevel
+
+    argument_parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    argument_parser.add_argument('--host', default='127.0.0.1')
+    argument_parser.add_argument('--port', type=int, default=8765)
+    argument_parser.add_argument('--unix', metavar='PATH', help='listen on a Unix socket')
+    argument_parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT)
+    argument_parser.add_argument('--max-pending', type=int, default=DEFAULT_MAX_PENDING)
+    argument_parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS)
+    argument_parser.add_argument('--reactive', action='store_true')
+    options = argument_parser.parse_args(arguments)
+
+    server = Server(
+        options.timeout, options.max_pending, reactive=options.reactive, workers=options.workers
+    )
+    try:
+        asyncio.run(serve(server, options.host, options.port, options.unix))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""
+Module saving variables of a session into a snapshot file and restoring them,
+so a long-running session survives restarting the interpreter.
+
+A snapshot is a header, i.e. a magic number, the version of the format,
+the version of `marshal` and a checksum, followed by the variables marshalled
+column by column: names, tags telling how to restore the values, and
+the values, with times and durations stored as numbers of minutes and
+decimals as text. Marshalling a few flat lists keeps snapshots compact and
+restoring them fast, e.g. a hundred thousand variables in milliseconds.
+
+Functions are not saved, since they hold ASTs, nor are expressions of
+reactive variables, which are restored as plain values.
+"""
+
+import gc
+import marshal
+import os
+import struct
+import tempfile
+import zlib
+from collections.abc import Iterable
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+from core.symbol_table_manager import Scope, Symbol, SymbolTableManager, SymbolType
+from core.tokens.literal import Duration, Time
+
+FORMAT_VERSION = 2
+"""Version of the format, increased on every incompatible change."""
+_READABLE_VERSIONS = (1, 2)
+"""Versions which can be restored, as version 2 only added decimals."""
+
+_MAGIC = b'\x89uLS'
+# Magic number, format version, marshal version and CRC-32 of the payload.
+_HEADER = struct.Struct('<4sHHI')
+
+# Tags of values: stored as they are, as numbers of minutes or as text.
+_PLAIN = 0
+_TIME = 1
+_DURATION = 2
+_DECIMAL = 3
+_DECODERS: dict[int, type[Time] | type[Duration] | type[Decimal]] = {
+    _TIME: Time,
+    _DURATION: Duration,
+    _DECIMAL: Decimal,
+}
+_PLAIN_TYPES = (float, int, str, bool, type(None))
+
+
+def save(symbol_table: SymbolTableManager, path: str | Path) -> list[str]:
+    """
+    Save variables of a symbol table into a snapshot file.
+
+    The file is written under another name first and then renamed, so
+    an interrupted save leaves the previous snapshot intact.
+
+    Parameters
+    ----------
+    symbol_table : SymbolTableManager
+        Symbol table whose variables, not those of enclosing scopes, are saved.
+    path : str | Path
+        Path of the snapshot file, replaced if it exists.
+
+    Returns
+    -------
+    list[str]
+        Names of functions, which were not saved.
+
+    Raises
+    ------
+    ValueError
+        Raised if a variable holds a value µLang does not produce, e.g. one
+        declared through the Python API.
+    """
+    names: list[str] = []
+    tags = bytearray()
+    values: list[Any] = []
+    functions: list[str] = []
+    for symbol in symbol_table.slots:
+        if symbol.type is not SymbolType.VARIABLE:
+            functions.append(symbol.name)
+            continue
+        value = symbol.value
+        if isinstance(value, (Time, Duration)):
+            tags.append(_TIME if isinstance(value, Time) else _DURATION)
+            value = value.total_minutes
+        elif isinstance(value, Decimal):
+            tags.append(_DECIMAL)
+            value = str(value)
+        elif isinstance(value, _PLAIN_TYPES):
+            tags.append(_PLAIN)
+        else:
+            raise ValueError( # noqa: TRY004
+                f"Cannot save variable `{symbol.name}` of type `{type(value).__name__}`."
+            )
+        names.append(symbol.name)
+        values.append(value)
+
+    payload = marshal.dumps((names, bytes(tags), values))
+    header = _HEADER.pack(_MAGIC, FORMAT_VERSION, marshal.version, zlib.crc32(payload))
+    write_atomically(path, (header, payload), prefix='.snapshot-')
+    return functions
+
+
+def write_atomically(path: str | os.PathLike[str], chunks: Iterable[bytes], prefix: str) -> None:
+    """
+    Write a file under another name in the same directory first and then
+    rename it, so an interrupted write leaves the previous file intact.
+
+    Parameters
+    ----------
+    path : str | os.PathLike[str]
+        Path of the file, replaced if it exists.
+    chunks : Iterable[bytes]
+        Contents of the file.
+    prefix : str
+        Prefix of the name of the temporary file.
+    """
+    file = tempfile.NamedTemporaryFile( # pylint: disable=consider-using-with # noqa: SIM115
+        'wb', dir=os.path.dirname(os.path.abspath(path)), prefix=prefix, delete=False
+    )
+    try:
+        with file:
+            file.writelines(chunks)
+        os.replace(file.name, path)
+    except BaseException:
+        os.unlink(file.name)
+        raise
+
+
+def load(path: str | Path, symbol_table: SymbolTableManager | None = None) -> SymbolTableManager:
+    """
+    Restore variables from a snapshot file.
+
+    Parameters
+    ----------
+    path : str | Path
+        Path of the snapshot file.
+    symbol_table : SymbolTableManager | None
+        Symbol table to declare the variables in, replacing variables with
+        the same names. A new one is created if not given.
+
+    Returns
+    -------
+    SymbolTableManager
+        Symbol table with the restored variables.
+
+    Raises
+    ------
+    ValueError
+        Raised if the file is not a snapshot, is corrupted or was saved in
+        an incompatible version. Nothing is declared then.
+    """
+    data = Path(path).read_bytes()
+    if len(data) < _HEADER.size:
+        raise ValueError(f"`{path}` is not a µLang snapshot.")
+    magic, version, marshal_version, checksum = _HEADER.unpack_from(data)
+    if magic != _MAGIC:
+        raise ValueError(f"`{path}` is not a µLang snapshot.")
+    if version not in _READABLE_VERSIONS or marshal_version > marshal.version:
+        raise ValueError(
+            f"Snapshot `{path}` has version {version}, but only versions "
+            f"{', '.join(map(str, _READABLE_VERSIONS))} can be restored."
+        )
+    payload = memoryview(data)[_HEADER.size:]
+    if zlib.crc32(payload) != checksum:
+        raise ValueError(f"Snapshot `{path}` is corrupted.")
+    names, tags, values = marshal.loads(payload)
+
+    if symbol_table is None:
+        symbol_table = SymbolTableManager()
+    variable = SymbolType.VARIABLE
+    scope = Scope.GLOBAL if symbol_table.parent is None else Scope.LOCAL
+    # Symbols form no reference cycles, so collecting garbage while creating
+    # them would only traverse them over and over.
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        symbol_table.declare_many([
+            Symbol(name, variable, value if tag == _PLAIN else _DECODERS[tag](value), scope)
+            for name, tag, value in zip(names, tags, values)
+        ])
+    finally:
+        if collecting:
+            gc.enable()
+    return symbol_table
@@ -3,10 +3,16 @@ Module with defining symbol management, including Symbol Table Manager,
 symbol definition, symbol types and so on.
 """
 
+from collections.abc import Iterable
+from contextvars import ContextVar
 from dataclasses import dataclass
 from enum import Enum
+from operator import attrgetter
 from typing import Any
 
+from core.diagnostics import warn
+
+
 class SymbolType(Enum):
     """All available symbol types."""
     VARIABLE = 0
@@ -17,7 +23,7 @@ class Scope(Enum):
     LOCAL = 0
     GLOBAL = 1
 
-@dataclass
+@dataclass(slots=True)
 class Symbol:
     """Representation of a named entity such as a variable or function."""
     name: str
@@ -25,22 +31,54 @@ class Symbol:
     value: Any
     scope: Scope | None = None
     created_at_line: int | None = None
+    expression: Any = None
+    """AST the value was evaluated from, kept by reactive interpreters."""
+    dependencies: frozenset[str] = frozenset()
+    """Names of variables and functions the expression, or the body of a function, reads."""
 
     def eval(self) -> Any:
-        """Evaluate symbol to its value."""
-        if self.type == SymbolType.VARIABLE:
-            return self.value
-        raise NotImplementedError
+        """Evaluate symbol to its value, the value of a variable or a callable function."""
+        return self.value
+
+
+_NAME = attrgetter('name')
+_TYPE = attrgetter('type')
 
 
 class SymbolTableManager:
     """
-    Class manages symbols (named entities), such as variable or functions.
+    Class manages symbols (named entities), such as variable or functions,
+    declared in one scope. A nested scope has a parent scope, which supplies
+    symbols not declared in the nested one.
+
+    Every symbol is stored in a slot, numbered in order of declaration. A slot
+    keeps its number when the symbol is redeclared, so a name resolved to
+    a slot once (see `resolve()`) is then read by indexing `slots`.
+
+    Parameters
+    ----------
+    parent : SymbolTableManager | None
+        Enclosing scope. The symbol table is the global scope if not given.
     """
-    def __init__(self) -> None:
-        self._symbol_table: dict[str, Symbol] = {}
+    def __init__(self, parent: 'SymbolTableManager | None' = None) -> None:
+        self.parent = parent
+        self.slots: list[Symbol] = []
+        self._indexes: dict[str, int] = {}
+        self._shape: tuple[tuple[str, SymbolType], ...] = ()
         super().__init__()
 
+    @property
+    def shape(self) -> tuple[Any, ...]:
+        """
+        Names and types of all symbols in order of declaration, preceded by
+        the shape of the parent scope in nested scopes. The same object is
+        returned by the global scope until a symbol is added or changes its
+        type.
+        """
+        if self.parent is None:
+            return self._shape
+        return (self.parent.shape, self._shape)
+
     def __setitem__(self, key: object, value: object) -> None:
         if not isinstance(key, str):
             raise KeyError(
@@ -54,22 +92,209 @@ class SymbolTableManager:
                 "Only instances of Symbol may be added."
             )
 
-        if value.name in self._symbol_table:
-            self._symbol_table[value.name] = value
-            raise UserWarning(
-                f"Symbol with the name `{value.name}` already exists. "
-                "Replacing with a new value."
-            )
+        self.declare(value)
+
+    def declare(self, symbol: Symbol, replace: bool = False) -> None:
+        """
+        Add a symbol to this scope, shadowing symbols of the same name in
+        enclosing scopes.
+
+        Parameters
+        ----------
+        symbol : Symbol
+            Symbol to be added. Its scope is set if not given.
+        replace : bool
+            Whether replacing a symbol with the same name is expected, so no
+            warning is raised.
 
-        self._symbol_table[value.name] = value
+        Raises
+        ------
+        UserWarning
+            Raised if a symbol with the same name was already declared in this
+            scope, unless `replace` is true or the warning is collected (see
+            `core.diagnostics`). It is replaced with the new one nonetheless.
+        """
+        if symbol.scope is None:
+            symbol.scope = Scope.GLOBAL if self.parent is None else Scope.LOCAL
+
+        index = self._indexes.get(symbol.name)
+        if index is None:
+            self._indexes[symbol.name] = len(self.slots)
+            self.slots.append(symbol)
+            self._shape += ((symbol.name, symbol.type),)
+            return
+
+        previous = self.slots[index]
+        self.slots[index] = symbol
+        if previous.type != symbol.type:
+            self._shape = tuple((slot.name, slot.type) for slot in self.slots)
+        if replace:
+            return
+        warn(
+            f"Symbol with the name `{symbol.name}` already exists. "
+            "Replacing with a new value."
+        )
+
+    def declare_many(self, symbols: Iterable[Symbol]) -> None:
+        """
+        Add many symbols to this scope at once, e.g. restored from a snapshot,
+        replacing symbols with the same names without warnings. Unlike
+        declaring them one by one, the shape is rebuilt only once.
+
+        Parameters
+        ----------
+        symbols : Iterable[Symbol]
+            Symbols to be added. Their scopes are set if not given.
+        """
+        symbols = list(symbols)
+        scope = Scope.GLOBAL if self.parent is None else Scope.LOCAL
+        for symbol in symbols:
+            if symbol.scope is None:
+                symbol.scope = scope
+
+        names = {symbol.name for symbol in symbols}
+        if len(names) == len(symbols) and names.isdisjoint(self._indexes):
+            # Only new names, so slots are appended in bulk.
+            start = len(self.slots)
+            self._indexes.update(
+                (symbol.name, index) for index, symbol in enumerate(symbols, start)
+            )
+            self.slots.extend(symbols)
+        else:
+            for symbol in symbols:
+                index = self._indexes.get(symbol.name)
+                if index is None:
+                    self._indexes[symbol.name] = len(self.slots)
+                    self.slots.append(symbol)
+                else:
+                    self.slots[index] = symbol
+        self._shape = tuple(zip(map(_NAME, self.slots), map(_TYPE, self.slots)))
 
     def __getitem__(self, value: object) -> Symbol | None:
-        if isinstance(value, str):
-            return self._symbol_table.get(value, None)
-        raise NotImplementedError
+        if not isinstance(value, str):
+            raise NotImplementedError
+        scope: SymbolTableManager | None = self
+        while scope is not None:
+            index = scope._indexes.get(value)
+            if index is not None:
+                return scope.slots[index]
+            scope = scope.parent
+        return None
+
+    def local(self, name: str) -> Symbol | None:
+        """Supply the symbol with the given name declared in this scope, not an enclosing one."""
+        index = self._indexes.get(name)
+        return None if index is None else self.slots[index]
+
+    def resolve(self, name: str) -> tuple[int, int] | None:
+        """
+        Find the slot of a variable visible in this scope.
+
+        Parameters
+        ----------
+        name : str
+            Name of the variable.
+
+        Returns
+        -------
+        tuple[int, int] | None
+            Number of scopes up from this one (see `enclosing()`) and index
+            of the slot in that scope, or `None` if no variable with the name
+            is declared.
+        """
+        scope: SymbolTableManager | None = self
+        depth = 0
+        while scope is not None:
+            index = scope._indexes.get(name) # pylint: disable=protected-access
+            if index is not None:
+                if scope.slots[index].type is SymbolType.VARIABLE:
+                    return depth, index
+                return None
+            scope = scope.parent
+            depth += 1
+        return None
+
+    def enclosing(self, depth: int) -> 'SymbolTableManager':
+        """
+        Supply an enclosing scope.
+
+        Parameters
+        ----------
+        depth : int
+            Number of scopes up from this one, zero for this scope.
+
+        Returns
+        -------
+        SymbolTableManager
+            The enclosing scope.
+
+        Raises
+        ------
+        LookupError
+            Raised if there are fewer enclosing scopes.
+        """
+        scope = self
+        for _ in range(depth):
+            if scope.parent is None:
+                raise LookupError(f"There is no scope {depth} levels up.")
+            scope = scope.parent
+        return scope
+
+    def lookup(self, name: str) -> Any:
+        """
+        Evaluate the symbol with the given name.
+
+        Parameters
+        ----------
+        name : str
+            Name of the symbol.
+
+        Returns
+        -------
+        Any
+            Value of the symbol.
+
+        Raises
+        ------
+        NameError
+            Raised if there is no symbol with the name.
+        """
+        symbol = self[name]
+        if symbol is None:
+            raise NameError(f"No variable or function with the name `{name}` exists.")
+        return symbol.eval()
 
     def __repr__(self) -> str:
         output = ''
-        for key, value in self._symbol_table.items():
-            output += key + ' ' + str(value)
+        for symbol in self.slots:
+            output += symbol.name + ' ' + str(symbol)
         return output
+
+
+active_symbol_table: ContextVar[SymbolTableManager] = ContextVar('active_symbol_table')
+"""Symbol table of the code being evaluated, set by the interpreter evaluating it."""
+
+
+def lookup(name: str) -> Any:
+    """
+    Evaluate a symbol of the active symbol table.
+
+    Parameters
+    ----------
+    name : str
+        Name of the symbol.
+
+    Returns
+    -------
+    Any
+        Value of the symbol.
+
+    Raises
+    ------
+    NameError
+        Raised if there is no such symbol or no code is being evaluated.
+    """
+    symbol_table = active_symbol_table.get(None)
+    if symbol_table is None:
+        raise NameError(f"Cannot evaluate `{name}` outside of an interpreter.")
+    return symbol_table.lookup(name)
@@ -0,0 +1,191 @@
+"""
+Module with precomputed LALR tables of the µLang grammar.
+
+The tables are generated at build time with `rply` into `core/parse_tables.py`,
+keyed on a hash of the grammar and the token rules, so the interpreter starts
+without importing `rply` or constructing any table. Run
+`python -m core.tables` to regenerate the tables after changing the grammar, or
+`python -m core.tables --check` to verify they are up to date.
+"""
+
+import hashlib
+import os
+import sys
+import warnings
+from typing import Any
+
+from core.grammar import GrammarDefinition, TableParser
+from core.lexer import Lexer, TokenRules
+
+FORMAT_VERSION = 1
+TABLES_PATH = os.path.join(os.path.dirname(__file__), 'parse_tables.py')
+
+
+def grammar_hash(grammar: GrammarDefinition, token_rules: TokenRules) -> str:
+    """
+    Compute a hash identifying a grammar together with the tables format.
+
+    Parameters
+    ----------
+    grammar : GrammarDefinition
+        Tokens, precedence and production rules.
+    token_rules : TokenRules
+        Rules of the lexer producing the tokens.
+
+    Returns
+    -------
+    str
+        Hexadecimal digest.
+    """
+    description = (
+        FORMAT_VERSION,
+        grammar.tokens,
+        grammar.precedence,
+        [(name, symbols, precedence) for name, symbols, _, precedence in grammar.productions],
+        token_rules.rules,
+        token_rules.ignore_rules,
+    )
+    return hashlib.sha256(repr(description).encode()).hexdigest()
+
+
+def build_tables(grammar: GrammarDefinition) -> dict[str, Any]:
+    """
+    Construct LALR tables of a grammar with `rply`.
+
+    Parameters
+    ----------
+    grammar : GrammarDefinition
+        Tokens, precedence and production rules.
+
+    Returns
+    -------
+    dict[str, Any]
+        Tables under keys `lr_action`, `lr_goto` and `default_reductions`.
+    """
+    from rply import ParserGenerator  # pylint: disable=import-outside-toplevel
+
+    parser_generator = ParserGenerator(grammar.tokens, grammar.precedence)
+    for name, symbols, func, precedence in grammar.productions:
+        parser_generator.production(f"{name} : {' '.join(symbols)}", precedence)(func)
+    table = parser_generator.build().lr_table
+    return {
+        'lr_action': table.lr_action,
+        'lr_goto': table.lr_goto,
+        'default_reductions': table.default_reductions,
+    }
+
+
+def load_parser(grammar: GrammarDefinition, token_rules: TokenRules) -> TableParser:
+    """
+    Supply a parser of a grammar, using the precomputed tables if they match
+    the grammar and constructing the tables with `rply` otherwise.
+
+    Parameters
+    ----------
+    grammar : GrammarDefinition
+        Tokens, precedence and production rules.
+    token_rules : TokenRules
+        Rules of the lexer producing the tokens.
+
+    Returns
+    -------
+    TableParser
+        An instance of a parser.
+    """
+    if stored_hash() == grammar_hash(grammar, token_rules):
+        from core import parse_tables  # pylint: disable=import-outside-toplevel
+        return TableParser(
+            grammar,
+            parse_tables.LR_ACTION,
+            parse_tables.LR_GOTO,
+            parse_tables.DEFAULT_REDUCTIONS,
+        )
+
+    warnings.warn(
+        "Precomputed parse tables are out of date, constructing them at runtime. "
+        "Run `python -m core.tables` to regenerate them.",
+        stacklevel=2,
+    )
+    return TableParser(grammar, **build_tables(grammar))
+
+
+def write_tables(path: str = TABLES_PATH) -> str:
+    """
+    Generate the tables of the µLang grammar and save them as a Python module.
+
+    Parameters
+    ----------
+    path : str
+        Path of the module to be written.
+
+    Returns
+    -------
+    str
+        Hash of the grammar the tables were generated for.
+    """
+    import pprint  # pylint: disable=import-outside-toplevel
+
+    grammar, token_rules = current_grammar()
+    digest = grammar_hash(grammar, token_rules)
+    tables = build_tables(grammar)
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(
+            '"""\n'
+            'Precomputed LALR tables of the µLang grammar.\n\n'
+            'Generated by `python -m core.tables`. Do not edit.\n'
+            '"""\n'
+            '# pylint: skip-file\n\n'
+            f'FORMAT_VERSION = {FORMAT_VERSION}\n'
+            f'GRAMMAR_HASH = {digest!r}\n\n'
+            f"LR_ACTION = {pprint.pformat(tables['lr_action'])}\n\n"
+            f"LR_GOTO = {pprint.pformat(tables['lr_goto'])}\n\n"
+            f"DEFAULT_REDUCTIONS = {pprint.pformat(tables['default_reductions'], compact=True)}\n"
+        )
+    return digest
+
+
+def stored_hash() -> str | None:
+    """Supply the grammar hash of the precomputed tables, if there are any."""
+    try:
+        from core import parse_tables  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+    if parse_tables.FORMAT_VERSION != FORMAT_VERSION:
+        return None
+    return parse_tables.GRAMMAR_HASH
+
+
+def current_grammar() -> tuple[GrammarDefinition, TokenRules]:
+    """Supply the µLang grammar and token rules as defined in the code."""
+    from core.parser import Parser  # pylint: disable=import-outside-toplevel
+
+    parser = Parser()
+    parser.parse()
+    return parser.pg, Lexer().get_rules()
+
+
+def main() -> int:
+    """Regenerate the tables if the grammar changed, or only check them with `--check`."""
+    import argparse  # pylint: disable=import-outside-toplevel
+
+    argument_parser = argparse.ArgumentParser(description=__doc__)
+    argument_parser.add_argument(
+        '--check',
+        action='store_true',
+        help='exit with status 1 if the tables are out of date instead of regenerating them',
+    )
+    arguments = argument_parser.parse_args()
+
+    digest = grammar_hash(*current_grammar())
+    if stored_hash() == digest:
+        print(f'Parse tables are up to date ({digest[:12]}).')
+        return 0
+    if arguments.check:
+        print('Parse tables are out of date. Run `python -m core.tables`.')
+        return 1
+    print(f'Parse tables regenerated ({write_tables()[:12]}).')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,324 @@
+"""
+Module aggregating timesheets, e.g. clock-in and clock-out rows of CSV files or
+logs, with a µLang expression evaluated for every row, e.g. `end - start`.
+Files are read lazily, row by row, and durations are aggregated as they are
+evaluated, so memory use does not grow with the number of rows.
+
+The expression is parsed and compiled once, with the columns it reads
+declared as variables of a scope of their own, so a row only assigns them and
+calls the compiled expression instead of lexing and parsing code.
+
+Run with `python -m core.timesheet shifts.csv --group-by employee`.
+"""
+
+import csv
+import re
+import sys
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from core.interpreter import Interpreter
+from core.reactive import dependencies
+from core.symbol_table_manager import Symbol, SymbolTableManager, SymbolType
+from core.tokens.literal import Duration, Time
+
+_READ_BUFFER_SIZE = 1024 * 1024
+_PARSED_CACHE_SIZE = 4096
+
+parse_time: Callable[[str], Time] = lru_cache(maxsize=_PARSED_CACHE_SIZE)(Time)
+"""
+Parse a time, e.g. `'8:15'`. A day has only 1440 minutes, so texts of times
+repeat and each is parsed once.
+"""
+parse_duration: Callable[[str], Duration] = lru_cache(maxsize=_PARSED_CACHE_SIZE)(Duration)
+"""Parse a duration, e.g. `'1h30m'`, each text once."""
+
+
+@dataclass(slots=True)
+class Aggregate:
+    """Number, total, shortest and longest of durations, kept in minutes."""
+    count: int = 0
+    minutes: int = 0
+    shortest: int | None = None
+    longest: int | None = None
+
+    def add(self, duration: Duration) -> None:
+        """
+        Add a duration to the aggregate.
+
+        Raises
+        ------
+        TypeError
+            Raised if the value is not a duration.
+        """
+        if not isinstance(duration, Duration):
+            raise TypeError(
+                f"Timesheet expressions have to evaluate to durations. Received `{duration}`."
+            )
+        minutes = duration.total_minutes
+        self.count += 1
+        self.minutes += minutes
+        if self.shortest is None or minutes < self.shortest:
+            self.shortest = minutes
+        if self.longest is None or minutes > self.longest:
+            self.longest = minutes
+
+    @property
+    def total(self) -> Duration:
+        """Sum of the durations."""
+        return Duration(self.minutes)
+
+    @property
+    def minimum(self) -> Duration | None:
+        """The shortest duration, `None` if there is none."""
+        return None if self.shortest is None else Duration(self.shortest)
+
+    @property
+    def maximum(self) -> Duration | None:
+        """The longest duration, `None` if there is none."""
+        return None if self.longest is None else Duration(self.longest)
+
+    @property
+    def mean(self) -> Duration | None:
+        """Mean of the durations, rounded to minutes, `None` if there is none."""
+        return Duration(round(self.minutes / self.count)) if self.count else None
+
+    def __str__(self) -> str:
+        return (
+            f'{self.count} rows, total {self.total}, min {self.minimum}, '
+            f'max {self.maximum}, mean {self.mean}'
+        )
+
+
+@dataclass
+class Timesheet: # pylint: disable=too-many-instance-attributes
+    """
+    Aggregate of durations evaluated from rows of a timesheet.
+
+    Parameters
+    ----------
+    expression : str
+        µLang expression evaluated to a duration for every row. Columns it
+        reads are variables, e.g. `end - start`.
+    group_by : str | None
+        Column whose values group rows, e.g. an employee, totalled separately.
+    parsers : Mapping[str, Callable[[str], Any]]
+        Parsers of columns by name, e.g. `{'break': parse_duration}`. Columns
+        without a parser are times (see `parse_time`).
+    interpreter : Interpreter | None
+        Interpreter whose variables, e.g. `var rate = 21.5`, backend,
+        optimization, numeric mode and diagnostics the expression uses, so
+        warnings of rows are collected, with numbers of the rows as lines,
+        if it has diagnostics. A fresh one is used if not given.
+    skip_errors : bool
+        Whether rows which cannot be evaluated, e.g. malformed times, are
+        counted in `skipped` rather than raising.
+    """
+    expression: str = 'end - start'
+    group_by: str | None = None
+    parsers: Mapping[str, Callable[[str], Any]] = field(default_factory=dict)
+    interpreter: Interpreter | None = None
+    skip_errors: bool = False
+    total: Aggregate = field(default_factory=Aggregate)
+    """Aggregate of all rows."""
+    groups: dict[str, Aggregate] = field(default_factory=dict)
+    """Aggregates by values of the `group_by` column."""
+    skipped: int = 0
+    """Number of rows which could not be evaluated, if errors are skipped."""
+
+    def consume( # pylint: disable=too-many-locals
+        self,
+        header: Sequence[str],
+        rows: Iterable[Sequence[str]],
+    ) -> 'Timesheet':
+        """
+        Evaluate the expression for rows and add the results to the aggregates.
+
+        Parameters
+        ----------
+        header : Sequence[str]
+            Names of the columns.
+        rows : Iterable[Sequence[str]]
+            Values of the columns, row by row, e.g. read by `read_csv()`.
+
+        Returns
+        -------
+        Timesheet
+            The timesheet itself.
+
+        Raises
+        ------
+        ValueError
+            Raised if the column to group by is missing.
+        Exception
+            The first error of a row, unless errors are skipped. A note with
+            the number of the row is added to it.
+        """
+        interpreter = self.interpreter if self.interpreter is not None else Interpreter()
+        positions = {name: index for index, name in enumerate(header)}
+        if self.group_by is not None and self.group_by not in positions:
+            raise ValueError(f"There is no column `{self.group_by}` to group by.")
+
+        # Columns the expression reads, the rest are variables of the interpreter.
+        names = sorted(dependencies(interpreter.parse(self.expression)) & positions.keys())
+        scope = SymbolTableManager(interpreter.symbol_table)
+        for name in names:
+            scope.declare(Symbol(name, SymbolType.VARIABLE, None))
+        diagnostics = interpreter.diagnostics
+        evaluate = Interpreter(
+            scope,
+            backend=interpreter.backend,
+            optimize=interpreter.optimize,
+            numeric=interpreter.numeric,
+            diagnostics=diagnostics,
+        ).compile(self.expression)
+        bindings = [
+            (positions[name], scope.local(name), self.parsers.get(name, parse_time))
+            for name in names
+        ]
+
+        total = self.total
+        groups = self.groups
+        group = positions.get(self.group_by) if self.group_by is not None else None
+        for number, row in enumerate(rows, start=1):
+            if diagnostics is not None:
+                diagnostics.line = number
+            try:
+                for index, symbol, parse in bindings:
+                    symbol.value = parse(row[index])
+                duration = evaluate()
+                total.add(duration)
+                if group is not None:
+                    aggregate = groups.get(row[group])
+                    if aggregate is None:
+                        aggregate = groups[row[group]] = Aggregate()
+                    aggregate.add(duration)
+            except Exception as e: # pylint: disable=broad-exception-caught
+                if not self.skip_errors:
+                    e.add_note(f'In row {number}: {row}')
+                    raise
+                self.skipped += 1
+        return self
+
+
+def read_csv(lines: Iterable[str], delimiter: str = ',') -> tuple[list[str], Iterator[list[str]]]:
+    """
+    Read CSV lazily, with names of columns in the first row.
+
+    Parameters
+    ----------
+    lines : Iterable[str]
+        Lines of CSV, e.g. a file opened with `newline=''`.
+    delimiter : str
+        Character separating columns.
+
+    Returns
+    -------
+    tuple[list[str], Iterator[list[str]]]
+        Names of the columns and an iterator of the remaining rows.
+
+    Raises
+    ------
+    ValueError
+        Raised if there is no header.
+    """
+    rows = csv.reader(lines, delimiter=delimiter)
+    header = next(rows, None)
+    if header is None:
+        raise ValueError("CSV has no header.")
+    return [name.strip() for name in header], rows
+
+
+def read_log(
+    lines: Iterable[str],
+    pattern: str | re.Pattern[str],
+) -> tuple[list[str], Iterator[tuple[str, ...]]]:
+    """
+    Read lines of a log lazily, with columns captured by a regular expression.
+    Lines the expression does not match, e.g. other messages, are skipped.
+
+    Parameters
+    ----------
+    lines : Iterable[str]
+        Lines of a log, e.g. an open file.
+    pattern : str | re.Pattern[str]
+        Regular expression with a named group per column, e.g.
+        `(?P<employee>\\w+) in (?P<start>\\S+) out (?P<end>\\S+)`.
+
+    Returns
+    -------
+    tuple[list[str], Iterator[tuple[str, ...]]]
+        Names of the groups, in order, and an iterator of their values per
+        matched line.
+    """
+    regex = re.compile(pattern)
+    names = {index: name for name, index in regex.groupindex.items()}
+    header = [names.get(index, '') for index in range(1, regex.groups + 1)]
+    matches = map(regex.search, lines)
+    return header, (match.groups() for match in matches if match is not None)
+
+
+def summarize(
+    path: str,
+    timesheet: Timesheet,
+    delimiter: str = ',',
+    pattern: str | None = None,
+) -> Timesheet:
+    """
+    Aggregate a CSV file, or a log file if a pattern is given, reading it
+    in chunks.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file.
+    timesheet : Timesheet
+        Timesheet to add the rows to.
+    delimiter : str
+        Character separating columns of CSV.
+    pattern : str | None
+        Regular expression capturing columns of lines of a log (see
+        `read_log()`).
+
+    Returns
+    -------
+    Timesheet
+        The timesheet.
+    """
+    with open(path, encoding='utf-8', newline='', buffering=_READ_BUFFER_SIZE) as file:
+        if pattern is not None:
+            return timesheet.consume(*read_log(file, pattern))
+        return timesheet.consume(*read_csv(file, delimiter))
+
+
+def main(arguments: list[str] | None = None) -> int:
+    """Aggregate a timesheet and print the totals. Return the exit status."""
+    import argparse  # pylint: disable=import-outside-toplevel
+
+    argument_parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    argument_parser.add_argument('path')
+    argument_parser.add_argument('--expression', default='end - start')
+    argument_parser.add_argument('--group-by', metavar='COLUMN')
+    argument_parser.add_argument('--delimiter', default=',')
+    argument_parser.add_argument('--pattern', help='regular expression capturing columns of a log')
+    argument_parser.add_argument('--skip-errors', action='store_true')
+    options = argument_parser.parse_args(arguments)
+
+    timesheet = summarize(
+        options.path,
+        Timesheet(options.expression, options.group_by, skip_errors=options.skip_errors),
+        options.delimiter,
+        options.pattern,
+    )
+    for name in sorted(timesheet.groups):
+        print(f'{name}: {timesheet.groups[name]}')
+    print(f'total: {timesheet.total}')
+    if timesheet.skipped:
+        print(f'skipped: {timesheet.skipped} rows')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
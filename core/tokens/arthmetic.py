@@ -3,16 +3,67 @@ Module contains arthmetic tokens, mostly arthmetic operands such as plus,
 minus *et cetera*.
 """
 
+import decimal
+import math
+from typing import Any
+
 from core.tokens.literal import Duration
 
+MAX_INTEGER_DIGITS = 4300
+"""
+Maximal number of digits of an integer power, Python's default limit of
+converting integers to text, so every result can be printed.
+"""
+
+
+def power(base: Any, exponent: Any) -> Any:
+    """
+    Raise a number to a power, with the same errors for every numeric mode.
+
+    Parameters
+    ----------
+    base : Any
+        The base.
+    exponent : Any
+        The exponent.
+
+    Returns
+    -------
+    Any
+        The power.
+
+    Raises
+    ------
+    OverflowError
+        Raised if the power is out of range of floats or decimals, or an exact
+        integer power would have more than `MAX_INTEGER_DIGITS` digits, which
+        it would take long to compute.
+    """
+    if type(base) is int and type(exponent) is int and exponent > 0 and abs(base) > 1 \
+            and exponent * math.log10(abs(base)) >= MAX_INTEGER_DIGITS:
+        raise OverflowError(f"Integer power has more than {MAX_INTEGER_DIGITS} digits.")
+    try:
+        return base ** exponent
+    except decimal.Overflow as e:
+        raise OverflowError("Decimal power is too large.") from e
+
 class BinaryOperator():
-    """Base class for binary operator, taking left- and righthand operands."""
+    """
+    Base class for binary operator, taking left- and righthand operands.
+
+    Nodes of ASTs have slots instead of a `__dict__` each, so large programs
+    take less memory. Subclasses declare empty `__slots__` to keep it so.
+    """
+    __slots__ = ('left', 'right')
+
     def __init__(self, left, right):
         self.left = left
         self.right = right
 
 class Addition(BinaryOperator):
     """Implementation of addition"""
+    __slots__ = ()
+
     def eval(self) -> float | Duration:
         """
         Evaluate value of addition.
@@ -27,6 +78,8 @@ class Addition(BinaryOperator):
 
 class Subtraction(BinaryOperator):
     """Implementation of a subtraction."""
+    __slots__ = ()
+
     def eval(self) -> float | Duration:
         """
         Evaluate value of subtraction.
@@ -41,6 +94,8 @@ class Subtraction(BinaryOperator):
 
 class Multiplication(BinaryOperator):
     """Implementation of multiplication."""
+    __slots__ = ()
+
     def eval(self) -> float:
         """
         Evaluate value of multiplication.
@@ -54,6 +109,8 @@ class Multiplication(BinaryOperator):
 
 class Division(BinaryOperator):
     """Implementation of division."""
+    __slots__ = ()
+
     def eval(self) -> float:
         """
         Evaluate value of division.
@@ -68,12 +125,16 @@ class Division(BinaryOperator):
         ZeroDivisionError
             Raised if division by zero is attempted.
         """
-        if self.right.eval() == 0:
+        dividend = self.left.eval()
+        divisor = self.right.eval()
+        if divisor == 0:
             raise ZeroDivisionError("You cannot divide by 0.")
-        return self.left.eval() / self.right.eval()
+        return dividend / divisor
 
 class Exponentiation(BinaryOperator):
     """Implementation of exponentiation."""
+    __slots__ = ()
+
     def eval(self) -> float:
         """
         Evaluate value of exponentiation.
@@ -82,5 +143,10 @@ class Exponentiation(BinaryOperator):
         -------
         float
             Result of exponentiation.
+
+        Raises
+        ------
+        OverflowError
+            Raised if the result is too large (see `power()`).
         """
-        return self.left.eval() ** self.right.eval()
+        return power(self.left.eval(), self.right.eval())
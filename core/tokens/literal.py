@@ -1,29 +1,65 @@
 """Module with literal tokens, such as a number, string, duration, and so on."""
 import re
-from typing import Self
+from collections.abc import Callable
+from decimal import Decimal
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Self
+
+from core.diagnostics import warn
+
+
+class Numeric(Enum):
+    """Types numbers of µLang code are evaluated to."""
+    FLOAT = 'float'
+    """Every number is a `float`, as in most calculators."""
+    INTEGER = 'integer'
+    """
+    Numbers written without a fraction or an exponent are exact `int`s, so
+    integer arithmetic stays exact, while division and other numbers give
+    `float`s.
+    """
+    DECIMAL = 'decimal'
+    """Every number is an exact `Decimal`, e.g. for sums of money."""
+
+
+def _integer(value: str) -> int | float:
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+_PARSERS: dict[Numeric, Callable[[str], Any]] = {
+    Numeric.FLOAT: float,
+    Numeric.INTEGER: _integer,
+    Numeric.DECIMAL: Decimal,
+}
 
 
 class Number:
     """
     Literal token of a number type.
 
-    Literal numeric token constructed, either of `int` or of `float`.
-    Evaluated always as `float`.
+    The text of the number is parsed once, when the token is constructed,
+    into the type of the numeric mode, by default a `float`.
     """
+    __slots__ = ('number', 'value')
 
-    def __init__(self, value: str) -> None:
+    def __init__(self, value: str, numeric: Numeric = Numeric.FLOAT) -> None:
         self.value = value
+        self.number = _PARSERS[numeric](value)
 
-    def eval(self) -> float:
+    def eval(self) -> float | int | Decimal:
         """
         Evaluate value of a number.
 
         Returns
         -------
-        float
+        float | int | Decimal
             Value of a number.
         """
-        return float(self.value)
+        return self.number
 
     def __str__(self) -> str:
         return self.value
@@ -31,6 +67,7 @@ class Number:
 
 class String:
     """Class representing literal of type `string`."""
+    __slots__ = ('value',)
 
     def __init__(self, value: str) -> None:
         self.value: str = value.replace('"', '')
@@ -47,31 +84,89 @@ class String:
         return self.value
 
 
+class Constant:
+    """
+    Literal token of an already evaluated value, such as the result of
+    a condition folded by the optimizer.
+    """
+    __slots__ = ('value',)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def eval(self) -> Any:
+        """
+        Evaluate the constant to its value.
+
+        Returns
+        -------
+        Any
+            Value of the constant.
+        """
+        return self.value
+
+    def __str__(self) -> str:
+        return str(self.value)
+
+
+def _nonzero(divisor: Any) -> Any:
+    # Durations are divided by numbers and by durations with one error for zero
+    # of either, the same as dividing numbers.
+    if divisor == 0:
+        raise ZeroDivisionError("You cannot divide by 0.")
+    return divisor
+
+
+_MINUTES_IN_HOUR = 60
+_MINUTES_IN_DAY = 24 * _MINUTES_IN_HOUR
+_DURATION_PATTERN = re.compile(r'(?:(\d+)h)?(?:(\d+)m)?')
+
+
 class Duration:
-    """Class for literal token representing time spans."""
+    """
+    Class for literal token representing time spans, stored as a number of
+    minutes.
+
+    A duration is created from its text, e.g. `Duration('3h15m')`, or from
+    a number of minutes, e.g. `Duration(195)`.
+    """
+    __slots__ = ('total_minutes',)
 
-    def __init__(self, value: 'str | Duration') -> None:
+    def __init__(self, value: 'str | int | Duration') -> None:
         if isinstance(value, Duration):
-            self.hours: int = value.hours
-            self.minutes: int = value.minutes
+            self.total_minutes: int = value.total_minutes
+            return
+        if isinstance(value, int):
+            if value < 0:
+                raise ValueError('Duration cannot be negative.')
+            self.total_minutes = value
             return
 
-        match = re.match(r'(?:(\d+)h)?(?:(\d+)m)?', value)
+        match = _DURATION_PATTERN.match(value)
         if match:
-            self.hours = int(match.group(1)) if match.group(
-                1) else 0  # Default to 0 if not present
-            self.minutes = int(match.group(2)) if match.group(
-                2) else 0  # Default to 0 if not present
+            hours, minutes = match.groups(default='0')
+            self.total_minutes = int(hours) * _MINUTES_IN_HOUR + int(minutes)
         else:
             raise ValueError(
                 'Invalid duration format. Expected, for example: 3h15m')
 
+    @property
+    def hours(self) -> int:
+        """Number of full hours."""
+        return self.total_minutes // _MINUTES_IN_HOUR
+
+    @property
+    def minutes(self) -> int:
+        """Number of minutes beyond full hours."""
+        return self.total_minutes % _MINUTES_IN_HOUR
+
     def __repr__(self) -> str:
+        hours, minutes = divmod(self.total_minutes, _MINUTES_IN_HOUR)
         output = ''
-        if self.hours > 0:
-            output += str(self.hours) + 'h'
-        if self.minutes > 0:
-            output += str(self.minutes) + 'm'
+        if hours > 0:
+            output += str(hours) + 'h'
+        if minutes > 0:
+            output += str(minutes) + 'm'
 
         if not output:
             return '0m'
@@ -82,7 +177,58 @@ class Duration:
 
     def __eq__(self, value: object) -> bool:
         if isinstance(value, Duration):
-            return value.hours == self.hours and value.minutes == self.minutes
+            return value.total_minutes == self.total_minutes
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((Duration, self.total_minutes))
+
+    def __lt__(self, other: 'Duration') -> bool:
+        if isinstance(other, Duration):
+            return self.total_minutes < other.total_minutes
+        return NotImplemented
+
+    def __le__(self, other: 'Duration') -> bool:
+        if isinstance(other, Duration):
+            return self.total_minutes <= other.total_minutes
+        return NotImplemented
+
+    def __gt__(self, other: 'Duration') -> bool:
+        if isinstance(other, Duration):
+            return self.total_minutes > other.total_minutes
+        return NotImplemented
+
+    def __ge__(self, other: 'Duration') -> bool:
+        if isinstance(other, Duration):
+            return self.total_minutes >= other.total_minutes
+        return NotImplemented
+
+    def __add__(self, other: 'Duration') -> 'Duration':
+        if isinstance(other, Duration):
+            return Duration(self.total_minutes + other.total_minutes)
+        return NotImplemented
+
+    def __sub__(self, other: 'Duration') -> 'Duration':
+        if isinstance(other, Duration):
+            difference = self.total_minutes - other.total_minutes
+            if difference < 0:
+                warn(f'Did you mean `{other!s} - {self!s}`?')
+                difference = -difference
+            return Duration(difference)
+        return NotImplemented
+
+    def __mul__(self, other: float | Decimal) -> 'Duration':
+        if isinstance(other, (int, float, Decimal)) and not isinstance(other, bool):
+            return Duration(round(self.total_minutes * other))
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: 'float | Decimal | Duration') -> 'Duration | float':
+        if isinstance(other, Duration):
+            return self.total_minutes / _nonzero(other.total_minutes)
+        if isinstance(other, (int, float, Decimal)) and not isinstance(other, bool):
+            return Duration(round(self.total_minutes / _nonzero(other)))
         return NotImplemented
 
     def eval(self) -> Self:
@@ -98,46 +244,101 @@ class Duration:
 
 
 class Time:
-    """Class representing time in 24-hour format."""
+    """
+    Class representing time in 24-hour format, stored as a number of minutes
+    since midnight.
 
-    def __init__(self, value: str) -> None:
-        parts = value.split(':')
-        self.hours = int(parts[0])
-        self.minutes = int(parts[1])
+    A time is created from its text, e.g. `Time('9:30')`, or from a number of
+    minutes, e.g. `Time(570)`.
+    """
+    __slots__ = ('total_minutes',)
+
+    def __init__(self, value: str | int) -> None:
+        if isinstance(value, int):
+            if not 0 <= value <= _MINUTES_IN_DAY:
+                raise ValueError("Time has to be between 00:00 and 24:00.")
+            self.total_minutes: int = value
+            return
+
+        hours_text, _, minutes_text = value.partition(':')
+        hours = int(hours_text)
+        minutes = int(minutes_text)
 
-        if self.hours > 24:
+        if hours > 24:
             raise ValueError("Number of hours in time cannot exceed 24.")
-        if self.minutes > 60:
+        if minutes > 60:
             raise ValueError("Number of minutes in time cannot exceed 60.")
+        self.total_minutes = hours * _MINUTES_IN_HOUR + minutes
+
+    @property
+    def hours(self) -> int:
+        """Hour of the time."""
+        return self.total_minutes // _MINUTES_IN_HOUR
 
-    def __sub__(self, other: 'Time') -> Duration:
-        minutes_in_hour = 60
+    @property
+    def minutes(self) -> int:
+        """Minute of the hour of the time."""
+        return self.total_minutes % _MINUTES_IN_HOUR
 
-        left_in_minutes = self.hours * minutes_in_hour + self.minutes
-        right_in_minutes = other.hours * minutes_in_hour + other.minutes
+    def __sub__(self, other: 'Time | Duration') -> 'Duration | Time':
+        """
+        Subtract a time, giving the duration between both, or a duration,
+        giving an earlier time. Subtracting a later time is warned about (see
+        `core.diagnostics.warn()`) and, if the warning is only collected, gives
+        the duration between both too.
+        """
+        if isinstance(other, Duration):
+            return Time(self.total_minutes - other.total_minutes)
+        if not isinstance(other, Time):
+            return NotImplemented
 
-        difference = left_in_minutes - right_in_minutes
+        difference = self.total_minutes - other.total_minutes
         if difference < 0:
-            raise UserWarning(f'Did you mean `{str(other)} - {str(self)}`?')
+            warn(f'Did you mean `{other!s} - {self!s}`?')
+            difference = -difference
+        return Duration(difference)
 
-        hours, minutes = divmod(difference, minutes_in_hour)
-        duration_format = f'{hours}h{minutes}m'
-        return Duration(duration_format)
+    def __add__(self, other: Duration) -> 'Time':
+        if isinstance(other, Duration):
+            return Time(self.total_minutes + other.total_minutes)
+        return NotImplemented
 
-    def __str__(self) -> str:
-        hours = str(self.hours)
-        if len(hours) < 2:
-            hours = '0' + hours
+    def __radd__(self, other: Duration) -> 'Time':
+        return self.__add__(other)
 
-        minutes = str(self.minutes)
-        if len(minutes) < 2:
-            minutes = '0' + minutes
+    def __str__(self) -> str:
+        hours, minutes = divmod(self.total_minutes, _MINUTES_IN_HOUR)
+        return f'{hours:02}:{minutes:02}'
 
-        return f'{hours}:{minutes}'
+    def __repr__(self) -> str:
+        return f'Time({str(self)!r})'
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Time):
-            return self.hours == other.hours and self.minutes == other.minutes
+            return self.total_minutes == other.total_minutes
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((Time, self.total_minutes))
+
+    def __lt__(self, other: 'Time') -> bool:
+        if isinstance(other, Time):
+            return self.total_minutes < other.total_minutes
+        return NotImplemented
+
+    def __le__(self, other: 'Time') -> bool:
+        if isinstance(other, Time):
+            return self.total_minutes <= other.total_minutes
+        return NotImplemented
+
+    def __gt__(self, other: 'Time') -> bool:
+        if isinstance(other, Time):
+            return self.total_minutes > other.total_minutes
+        return NotImplemented
+
+    def __ge__(self, other: 'Time') -> bool:
+        if isinstance(other, Time):
+            return self.total_minutes >= other.total_minutes
         return NotImplemented
 
     def eval(self) -> Self:
@@ -150,3 +351,18 @@ class Time:
             Current instance of `Time` class.
         """
         return self
+
+
+INTERNED_LITERALS = 4096
+"""
+Number of the most recent distinct literals of each type kept to be shared.
+Literals are never changed once created, so every AST with the same literal,
+e.g. `8` or `9:00`, which programs repeat a lot, can hold the same token.
+"""
+
+number_literal: Callable[..., Number] = lru_cache(maxsize=INTERNED_LITERALS)(Number)
+"""Create a number literal, see `Number`, shared by equal text and numeric mode."""
+string_literal: Callable[[str], String] = lru_cache(maxsize=INTERNED_LITERALS)(String)
+"""Create a string literal, see `String`, shared by equal text."""
+time_literal: Callable[[str], Time] = lru_cache(maxsize=INTERNED_LITERALS)(Time)
+"""Create a time literal, see `Time`, shared by equal text."""
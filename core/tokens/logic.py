@@ -5,45 +5,60 @@ from core.tokens.arthmetic import BinaryOperator
 
 class GreaterThan(BinaryOperator):
     """Implementation of comparison operator *greater than*."""
+    __slots__ = ()
+
     def eval(self) -> bool:
         """Determine if the left operand is greater than right operand."""
         return self.left.eval() > self.right.eval()
 
 class LessThan(BinaryOperator):
     """Implementation of comparison operator *less than*."""
+    __slots__ = ()
+
     def eval(self) -> bool:
         """Determine if the left operand is smaller than right operand."""
         return self.left.eval() < self.right.eval()
 
 class GreaterOrEqualTo(BinaryOperator):
     """Implementation of comparison operator *greater than or equal to*."""
+    __slots__ = ()
+
     def eval(self) -> bool:
         """Determine if the left operand is greater than or equal to the right operand."""
         return self.left.eval() >= self.right.eval()
 
 class LessOrEqualTo(BinaryOperator):
     """Implementation of comparison operator *less than or equal to*."""
+    __slots__ = ()
+
     def eval(self) -> bool:
         """Determine if the left operand is smaller than or equal to the right operand."""
         return self.left.eval() <= self.right.eval()
 
 class EqualTo(BinaryOperator):
     """Implementation of comparison operator *equal to*."""
+    __slots__ = ()
+
     def eval(self) -> bool:
         """Determine if the left operand is equal to the right operand."""
         return self.left.eval() == self.right.eval()
 
 class IfStatement:
-    """Implementation of an `if-then` statement."""
-    def __init__(self, condition, instructions) -> None:
+    """Implementation of an `if-then` statement, optionally with an `else` clause."""
+    __slots__ = ('alternative', 'condition', 'instructions')
+
+    def __init__(self, condition, instructions, alternative=None) -> None:
         self.condition = condition
         self.instructions = instructions
+        self.alternative = alternative
 
     def eval(self) -> Any | None:
         """
         Evaluate code inside `if-then` clause under condition that `condition`
-        evaluates to `True`.
+        evaluates to `True`, otherwise code inside `else` clause, if any.
         """
         if self.condition.eval():
             return self.instructions.eval()
+        if self.alternative is not None:
+            return self.alternative.eval()
         return None
@@ -0,0 +1,206 @@
+"""
+Module with statements, i.e. constructs of a program that work on the symbol
+table, such as a variable or function declaration, and functions themselves.
+"""
+
+import sys
+from collections.abc import Callable
+from typing import Any
+
+from core.cache import MemoCache
+from core.symbol_table_manager import (
+    Symbol,
+    SymbolTableManager,
+    SymbolType,
+    active_symbol_table,
+    lookup,
+)
+
+
+class VariableDeclaration: # pylint: disable=too-few-public-methods
+    """Declaration of a variable, e.g. `var hours = 8`."""
+    __slots__ = ('name', 'value')
+
+    def __init__(self, name: str, value: Any) -> None:
+        self.name = name
+        self.value = value
+
+
+class SymbolInvocation:
+    """
+    Invocation of an already declared symbol by its name, e.g. `hours`. The
+    name is interned, so invocations of one symbol share its text.
+    """
+    __slots__ = ('name',)
+
+    def __init__(self, name: str) -> None:
+        self.name = sys.intern(name)
+
+    def eval(self) -> Any:
+        """
+        Evaluate the symbol in the symbol table of the evaluating interpreter.
+
+        Returns
+        -------
+        Any
+            Value of the symbol.
+
+        Raises
+        ------
+        NameError
+            Raised if no symbol with the name exists.
+        """
+        return lookup(self.name)
+
+
+class SlotInvocation(SymbolInvocation):
+    """
+    Invocation of a variable resolved to its slot in the symbol table before
+    evaluation, so it is read by indexing instead of being looked up by name.
+    """
+    __slots__ = ('depth', 'index')
+
+    def __init__(self, name: str, depth: int, index: int) -> None:
+        super().__init__(name)
+        self.depth = depth
+        self.index = index
+
+    def eval(self) -> Any:
+        """
+        Read the variable from its slot in the symbol table of the evaluating
+        interpreter.
+
+        Returns
+        -------
+        Any
+            Value of the variable.
+        """
+        scope = active_symbol_table.get()
+        if self.depth:
+            scope = scope.enclosing(self.depth)
+        return scope.slots[self.index].value
+
+
+class FunctionDeclaration: # pylint: disable=too-few-public-methods
+    """Declaration of a function, e.g. `fun pay(hours, rate) = hours * rate`."""
+    __slots__ = ('body', 'name', 'parameters')
+
+    def __init__(self, name: str, parameters: list[str], body: Any) -> None:
+        for index, parameter in enumerate(parameters):
+            if parameter in parameters[:index]:
+                raise ValueError(f"Function `{name}` has parameter `{parameter}` more than once.")
+        self.name = name
+        self.parameters = parameters
+        self.body = body
+
+
+class Function:
+    """
+    Function declared in µLang. Calling it evaluates its body in a new scope,
+    nested in the scope it was declared in, with parameters bound to the
+    arguments.
+
+    Parameters
+    ----------
+    name : str
+        Name of the function.
+    parameters : list[str]
+        Names of the parameters.
+    body : Any
+        Root of the AST of the body, resolved against a scope of the parameters.
+    scope : SymbolTableManager
+        Scope the function was declared in.
+    evaluate : Callable[[], Any] | None
+        Function evaluating the body in the active scope, e.g. the body
+        compiled. Defaults to walking the AST.
+    """
+    __slots__ = ('body', 'evaluate', 'memo', 'name', 'parameters', 'scope')
+
+    def __init__( # pylint: disable=too-many-arguments
+        self,
+        name: str,
+        parameters: list[str],
+        body: Any,
+        scope: SymbolTableManager,
+        evaluate: Callable[[], Any] | None = None,
+    ) -> None:
+        self.name = name
+        self.parameters = parameters
+        self.body = body
+        self.scope = scope
+        self.evaluate = evaluate if evaluate is not None else body.eval
+        self.memo: MemoCache | None = None
+        """Cache of results, if the function is memoized."""
+
+    def __call__(self, *arguments: Any) -> Any:
+        if len(arguments) != len(self.parameters):
+            raise TypeError(
+                f"Function `{self.name}` takes {len(self.parameters)} arguments, "
+                f"but {len(arguments)} were given."
+            )
+        if self.memo is not None:
+            return self.memo.call(self._call, arguments)
+        return self._call(*arguments)
+
+    def _call(self, *arguments: Any) -> Any:
+        scope = SymbolTableManager(self.scope)
+        for name, value in zip(self.parameters, arguments):
+            scope.declare(Symbol(name, SymbolType.VARIABLE, value))
+        token = active_symbol_table.set(scope)
+        try:
+            return self.evaluate()
+        finally:
+            active_symbol_table.reset(token)
+
+    def __str__(self) -> str:
+        return f"fun {self.name}({', '.join(self.parameters)})"
+
+
+def call(name: str, *arguments: Any) -> Any:
+    """
+    Call a function of the active symbol table.
+
+    Parameters
+    ----------
+    name : str
+        Name of the function.
+    *arguments : Any
+        Values of its parameters.
+
+    Returns
+    -------
+    Any
+        Result of the function.
+
+    Raises
+    ------
+    NameError
+        Raised if there is no symbol with the name.
+    TypeError
+        Raised if the symbol is not a function or the number of arguments
+        does not match.
+    """
+    function = lookup(name)
+    if not isinstance(function, Function):
+        raise TypeError(f"`{name}` is not a function.")
+    return function(*arguments)
+
+
+class FunctionCall:
+    """Call of a function, e.g. `pay(8, 20)`, with its name interned."""
+    __slots__ = ('arguments', 'name')
+
+    def __init__(self, name: str, arguments: list[Any]) -> None:
+        self.name = sys.intern(name)
+        self.arguments = arguments
+
+    def eval(self) -> Any:
+        """
+        Evaluate the arguments and call the function with them.
+
+        Returns
+        -------
+        Any
+            Result of the function.
+        """
+        return call(self.name, *(argument.eval() for argument in self.arguments))
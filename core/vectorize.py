@@ -0,0 +1,223 @@
+"""
+Module evaluating a µLang expression over columns of values, e.g. a formula
+applied to every row of a table. Arithmetic, comparisons and conditions are
+mapped onto NumPy operations on whole columns, so the expression is evaluated
+once per column instead of once per row.
+
+NumPy is an optional dependency, imported when an expression is vectorized.
+"""
+
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from core.compiler import _ATOM, _Compiler, compile_expression
+from core.symbol_table_manager import SymbolTableManager, active_symbol_table
+from core.tokens.arthmetic import BinaryOperator
+from core.tokens.literal import Constant, Number, Numeric
+from core.tokens.logic import IfStatement
+from core.tokens.statement import SymbolInvocation, VariableDeclaration
+
+
+class _RowwiseFallback(Exception):
+    """Raised if columns have to be evaluated row by row to keep scalar semantics."""
+
+
+def _vectorizable(node: Any) -> bool:
+    """Check if an AST consists only of nodes with a NumPy counterpart."""
+    if isinstance(node, BinaryOperator):
+        return _vectorizable(node.left) and _vectorizable(node.right)
+    if isinstance(node, IfStatement):
+        return _vectorizable(node.condition) and _vectorizable(node.instructions) and (
+            node.alternative is None or _vectorizable(node.alternative)
+        )
+    if isinstance(node, Constant):
+        return isinstance(node.value, (bool, int, float))
+    return isinstance(node, (Number, SymbolInvocation))
+
+
+class _VectorCompiler(_Compiler):
+    """Translator of an AST into the source of an expression on NumPy arrays."""
+    def __init__(self, numpy: Any) -> None:
+        # Columns are bound to names, which may shadow resolved variables.
+        super().__init__(slots=False)
+
+        def nonzero(divisor: Any) -> Any:
+            # Whether a division by zero is an error depends on the row, e.g.
+            # it may be guarded by a condition.
+            if numpy.any(divisor == 0):
+                raise _RowwiseFallback
+            return divisor
+
+        def where(condition: Any, instructions: Any) -> Any:
+            condition, instructions = numpy.broadcast_arrays(condition, instructions)
+            return numpy.ma.masked_where(~condition, instructions)
+
+        self.namespace.update(
+            _nonzero=nonzero, _where=where, _choose=numpy.where, _power=numpy.power
+        )
+
+    def emit(self, node: Any) -> tuple[str, int]:
+        if isinstance(node, IfStatement):
+            condition, _ = self.emit(node.condition)
+            instructions, _ = self.emit(node.instructions)
+            if node.alternative is not None:
+                alternative, _ = self.emit(node.alternative)
+                return f'_choose({condition}, {instructions}, {alternative})', _ATOM
+            return f'_where({condition}, {instructions})', _ATOM
+        if isinstance(node, Constant):
+            return self.constant(node.value)
+        return super().emit(node)
+
+
+class _Columns(SymbolTableManager):
+    """Symbol table resolving names bound to columns before the underlying table."""
+    def __init__(self, columns: Mapping[str, Any], symbol_table: SymbolTableManager) -> None:
+        super().__init__()
+        self.columns = columns
+        self.symbol_table = symbol_table
+        self.row: int | None = None
+
+    def lookup(self, name: str) -> Any:
+        if name in self.columns:
+            column = self.columns[name]
+            return column if self.row is None else column[self.row]
+        return self.symbol_table.lookup(name)
+
+
+class VectorizedExpression: # pylint: disable=too-few-public-methods
+    """
+    µLang expression compiled once to be evaluated over columns of values.
+
+    Expressions made of numbers, variables, arithmetic, comparisons and
+    conditions are evaluated on whole NumPy arrays. Anything else, e.g. times
+    or strings, as well as divisions by zero and numbers out of range, are
+    evaluated row by row, so results and errors are the same as of evaluating
+    the expression for every row separately. So are expressions of exact
+    numeric modes, whose integers or decimals NumPy arrays of floats would
+    round.
+
+    Parameters
+    ----------
+    tree : Any
+        Root of the AST of an expression.
+    symbol_table : SymbolTableManager
+        Symbol table resolving names not bound to columns.
+    numeric : Numeric
+        Numeric mode the AST was parsed in. Only expressions of floats are
+        evaluated on whole arrays.
+
+    Raises
+    ------
+    ImportError
+        Raised if NumPy is not installed.
+    TypeError
+        Raised if the AST is a statement, not an expression.
+    """
+    def __init__(
+        self,
+        tree: Any,
+        symbol_table: SymbolTableManager,
+        numeric: Numeric = Numeric.FLOAT,
+    ) -> None:
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        if isinstance(tree, VariableDeclaration):
+            raise TypeError("Only expressions can be evaluated over columns.")
+        self._numpy = numpy
+        self._tree = tree
+        self._symbol_table = symbol_table
+        self._vectorized: Callable[[], Any] | None = None
+        self._rowwise: Callable[[], Any] | None = None
+        if numeric is Numeric.FLOAT and _vectorizable(tree):
+            compiler = _VectorCompiler(numpy)
+            source, _ = compiler.emit(tree)
+            code = compile(f'lambda: {source}', '<µLang>', 'eval')
+            self._vectorized = eval(code, compiler.namespace) # pylint: disable=eval-used
+
+    def __call__(self, columns: Mapping[str, Any]) -> Any:
+        """
+        Evaluate the expression for every row of the columns.
+
+        Parameters
+        ----------
+        columns : Mapping[str, Any]
+            One-dimensional arrays, e.g. NumPy arrays, `array.array` buffers or
+            lists, of equal length bound to names of variables. A scalar is
+            used for every row.
+
+        Returns
+        -------
+        numpy.ndarray
+            Result of every row. Rows where a condition does not hold are
+            masked.
+
+        Raises
+        ------
+        ValueError
+            Raised if columns are not one-dimensional or differ in length.
+        """
+        numpy = self._numpy
+        arrays = {name: numpy.asarray(column) for name, column in columns.items()}
+        lengths = {array.shape[0] for array in arrays.values() if array.ndim == 1}
+        if any(array.ndim > 1 for array in arrays.values()) or len(lengths) > 1:
+            raise ValueError("Columns have to be one-dimensional and of equal length.")
+        length = lengths.pop() if lengths else 1
+
+        if self._vectorized is not None and all(
+            array.dtype.kind in 'biuf' for array in arrays.values()
+        ):
+            # µLang numbers are floats, so integers must not wrap around.
+            floats = {name: array.astype(float, copy=False) for name, array in arrays.items()}
+            try:
+                with numpy.errstate(over='raise', invalid='raise', under='ignore'):
+                    result = self._evaluate(self._vectorized, _Columns(floats, self._symbol_table))
+                return self._column(result, length)
+            except (_RowwiseFallback, FloatingPointError, TypeError):
+                pass
+
+        return self._evaluate_rowwise(arrays, length)
+
+    def _evaluate(self, function: Callable[[], Any], symbol_table: SymbolTableManager) -> Any:
+        token = active_symbol_table.set(symbol_table)
+        try:
+            return function()
+        finally:
+            active_symbol_table.reset(token)
+
+    def _evaluate_rowwise(self, arrays: Mapping[str, Any], length: int) -> Any:
+        if self._rowwise is None:
+            self._rowwise = compile_expression(self._tree, slots=False)
+        rowwise = self._rowwise
+        # Python values, not NumPy scalars, so every row evaluates as on its own.
+        columns = {
+            name: array.tolist() if array.ndim else [array.item()] * length
+            for name, array in arrays.items()
+        }
+        symbol_table = _Columns(columns, self._symbol_table)
+
+        def evaluate_rows() -> list[Any]:
+            results = []
+            for row in range(length):
+                symbol_table.row = row
+                try:
+                    results.append(rowwise())
+                except Exception as e:
+                    e.add_note(f'In row {row}.')
+                    raise
+            return results
+
+        results = self._evaluate(evaluate_rows, symbol_table)
+        mask = [result is None for result in results]
+        column = self._numpy.array(results)
+        return self._numpy.ma.array(column, mask=mask) if any(mask) else column
+
+    def _column(self, result: Any, length: int) -> Any:
+        numpy = self._numpy
+        if numpy.ndim(result) == 1:
+            return result
+        if numpy.ma.isMaskedArray(result) or result is numpy.ma.masked:
+            return numpy.ma.array(
+                numpy.broadcast_to(numpy.ma.getdata(result), (length,)).copy(),
+                mask=numpy.broadcast_to(numpy.ma.getmaskarray(result), (length,)).copy(),
+            )
+        return numpy.full(length, result)
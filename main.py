@@ -1,19 +1,31 @@
 """
-Main module of µLang language implementation. It contains both REPL and code
-evaluation function `evaluate()`.
+Main module of µLang language implementation. It contains REPL, a runner of
+`.u` scripts and code evaluation function `evaluate()`.
+
+Run `python main.py` to start REPL, `python main.py --reactive` to start REPL
+recomputing variables declared from a redeclared one, `python main.py --load
+path/to/snapshot` to start REPL with variables saved by `:save`, `python
+main.py --numeric integer` (or `decimal`) to start REPL evaluating numbers
+exactly, or `python main.py path/to/file.u` to run a script, whose parsed
+statements are cached on disk if `--cache` is given. Options may precede or
+follow the script, and `--numeric` applies to scripts too. Add `--lenient`
+to print warnings, e.g. of redeclared variables, after results instead of
+stopping at them.
 """
 import logging
+import sys
 from typing import Any
-import rply
-from core.lexer import Lexer
-from core.parser import Parser
+
+from core.diagnostics import Diagnostics
+from core.interpreter import Backend, Interpreter
+from core.tokens.literal import Numeric
 
 logger = logging.Logger('Main logger', level=logging.WARNING)
 
 def evaluate(
     code: str,
-    lexer: Lexer | None = None,
-    parser: Parser | None = None,
+    interpreter: Interpreter | None = None,
+    backend: Backend | None = None,
 ) -> Any:
     """
     Evaluate μLang code.
@@ -22,30 +34,57 @@ def evaluate(
     ----------
     code : str
         μLang code to be evaluated.
+    interpreter : Interpreter | None
+        Interpreter holding the symbol table to evaluate the code with.
+        A fresh interpreter, which shares the already built grammar, is used
+        if not given.
+    backend : Backend | None
+        Way of evaluating the code, either walking the AST or compiling it to
+        Python. Defaults to the interpreter's backend.
 
     Returns
     -------
     Any
         Result of the evaluation.
     """
-    if lexer is None:
-        lexer = Lexer().get_lexer()
-    if parser is None:
-        parser_generator = Parser()
-        parser_generator.parse()
-        parser = parser_generator.get_parser()
+    if interpreter is None:
+        interpreter = Interpreter()
+    return interpreter.evaluate(code, backend)
 
-    tokens = lexer.lex(code)
-    return parser.parse(tokens) # type: ignore
 
+def repl( # pylint: disable=too-many-branches
+    reactive: bool = False,
+    snapshot: str | None = None,
+    numeric: Numeric = Numeric.FLOAT,
+    lenient: bool = False,
+) -> None:
+    """
+    Provide read-eval-print loop (REPL) for μLang.
 
-def repl() -> None:
-    """Provide read-eval-print loop (REPL) for μLang."""
-    lexer = Lexer().get_lexer()
+    Parameters
+    ----------
+    reactive : bool
+        Whether redeclaring a variable recomputes variables depending on it.
+    snapshot : str | None
+        Path of a snapshot to restore variables from before the first prompt.
+    numeric : Numeric
+        Type numbers are evaluated to.
+    lenient : bool
+        Whether warnings are printed after results instead of replacing them.
+    """
+    # Imported on demand, so evaluating code with `evaluate()` does not import it.
+    from core.instrumentation import Statistics  # pylint: disable=import-outside-toplevel
 
-    parser_generator = Parser()
-    parser_generator.parse()
-    parser = parser_generator.get_parser()
+    statistics = Statistics()
+    diagnostics = Diagnostics() if lenient else None
+    interpreter = Interpreter(
+        instrument=statistics.record, reactive=reactive, numeric=numeric, diagnostics=diagnostics,
+    )
+    if snapshot is not None:
+        try:
+            print(f'Restored {interpreter.restore(snapshot)} variables.')
+        except (OSError, ValueError) as e:
+            report(e)
 
     while True:
         try:
@@ -55,19 +94,121 @@ def repl() -> None:
             break
 
         try:
-            print(evaluate(code=code, lexer=lexer, parser=parser))
-        except rply.errors.LexingError as e: # type: ignore
-            position = e.source_pos
-            logger.critical(
-                'Unrecognised thing at line %d, column %d',
-                position.lineno,
-                position.colno
-            )
-        except OverflowError as e:
-            logger.warning(e.args[1])
+            if code.startswith(':tree '):
+                print(interpreter.dump(code.removeprefix(':tree ')))
+            elif code.startswith(':time '):
+                print(interpreter.evaluate(code.removeprefix(':time ')))
+                print(statistics.last)
+            elif code.strip() == ':stats':
+                print(statistics.report(interpreter.parse_cache.stats()))
+            elif code.startswith(':memo '):
+                memo = interpreter.memoize(code.removeprefix(':memo ').strip())
+                print(memo.stats())
+            elif code.startswith(':save '):
+                path = code.removeprefix(':save ').strip()
+                functions = interpreter.save(path)
+                print(f'Saved {len(interpreter.symbol_table.slots) - len(functions)} variables.')
+                if functions:
+                    print(f'Functions are not saved: {", ".join(functions)}.')
+            elif code.startswith(':load '):
+                restored = interpreter.restore(code.removeprefix(':load ').strip())
+                print(f'Restored {restored} variables.')
+            else:
+                print(evaluate(code=code, interpreter=interpreter))
         except Exception as e: # pylint: disable=broad-exception-caught
-            logger.error(e)
+            report(e)
+        if diagnostics is not None:
+            for diagnostic in diagnostics.drain():
+                logger.warning(diagnostic)
+
+
+def run(
+    path: str,
+    lenient: bool = False,
+    cache: bool = False,
+    numeric: Numeric = Numeric.FLOAT,
+) -> int:
+    """
+    Run a µLang script, printing result of every statement as it is evaluated.
+
+    Parameters
+    ----------
+    path : str
+        Path of the script.
+    lenient : bool
+        Whether warnings are printed with their line numbers instead of
+        stopping the script.
+    cache : bool
+        Whether parsed statements are cached in `__ucache__` next to the
+        script, so running it again does not parse it. The script is then
+        read whole rather than streamed.
+    numeric : Numeric
+        Type numbers are evaluated to.
+
+    Returns
+    -------
+    int
+        Exit status: 0 on success, 1 if a statement failed.
+    """
+    from core.script import run_file  # pylint: disable=import-outside-toplevel
+
+    diagnostics = Diagnostics() if lenient else None
+    try:
+        for result in run_file(path, Interpreter(numeric=numeric, diagnostics=diagnostics), cache):
+            print(result)
+            if diagnostics is not None:
+                for diagnostic in diagnostics.drain():
+                    logger.warning(diagnostic)
+    except Exception as e: # pylint: disable=broad-exception-caught # noqa: BLE001
+        for note in getattr(e, '__notes__', []):
+            logger.error(note)
+        report(e)
+        return 1
+    return 0
+
+
+def report(error: Exception) -> None:
+    """Log an error raised by μLang code."""
+    from core.batch import Status, classify, describe  # pylint: disable=import-outside-toplevel
+
+    levels = {Status.LEXING_ERROR: logging.CRITICAL, Status.OVERFLOW: logging.WARNING}
+    logger.log(levels.get(classify(error), logging.ERROR), describe(error))
+
+
+def main(arguments: list[str] | None = None) -> int:
+    """Run a script, or start REPL if no script is given. Return the exit status."""
+    import argparse  # pylint: disable=import-outside-toplevel
+
+    argument_parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    argument_parser.add_argument('path', nargs='?', help='script to run instead of starting REPL')
+    argument_parser.add_argument('--reactive', action='store_true')
+    argument_parser.add_argument('--load', metavar='SNAPSHOT')
+    argument_parser.add_argument(
+        '--numeric', choices=[numeric.value for numeric in Numeric], default=Numeric.FLOAT.value,
+    )
+    argument_parser.add_argument('--lenient', action='store_true')
+    argument_parser.add_argument('--cache', action='store_true', help='cache the parsed script')
+    options = argument_parser.parse_args(arguments)
+
+    if options.path is not None:
+        if options.reactive or options.load is not None:
+            argument_parser.error('--reactive and --load apply only to REPL')
+        return run(
+            options.path,
+            lenient=options.lenient,
+            cache=options.cache,
+            numeric=Numeric(options.numeric),
+        )
+    if options.cache:
+        argument_parser.error('--cache applies only to scripts')
+    repl(
+        reactive=options.reactive,
+        snapshot=options.load,
+        numeric=Numeric(options.numeric),
+        lenient=options.lenient,
+    )
+    return 0
 
 
 if __name__ == '__main__':
-    repl()
+    sys.exit(main())
@@ -0,0 +1,46 @@
+"""Module with tests of evaluating expressions in a batch."""
+
+import pytest
+
+from core.batch import Status, evaluate_many
+from core.interpreter import Interpreter
+
+
+@pytest.mark.parametrize('source,status,message', [
+    ('9 + 4', Status.OK, ''),
+    ('9 + $', Status.LEXING_ERROR, 'Unrecognised thing at line 1, column 5'),
+    ('10 ^ 1000', Status.OVERFLOW, 'Numerical result out of range'),
+    ('8:00 - 9:00', Status.WARNING, 'Did you mean `09:00 - 08:00`?'),
+    ('1 / 0', Status.ERROR, 'You cannot divide by 0.'),
+])
+def test_statuses(source: str, status: Status, message: str):
+    """Test if every kind of error is reported as a result of its own."""
+    result, = evaluate_many([source])
+    assert result.status is status
+    assert result.ok is (status is Status.OK)
+    assert result.message == message
+
+
+def test_errors_do_not_stop_batch():
+    """Test if expressions after a failing one are evaluated, in order."""
+    results = list(evaluate_many(['1 + 1', '1 / 0', '2 + 2']))
+    assert [result.index for result in results] == [0, 1, 2]
+    assert [result.value for result in results] == [2, None, 4]
+    assert isinstance(results[1].error, ZeroDivisionError)
+
+
+def test_symbol_table_is_shared():
+    """Test if expressions of a batch share the symbol table of the interpreter."""
+    interpreter = Interpreter()
+    results = evaluate_many(['var hours = 8', 'hours'], interpreter)
+    assert [result.value for result in results] == ['hours = 8.0', 8.0]
+    assert interpreter.symbol_table['hours'] is not None
+
+
+def test_results_are_lazy():
+    """Test if results are produced before the rest of the sources is read."""
+    def sources():
+        yield '1 + 1'
+        raise AssertionError('Read ahead of the evaluated expression.')
+
+    assert next(evaluate_many(sources())).value == 2
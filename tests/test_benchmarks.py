@@ -0,0 +1,39 @@
+"""Module with tests of the regression gate of the benchmark suite."""
+
+import json
+
+import pytest
+
+from benchmarks import suite
+
+
+def test_regressions():
+    """Test if only metrics slower than the threshold allows are reported."""
+    baselines = {'lexing': 1.0, 'parsing': 2.0}
+    metrics = {'lexing': 1.2, 'parsing': 2.6, 'new metric': 9.0}
+    assert suite.regressions(metrics, baselines, threshold=0.25) == ['parsing']
+
+
+@pytest.mark.parametrize('timing,status', [(1.0, 0), (2.0, 1)])
+def test_check_fails_on_regression(
+    tmp_path,
+    monkeypatch: pytest.MonkeyPatch,
+    timing: float,
+    status: int,
+):
+    """Test if `--check` fails on a persistent regression and passes otherwise."""
+    baselines = tmp_path / 'baselines.json'
+    baselines.write_text(json.dumps({'machine': suite.machine(), 'metrics': {'fake': 1.0}}))
+    monkeypatch.setattr(suite, 'BASELINES_PATH', baselines)
+    monkeypatch.setattr(suite, 'METRICS', {'fake': lambda: timing})
+    assert suite.main(['--check']) == status
+
+
+def test_update_stores_baselines(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    """Test if `--update` stores the metrics and keeps baselines of other metrics."""
+    baselines = tmp_path / 'baselines.json'
+    baselines.write_text(json.dumps({'metrics': {'other': 5.0}}))
+    monkeypatch.setattr(suite, 'BASELINES_PATH', baselines)
+    monkeypatch.setattr(suite, 'METRICS', {'fake': lambda: 1.5})
+    assert suite.main(['--update']) == 0
+    assert json.loads(baselines.read_text())['metrics'] == {'other': 5.0, 'fake': 1.5}
@@ -0,0 +1,89 @@
+"""Module with tests of the cache of parsed ASTs."""
+
+import pytest
+
+from core.cache import SHAPES_PER_CODE, ParseCache
+from core.interpreter import Interpreter
+
+
+def test_least_recently_used_entry_is_evicted():
+    """Test if a full cache evicts the entry used longest ago."""
+    cache = ParseCache(capacity=2)
+    cache.put('1', (), 'one')
+    cache.put('2', (), 'two')
+    assert cache.get('1', ()) == 'one'
+    cache.put('3', (), 'three')
+    assert cache.get('2', ()) is None
+    assert cache.get('1', ()) == 'one'
+    assert cache.stats().evictions == 1
+
+
+def test_counting_hits_and_misses():
+    """Test if repeated evaluation of the same code is parsed once."""
+    cache = ParseCache()
+    interpreter = Interpreter(parse_cache=cache)
+    for _ in range(3):
+        interpreter.evaluate('10 - 9 * 10')
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (2, 1, 1)
+
+
+def test_declaration_invalidates_entries():
+    """Test if declaring a new symbol invalidates ASTs parsed before it."""
+    cache = ParseCache()
+    interpreter = Interpreter(parse_cache=cache)
+    interpreter.evaluate('2 ^ 10')
+    interpreter.evaluate('var hours = 8')
+    interpreter.evaluate('2 ^ 10')
+    assert cache.stats().invalidations == 1
+    assert (cache.stats().hits, len(cache)) == (0, 2)
+
+
+def test_interpreters_of_different_shapes_keep_their_entries():
+    """Test if interpreters with different variables hit ASTs of the same code."""
+    cache = ParseCache()
+    first, second = Interpreter(parse_cache=cache), Interpreter(parse_cache=cache)
+    first.evaluate('var hours = 8')
+    second.evaluate('var rate = 20')
+    second.evaluate('var hours = 6')
+    for _ in range(3):
+        assert first.evaluate('hours * 2') == 16
+        assert second.evaluate('hours * 2') == 12
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.invalidations) == (4, 5, 1)
+
+
+def test_least_recently_cached_shape_is_evicted():
+    """Test if a code keeps ASTs of a bounded number of shapes."""
+    cache = ParseCache()
+    for shape in range(SHAPES_PER_CODE + 1):
+        cache.put('1', shape, shape)
+    assert cache.get('1', 0) is None
+    assert cache.get('1', SHAPES_PER_CODE) == SHAPES_PER_CODE
+    assert cache.stats().evictions == 1
+
+
+def test_own_parser_does_not_share_entries():
+    """Test if an interpreter with a parser of its own parses code cached by others."""
+    class RaisingParser: # pylint: disable=too-few-public-methods
+        """Parser refusing every code."""
+        def parse(self, tokens):
+            """Refuse the code."""
+            raise SyntaxError(list(tokens))
+
+    Interpreter().evaluate('1 + 2')
+    with pytest.raises(SyntaxError):
+        Interpreter(parser=RaisingParser()).evaluate('1 + 2') # type: ignore[arg-type]
+
+
+def test_zero_capacity_disables_caching():
+    """Test if a cache without capacity keeps nothing."""
+    cache = ParseCache(capacity=0)
+    Interpreter(parse_cache=cache).evaluate('1 + 1')
+    assert len(cache) == 0
+
+
+def test_negative_capacity_is_rejected():
+    """Test if a cache cannot be created with a negative capacity."""
+    with pytest.raises(ValueError):
+        ParseCache(capacity=-1)
@@ -0,0 +1,65 @@
+"""Module with tests of compiling µLang expressions into Python code."""
+
+import pytest
+
+from core.cache import ParseCache
+from core.interpreter import _COMPILERS, Backend, Interpreter
+from core.symbol_table_manager import SymbolTableManager
+
+
+@pytest.mark.parametrize('code', [
+    '2 ^ 3 ^ 2',
+    '-2 ^ 2',
+    '2 ^ -1',
+    '100 / 10 / 5',
+    '10 - 5 - 2',
+    '1 - 2 * 3 ^ 2 / 4 + 5',
+    'if 2 ^ 2 == 4 then 12:15 - 8:30',
+    'if 1 > 2 then "never"',
+])
+def test_compiled_code_matches_tree_walking(code: str):
+    """Test if compiled code evaluates to the same values as walking the AST."""
+    interpreter = Interpreter()
+    tree = interpreter.parse(code)
+    assert interpreter.execute(tree, Backend.COMPILED) == interpreter.execute(tree, Backend.TREE)
+
+
+def test_division_by_zero_message():
+    """Test if compiled division by zero raises the same error as walking the AST."""
+    with pytest.raises(ZeroDivisionError, match='You cannot divide by 0.'):
+        Interpreter(backend=Backend.COMPILED).evaluate('1 / 0')
+
+
+def test_compiled_code_is_reusable():
+    """Test if compiled code is evaluated against the current symbol table on each call."""
+    interpreter = Interpreter()
+    declare = interpreter.compile('var hours = 2 ^ 3')
+    assert declare() == 'hours = 8.0'
+    with pytest.raises(UserWarning):
+        declare()
+    assert interpreter.compile('hours')() == 8.0
+
+
+@pytest.mark.parametrize('backend', [Backend.COMPILED, Backend.STACK])
+def test_cached_code_is_compiled_once(backend: Backend, monkeypatch: pytest.MonkeyPatch):
+    """Test if evaluating cached code again, even by another interpreter, does not compile it."""
+    compiled = []
+    compiler = _COMPILERS[backend]
+
+    def compile_counted(tree):
+        compiled.append(tree)
+        return compiler(tree)
+    monkeypatch.setitem(_COMPILERS, backend, compile_counted)
+
+    parse_cache = ParseCache()
+    interpreters = [
+        Interpreter(SymbolTableManager(), backend=backend, parse_cache=parse_cache)
+        for _ in range(2)
+    ]
+    for interpreter in interpreters:
+        interpreter.evaluate('var rate = 20')
+        for _ in range(3):
+            assert interpreter.evaluate('rate * 8 - 10') == 150.0
+        assert interpreter.evaluate('fun pay(hours) = rate * hours') == 'fun pay(hours)'
+        assert interpreter.evaluate('pay(8)') == 160.0
+    assert len(compiled) == 4
@@ -0,0 +1,97 @@
+"""Module with tests of collecting warnings and errors as diagnostics."""
+
+import pytest
+
+from core.batch import Status, evaluate_many
+from core.diagnostics import Diagnostic, Diagnostics, Severity
+from core.grammar import ParsingError
+from core.interpreter import Backend, Interpreter
+from core.script import run_script
+from core.symbol_table_manager import SymbolTableManager
+from core.tokens.literal import Duration
+
+
+@pytest.mark.parametrize('backend', list(Backend))
+@pytest.mark.parametrize('optimize', [False, True])
+def test_warnings_are_collected(backend: Backend, optimize: bool):
+    """Test if evaluation goes on after warnings, which are collected on every evaluation."""
+    diagnostics = Diagnostics()
+    interpreter = Interpreter(
+        SymbolTableManager(), backend=backend, optimize=optimize, diagnostics=diagnostics,
+    )
+    assert interpreter.evaluate('var shift = 8:00 - 9:30') == 'shift = 1h30m'
+    assert interpreter.evaluate('var shift = 8:00 - 9:30') == 'shift = 1h30m'
+    assert interpreter.evaluate('9:00 - 8:00 - shift') == Duration('30m')
+    assert [str(diagnostic) for diagnostic in diagnostics.drain()] == [
+        'warning: Did you mean `09:30 - 08:00`?',
+        'warning: Did you mean `09:30 - 08:00`?',
+        'warning: Symbol with the name `shift` already exists. Replacing with a new value.',
+        'warning: Did you mean `1h30m - 1h`?',
+    ]
+    assert not diagnostics
+
+
+@pytest.mark.parametrize('diagnostics', [None, Diagnostics(strict=True)])
+def test_strict_mode_raises(diagnostics: Diagnostics | None):
+    """Test if warnings are raised without diagnostics or with strict ones."""
+    interpreter = Interpreter(SymbolTableManager(), diagnostics=diagnostics)
+    interpreter.evaluate('var hours = 8')
+    with pytest.raises(UserWarning, match='already exists'):
+        interpreter.evaluate('var hours = 9')
+    assert interpreter.evaluate('hours') == 9.0
+    with pytest.raises(UserWarning, match='Did you mean'):
+        interpreter.evaluate('8:00 - 9:00')
+
+
+def test_compiled_expressions_collect_warnings():
+    """Test if expressions compiled once report warnings on every call."""
+    diagnostics = Diagnostics()
+    interpreter = Interpreter(SymbolTableManager(), diagnostics=diagnostics)
+    interpreter.evaluate('var start = 17:00')
+    evaluate = interpreter.compile('8:00 - start')
+    assert [evaluate(), evaluate()] == [Duration('9h'), Duration('9h')]
+    assert len(diagnostics.warnings) == 2
+
+
+@pytest.mark.parametrize('code,message,column', [
+    ('8 h30m', 'Unexpected `h30m` at line 1, column 3', 3),
+    ('var = 3', 'Unexpected `=` at line 1, column 5', 5),
+    ('8 +', 'Unexpected end of code', None),
+])
+def test_parsing_errors_have_positions(code: str, message: str, column: int | None):
+    """Test if a syntax error tells the unexpected token and where it is."""
+    with pytest.raises(ParsingError) as error:
+        Interpreter().evaluate(code)
+    assert str(error.value) == message
+    assert Diagnostic.from_error(error.value).column == column
+
+
+def test_batches_attach_diagnostics():
+    """Test if results of a lenient batch carry their warnings and errors."""
+    interpreter = Interpreter(SymbolTableManager(), diagnostics=Diagnostics())
+    results = list(evaluate_many(['var a = 1', 'var a = 2', 'a +', 'a'], interpreter))
+    assert [result.status for result in results] == [
+        Status.OK, Status.OK, Status.ERROR, Status.OK,
+    ]
+    assert results[0].diagnostics == ()
+    assert results[1].diagnostics[0].severity is Severity.WARNING
+    assert results[2].diagnostics == (
+        Diagnostic(Severity.ERROR, 'Unexpected end of code'),
+    )
+    assert results[3].value == 2.0
+
+
+def test_scripts_report_lines():
+    """Test if diagnostics of a script are at the lines of their statements."""
+    diagnostics = Diagnostics()
+    lines = ['var a = 1\n', '\n', 'var b = 2; var a = 3\n', '8:00 - 9:00\n']
+    results = list(run_script(lines, Interpreter(SymbolTableManager(), diagnostics=diagnostics)))
+    assert results[-1] == Duration('1h')
+    assert [(diagnostic.line, diagnostic.column) for diagnostic in diagnostics] == [
+        (3, None), (4, None),
+    ]
+    with pytest.raises(ParsingError) as error:
+        list(run_script(['1 + 1\n', '\n', '8 h30m\n'], Interpreter(diagnostics=diagnostics)))
+    diagnostics.error(error.value)
+    assert str(diagnostics.errors[0]) == \
+        'error at line 3, column 3: Unexpected `h30m` at line 1, column 3'
@@ -4,8 +4,15 @@ from typing import Any
 
 import pytest
 
-from main import evaluate
+from core.interpreter import Backend, Interpreter
 from core.tokens.literal import Duration, Time
+from main import evaluate
+
+
+@pytest.fixture(name='backend', params=list(Backend), ids=lambda backend: backend.value)
+def fixture_backend(request: pytest.FixtureRequest) -> Backend:
+    """Supply every backend of the interpreter in turn."""
+    return request.param
 
 @pytest.mark.parametrize('code,output', [
     ('10', 10.0),
@@ -13,9 +20,9 @@ from core.tokens.literal import Duration, Time
     ('"μLang is my favourite language."', 'μLang is my favourite language.'),
     ('10:15', Time('10:15')),
 ])
-def test_evaluating_primitives(code: str, output: Any):
+def test_evaluating_primitives(code: str, output: Any, backend: Backend):
     """Test if primitives such as numbers, times, durations and strings as expected."""
-    evaluated = evaluate(code)
+    evaluated = evaluate(code, backend=backend)
     assert type(evaluated) is type(output), \
         f"Mismatch between an actual type ({type(evaluated)}) and" \
         f" expected type ({type(output)})."
@@ -27,53 +34,78 @@ def test_evaluating_primitives(code: str, output: Any):
     ('12:15 - 8:30', '3h45m'),
     ('12:00 - 12:00', '0m'),
 ])
-def test_time_arthmetics(code: str, output: str):
+def test_time_arthmetics(code: str, output: str, backend: Backend):
     """Test if time arthmetics works properly."""
-    evaluated = evaluate(code)
+    evaluated = evaluate(code, backend=backend)
     assert evaluated == Duration(output)
 
 @pytest.mark.parametrize('code', [
     '8:00 - 9:00',
     '00:00 - 23:59',
 ])
-def test_time_arthmetics_emitting_warning(code: str):
+def test_time_arthmetics_emitting_warning(code: str, backend: Backend):
     """Test if subtracting a later hour from an earlier hours emits a warning."""
     with pytest.raises(UserWarning):
-        evaluate(code)
+        evaluate(code, backend=backend)
 
 @pytest.mark.parametrize('code, result', [
     ('10 - 10 - 20', -20),
     ('20 * 2 - 10', 30),
     ('10 / 10 - 10', -9),
 ])
-def test_arthmetic_left_associativity(code: str, result: float):
+def test_arthmetic_left_associativity(code: str, result: float, backend: Backend):
     """Test if left associativity works."""
-    assert evaluate(code) == result
+    assert evaluate(code, backend=backend) == result
 
 @pytest.mark.parametrize('code', [
     '10:15 - 9:15 - 1:00',
     '20:15 - 2:15 - 15:00',
 ])
-def test_time_chaining_raieses_exception(code: str):
-    """Test if chaining operations on time raises an exception."""
-    with pytest.raises(ValueError):
-        evaluate(code)
+def test_time_chaining_raieses_exception(code: str, backend: Backend):
+    """Test if subtracting a time from a duration raises an exception."""
+    with pytest.raises(TypeError):
+        evaluate(code, backend=backend)
+
+@pytest.mark.parametrize('code,output', [
+    ('17:00 - 8:00 + 12:30 - 12:00', Duration('9h30m')),
+    ('17:00 - 8:00 + 12:30', Time('21:30')),
+    ('9:30 - 8:00 + 9:30 - 8:00 + 8:00', Time('11:00')),
+    ('12:00 - 8:00 - 1:00 - 0:00', TypeError),
+    ('17:00 - 8:00 > 10:00 - 9:00', True),
+    ('if 9:00 < 10:00 then 12:15 - 8:30', Duration('3h45m')),
+])
+def test_time_chaining(code: str, output: Any, backend: Backend):
+    """Test if times and durations may be chained and compared."""
+    if output is TypeError:
+        with pytest.raises(TypeError):
+            evaluate(code, backend=backend)
+    else:
+        assert evaluate(code, backend=backend) == output
 
 @pytest.mark.parametrize('code,result', [
     ('10 - 9 * 10', -80),
     ('5 / 10 ^ 2', 0.05),
     ('10 - 10 + 10 * 10 / 2', 50),
 ])
-def test_arthmetic_precedence(code: str, result: float):
+def test_arthmetic_precedence(code: str, result: float, backend: Backend):
     """Test if hierarchy of precedence of arthmetic operators is preserved."""
-    assert evaluate(code) == result
+    assert evaluate(code, backend=backend) == result
+
+@pytest.mark.parametrize('divisor', ['0', 'none'])
+def test_dividing_duration_by_zero(divisor: str, backend: Backend):
+    """Test if a duration divided by a zero number or a zero duration raises one error."""
+    interpreter = Interpreter(backend=backend)
+    evaluate('var worked = 9:30 - 8:00', interpreter)
+    evaluate('var none = 8:00 - 8:00', interpreter)
+    with pytest.raises(ZeroDivisionError, match='You cannot divide by 0.'):
+        evaluate(f'worked / {divisor}', interpreter)
 
-def test_handling_out_of_range():
+def test_handling_out_of_range(backend: Backend):
     """
     Test if when a numerical value is out of range, an exception is raised.
     """
     with pytest.raises(OverflowError):
-        evaluate('9999999 ^ 99999999')
+        evaluate('9999999 ^ 99999999', backend=backend)
 
 @pytest.mark.parametrize('code,result', [
     ('var number = 10', 'number = 10.0'),
@@ -81,6 +113,24 @@ def test_handling_out_of_range():
     ('var text = "µLang has var!"', 'text = µLang has var!'),
     ('var complex_case = 2 ^ 10', 'complex_case = 1024.0'),
 ])
-def test_variable_declaration(code: str, result: Any):
+def test_variable_declaration(code: str, result: Any, backend: Backend):
     """Test if declaring a variable is possible."""
-    assert evaluate(code) == result
+    assert evaluate(code, backend=backend) == result
+
+@pytest.mark.parametrize('code,result', [
+    ('rate * hours - 10', 90.0),
+    ('hours ^ 2 / rate', 5.12),
+    ('if hours > 7 then rate', 12.5),
+    ('var pay = rate * hours', 'pay = 100.0'),
+])
+def test_variables_in_expressions(code: str, result: Any, backend: Backend):
+    """Test if variables may be used as operands."""
+    interpreter = Interpreter()
+    evaluate('var rate = 12.5', interpreter=interpreter)
+    evaluate('var hours = 8', interpreter=interpreter)
+    assert evaluate(code, interpreter=interpreter, backend=backend) == result
+
+def test_undeclared_variable(backend: Backend):
+    """Test if using an undeclared variable raises an exception."""
+    with pytest.raises(NameError):
+        evaluate('hours * 2', backend=backend)
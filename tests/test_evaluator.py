@@ -0,0 +1,67 @@
+"""Module with tests of evaluating µLang expressions on a stack, without recursion."""
+
+import sys
+
+import pytest
+
+from core.evaluator import linearize
+from core.interpreter import Backend, Interpreter
+
+
+@pytest.mark.parametrize('code', [
+    '2 ^ 3 ^ 2',
+    '-2 ^ 2',
+    '100 / 10 / 5',
+    '1 - 2 * 3 ^ 2 / 4 + 5',
+    '17:00 - 8:00 + 12:30 - 12:00',
+    'if 2 ^ 2 == 4 then 12:15 - 8:30',
+    'if 1 > 2 then "never"',
+    'if 1 > 2 then "never" else "always"',
+    'if 1 < 2 then if 2 < 1 then 1 else 2 else 3',
+])
+def test_stack_matches_tree_walking(code: str):
+    """Test if running a linearized expression gives the same values as walking the AST."""
+    interpreter = Interpreter(optimize=False)
+    tree = interpreter.parse(code)
+    assert interpreter.execute(tree, Backend.STACK) == interpreter.execute(tree, Backend.TREE)
+
+
+@pytest.mark.parametrize('code,error,message', [
+    ('1 + 1 / 0', ZeroDivisionError, 'You cannot divide by 0.'),
+    ('10.0 ^ 400', OverflowError, None),
+    ('8:00 - 9:00 + 1:00', UserWarning, 'Did you mean `09:00 - 08:00`?'),
+])
+def test_stack_raises_same_errors(code: str, error: type[Exception], message: str | None):
+    """Test if running a linearized expression raises the same errors as walking the AST."""
+    interpreter = Interpreter(optimize=False)
+    tree = interpreter.parse(code)
+    for backend in (Backend.TREE, Backend.STACK):
+        with pytest.raises(error, match=message):
+            interpreter.execute(tree, backend)
+
+
+def test_stack_calls_functions():
+    """Test if functions called from a linearized expression are evaluated with their arguments."""
+    interpreter = Interpreter(backend=Backend.STACK)
+    interpreter.evaluate(
+        'fun pay(rate, hours) = if hours > 8 then rate * hours * 1.5 else rate * hours'
+    )
+    assert interpreter.evaluate('pay(20, 10) + pay(20, 4)') == \
+        interpreter.evaluate('pay(20, 10) + pay(20, 4)', Backend.TREE) == 380
+
+
+@pytest.mark.parametrize('terms', [sys.getrecursionlimit() * 10, 100_000])
+def test_deep_chain(terms: int):
+    """Test if a left-associative chain far deeper than the recursion limit is evaluated."""
+    interpreter = Interpreter(optimize=False, backend=Backend.STACK)
+    interpreter.evaluate('var hour = 1')
+    assert interpreter.evaluate(' + '.join(['hour'] * terms)) == terms
+
+
+def test_deep_chain_is_folded():
+    """Test if constant folding of a chain deeper than the recursion limit folds it whole."""
+    interpreter = Interpreter()
+    terms = sys.getrecursionlimit() * 10
+    tree = interpreter.parse(' - '.join(['1'] * terms))
+    assert len(linearize(tree)) == 1
+    assert interpreter.execute(tree, Backend.STACK) == 2 - terms
@@ -0,0 +1,92 @@
+"""Module with tests of user-defined functions and their memoization."""
+
+from typing import Any
+
+import pytest
+
+from core.interpreter import Backend, Interpreter
+from core.tokens.literal import Duration
+
+
+@pytest.fixture(name='interpreter', params=list(Backend), ids=lambda backend: backend.value)
+def fixture_interpreter(request: pytest.FixtureRequest) -> Interpreter:
+    """Supply an interpreter with every backend in turn."""
+    return Interpreter(backend=request.param)
+
+
+@pytest.mark.parametrize('declaration,call,result', [
+    ('fun pay(hours, rate) = hours * rate', 'pay(8, 20)', 160),
+    ('fun worked(start, end) = end - start', 'worked(8:00, 17:30)', Duration('9h30m')),
+    ('fun greeting() = "Hi, µLang"', 'greeting()', 'Hi, µLang'),
+    ('fun half(x) = x / 2', 'half(half(10)) + 1', 3.5),
+    ('fun overtime(hours) = if hours > 8 then hours - 8 else 0', 'overtime(6)', 0),
+    ('fun overtime(hours) = if hours > 8 then hours - 8', 'overtime(6)', None),
+])
+def test_calling_functions(interpreter: Interpreter, declaration: str, call: str, result: Any):
+    """Test if declared functions evaluate their bodies with the arguments."""
+    assert interpreter.evaluate(declaration).startswith('fun ')
+    assert interpreter.evaluate(call) == result
+
+
+def test_recursion(interpreter: Interpreter):
+    """Test if a function may call itself."""
+    interpreter.evaluate('fun fib(n) = if n < 2 then n else fib(n - 1) + fib(n - 2)')
+    assert interpreter.evaluate('fib(15)') == 610
+
+
+def test_parameters_shadow_variables(interpreter: Interpreter):
+    """Test if parameters hide variables of the same name and other variables stay visible."""
+    interpreter.evaluate('var hours = 100')
+    interpreter.evaluate('var rate = 20')
+    interpreter.evaluate('fun pay(hours) = hours * rate')
+    assert interpreter.evaluate('pay(8)') == 160
+    assert interpreter.evaluate('hours') == 100
+
+
+@pytest.mark.parametrize('code,error', [
+    ('pay(8)', TypeError),
+    ('hours(8)', TypeError),
+    ('missing(8)', NameError),
+    ('fun twice(x, x) = x * 2', ValueError),
+])
+def test_invalid_calls(interpreter: Interpreter, code: str, error: type[Exception]):
+    """Test if calls with the wrong number of arguments or of non-functions fail."""
+    interpreter.evaluate('var hours = 8')
+    interpreter.evaluate('fun pay(hours, rate) = hours * rate')
+    with pytest.raises(error):
+        interpreter.evaluate(code)
+
+
+def test_memoization(interpreter: Interpreter):
+    """Test if a memoized function computes once per arguments and evicts old results."""
+    interpreter.evaluate('fun fib(n) = if n < 2 then n else fib(n - 1) + fib(n - 2)')
+    memo = interpreter.memoize('fib', capacity=100)
+    assert interpreter.evaluate('fib(60)') == 1548008755920
+    stats = memo.stats()
+    assert (stats.misses, stats.hits, stats.size) == (61, 58, 61)
+
+    interpreter.evaluate('fib(60)')
+    assert memo.stats().hits == 59
+    assert interpreter.memoize('fib') is memo
+
+
+def test_memo_evicts_least_recently_used(interpreter: Interpreter):
+    """Test if a full memo evicts the result used longest ago."""
+    interpreter.evaluate('fun square(x) = x * x')
+    memo = interpreter.memoize('square', capacity=2)
+    for code in ('square(1)', 'square(2)', 'square(1)', 'square(3)', 'square(1)', 'square(2)'):
+        interpreter.evaluate(code)
+    stats = memo.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (2, 4, 2, 2)
+
+
+def test_redeclaring_drops_memo(interpreter: Interpreter):
+    """Test if a redeclared function does not use results of the previous one."""
+    interpreter.evaluate('fun rate(hours) = hours * 20')
+    interpreter.memoize('rate')
+    assert interpreter.evaluate('rate(8)') == 160
+    with pytest.raises(UserWarning):
+        interpreter.evaluate('fun rate(hours) = hours * 30')
+    assert interpreter.evaluate('rate(8)') == 240
+    with pytest.raises(TypeError):
+        interpreter.memoize('hours')
@@ -0,0 +1,49 @@
+"""Module with tests of instrumentation of the interpreter."""
+
+from core.cache import ParseCache
+from core.instrumentation import Measurement, Statistics, grammar_timings
+from core.interpreter import Interpreter, shared_parser
+
+
+def test_measurements_of_phases():
+    """Test if a cache miss is measured phase by phase and a hit skips lexing and parsing."""
+    measurements: list[Measurement] = []
+    interpreter = Interpreter(parse_cache=ParseCache(), instrument=measurements.append)
+    assert interpreter.evaluate('2 ^ 10 - 1') == 1023
+    interpreter.evaluate('2 ^ 10 - 1')
+
+    miss, hit = measurements[0], measurements[1]
+    assert not miss.cache_hit
+    assert miss.tokens == 5
+    assert miss.lexing > 0 and miss.parsing > 0 and miss.evaluation > 0
+    assert miss.nodes == 1, 'Constant subtrees are folded before evaluation.'
+    assert hit.cache_hit
+    assert hit.tokens == 0 and hit.lexing == 0 and hit.parsing == 0
+
+
+def test_unoptimized_nodes_are_counted():
+    """Test if every node of the evaluated AST is counted."""
+    measurements: list[Measurement] = []
+    interpreter = Interpreter(optimize=False, instrument=measurements.append)
+    interpreter.evaluate('if 1 < 2 then 2 ^ 10 - 1')
+    assert measurements[0].nodes == 9
+
+
+def test_statistics():
+    """Test if statistics total the measurements."""
+    statistics = Statistics()
+    interpreter = Interpreter(parse_cache=ParseCache(), instrument=statistics.record)
+    for code in ('9:30 - 8:00', '9:30 - 8:00', '1 + 1'):
+        interpreter.evaluate(code)
+
+    assert statistics.evaluations == 3
+    assert statistics.cache_hits == 1
+    assert statistics.tokens == 6
+    assert statistics.last is not None and statistics.last.code == '1 + 1'
+    assert 'evaluations: 3 (1 parse cache hits)' in statistics.report()
+
+
+def test_grammar_build_is_timed():
+    """Test if building the shared parser is timed."""
+    shared_parser()
+    assert grammar_timings['parser'] > 0
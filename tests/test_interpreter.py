@@ -0,0 +1,42 @@
+"""Module with tests of the reusable `Interpreter`."""
+
+import subprocess
+import sys
+
+from core.interpreter import Interpreter, shared_lexer, shared_parser
+from core.tokens.literal import Duration
+from main import evaluate
+
+
+def test_grammar_is_built_once():
+    """Test if all interpreters share one lexer and one parser."""
+    assert shared_lexer() is shared_lexer()
+    assert shared_parser() is shared_parser()
+
+
+def test_interpreter_is_reusable():
+    """Test if one interpreter evaluates many pieces of code in a row."""
+    interpreter = Interpreter()
+    for _ in range(3):
+        assert interpreter.evaluate('9:30 - 8:00') == Duration('1h30m')
+
+
+def test_interpreter_keeps_its_own_symbol_table():
+    """Test if variables persist in an interpreter, but not between interpreters."""
+    interpreter = Interpreter()
+    evaluate('var hours = 8', interpreter=interpreter)
+    assert evaluate('hours', interpreter=interpreter) == 8.0
+    assert Interpreter().symbol_table['hours'] is None
+
+
+def test_evaluation_imports_only_what_it_uses():
+    """Test if evaluating code leaves modules of other features unloaded, for a fast start."""
+    modules = ['core.batch', 'core.evaluator', 'core.reactive', 'core.script', 'core.vectorize']
+    code = (
+        "import sys; from main import evaluate; evaluate('9:30 - 8:00'); "
+        f"print([module for module in {modules} if module in sys.modules])"
+    )
+    output = subprocess.run(
+        [sys.executable, '-c', code], check=True, capture_output=True, text=True
+    ).stdout
+    assert output.strip() == '[]'
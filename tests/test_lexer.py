@@ -0,0 +1,70 @@
+"""Module with differential tests of the lexers against the `rply` lexer."""
+
+import random
+
+import pytest
+
+from core.lexer import Lexer, LexingError
+
+rply = pytest.importorskip('rply')
+
+SOURCES = [
+    '10 - 10 + 10 * 10 / 2',
+    '-5.5e3 ^ .5 - 3. * +2',
+    '12:15 - 8:30',
+    'if 10 < 30 then "Hi, µLang"',
+    'var complex_case = 2 ^ 10',
+    'fun pay(hours,rate) = if hours > 8 then hours * rate else elsewhere(1 , 2)',
+    'iffy >= thenceforth <= var_1 == fun-2',
+    '"multi\nline" \n\n (1)\t+\r\n9:30',
+    'x1.5 1.5.5 5e 12:345',
+    '',
+]
+
+
+def tokens(lexer, code: str) -> tuple[list[tuple], int | None]:
+    """Supply tokens with their positions and the index of a lexing error, if any."""
+    result = []
+    try:
+        for token in lexer.lex(code):
+            position = token.getsourcepos()
+            result.append((
+                token.gettokentype(),
+                token.getstr(),
+                position.idx,
+                position.lineno,
+                position.colno,
+            ))
+    except (LexingError, rply.LexingError) as error:
+        return result, error.getsourcepos().idx
+    return result, None
+
+
+def fuzzed(count: int = 500) -> list[str]:
+    """Generate random code from fragments of µLang tokens and stray characters."""
+    generator = random.Random(0)
+    fragments = [
+        'if', 'then', 'var', 'fun', 'x', '_a-1', '9', '12', '.', '5', 'e', ':', ':30',
+        '>', '=', '<', '+', '-', '*', '/', '^', '(', ')', '"', ' ', '\n', '\t', '$',
+    ]
+    return [
+        ''.join(generator.choices(fragments, k=generator.randint(1, 20)))
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize('single_pass', [True, False], ids=['single pass', 'rule by rule'])
+def test_lexers_match_rply(single_pass: bool):
+    """Test if a lexer produces the same tokens and errors as the `rply` lexer."""
+    expected = Lexer().get_rules().build_rply()
+    lexer = Lexer().get_lexer(single_pass)
+    for code in SOURCES + fuzzed():
+        assert tokens(lexer, code) == tokens(expected, code), code
+
+
+def test_error_position():
+    """Test if a lexing error points at the unrecognised character."""
+    with pytest.raises(LexingError) as error:
+        list(Lexer().get_lexer().lex('1 +\n  $'))
+    position = error.value.getsourcepos()
+    assert (position.idx, position.lineno, position.colno) == (6, 2, 3)
@@ -0,0 +1,81 @@
+"""Module with tests of time and duration literals."""
+
+from decimal import Decimal
+
+import pytest
+
+from core.tokens.literal import Duration, Time
+
+
+@pytest.mark.parametrize('text,minutes', [
+    ('00:00', 0),
+    ('09:30', 570),
+    ('24:00', 1440),
+])
+def test_time_from_text_and_minutes(text: str, minutes: int):
+    """Test if a time created from its text equals the one created from minutes."""
+    assert Time(text) == Time(minutes)
+    assert Time(text).total_minutes == minutes
+    assert str(Time(minutes)) == text
+
+
+@pytest.mark.parametrize('text,minutes', [
+    ('0m', 0),
+    ('45m', 45),
+    ('2h', 120),
+    ('3h15m', 195),
+])
+def test_duration_from_text_and_minutes(text: str, minutes: int):
+    """Test if a duration created from its text equals the one created from minutes."""
+    assert Duration(text) == Duration(minutes)
+    assert str(Duration(minutes)) == text
+
+
+def test_hashing():
+    """Test if equal times and durations are interchangeable as keys."""
+    assert len({Time('9:30'), Time(570), Duration('1h'), Duration(60)}) == 2
+
+
+def test_ordering():
+    """Test if times and durations are ordered by their minutes."""
+    assert sorted([Time('12:00'), Time('8:15'), Time('9:00')]) == [
+        Time('8:15'), Time('9:00'), Time('12:00')
+    ]
+    assert Duration('1h') < Duration('61m') <= Duration('1h1m')
+    with pytest.raises(TypeError):
+        _ = Time('9:00') < Duration('1h')
+
+
+@pytest.mark.parametrize('result,expected', [
+    (lambda: Duration('1h30m') + Duration('45m'), Duration('2h15m')),
+    (lambda: Duration('1h30m') - Duration('45m'), Duration('45m')),
+    (lambda: Duration('1h30m') * 2.0, Duration('3h')),
+    (lambda: 0.5 * Duration('1h30m'), Duration('45m')),
+    (lambda: Duration('1h30m') / 3.0, Duration('30m')),
+    (lambda: Duration('1h30m') / Duration('1h'), 1.5),
+    (lambda: Time('9:30') + Duration('45m'), Time('10:15')),
+    (lambda: Duration('45m') + Time('9:30'), Time('10:15')),
+    (lambda: Time('9:30') - Duration('45m'), Time('8:45')),
+])
+def test_arithmetic(result, expected):
+    """Test if times and durations support arithmetic."""
+    assert result() == expected
+
+
+@pytest.mark.parametrize('operation,error', [
+    (lambda: Duration('45m') - Duration('1h'), UserWarning),
+    (lambda: Time('23:30') + Duration('1h'), ValueError),
+    (lambda: Time('0:30') - Duration('1h'), ValueError),
+    (lambda: Time('9:30') + Time('1:00'), TypeError),
+])
+def test_invalid_arithmetic(operation, error: type[Exception]):
+    """Test if results out of range or of meaningless operations are rejected."""
+    with pytest.raises(error):
+        operation()
+
+
+@pytest.mark.parametrize('divisor', [0, 0.0, Decimal(0), Duration('0m')])
+def test_dividing_duration_by_zero(divisor: float | Decimal | Duration):
+    """Test if dividing a duration by a zero number or a zero duration raises one error."""
+    with pytest.raises(ZeroDivisionError, match='You cannot divide by 0.'):
+        _ = Duration('1h30m') / divisor
@@ -0,0 +1,72 @@
+"""Module with tests of numeric modes: floats, exact integers and decimals."""
+
+from decimal import Decimal
+
+import pytest
+
+from core.interpreter import Backend, Interpreter
+from core.symbol_table_manager import SymbolTableManager
+from core.tokens.literal import Duration, Numeric
+
+
+@pytest.mark.parametrize('backend', list(Backend))
+@pytest.mark.parametrize('numeric,code,expected', [
+    (Numeric.FLOAT, '2 ^ 64 + 1', 2.0 ** 64),
+    (Numeric.INTEGER, '2 ^ 64 + 1', 2 ** 64 + 1),
+    (Numeric.DECIMAL, '2 ^ 64 + 1', Decimal(2 ** 64 + 1)),
+    (Numeric.FLOAT, '0.1 + 0.2', 0.1 + 0.2),
+    (Numeric.INTEGER, '0.1 + 0.2', 0.1 + 0.2),
+    (Numeric.DECIMAL, '0.1 + 0.2', Decimal('0.3')),
+    (Numeric.INTEGER, '7 - 2 * 3', 1),
+    (Numeric.INTEGER, '7 / 2', 3.5),
+    (Numeric.INTEGER, '2 ^ -1', 0.5),
+    (Numeric.INTEGER, '-2 ^ 2', 4),
+    (Numeric.DECIMAL, '1 / 4', Decimal('0.25')),
+    (Numeric.INTEGER, 'if 10 * 3 > 29 then 1 else 2.5', 1),
+])
+def test_numbers_have_type_of_mode(backend: Backend, numeric: Numeric, code: str, expected):
+    """Test if every backend evaluates numbers to the type of the numeric mode."""
+    for optimize in (False, True):
+        interpreter = Interpreter(backend=backend, optimize=optimize, numeric=numeric)
+        value = interpreter.evaluate(code)
+        assert value == expected
+        assert type(value) is type(expected)
+
+
+@pytest.mark.parametrize('backend', list(Backend))
+@pytest.mark.parametrize('numeric', list(Numeric))
+def test_powers_are_bounded(backend: Backend, numeric: Numeric):
+    """Test if a huge power raises an overflow in every mode instead of being computed."""
+    interpreter = Interpreter(backend=backend, numeric=numeric)
+    interpreter.evaluate('var base = 9999999')
+    with pytest.raises(OverflowError):
+        interpreter.evaluate('base ^ 99999999')
+
+
+def test_modes_do_not_share_cached_asts():
+    """Test if the same code parsed in two modes keeps numbers of each mode."""
+    integers = Interpreter(numeric=Numeric.INTEGER)
+    floats = Interpreter()
+    assert isinstance(integers.evaluate('6 * 7'), int)
+    assert isinstance(floats.evaluate('6 * 7'), float)
+
+
+def test_durations_by_decimals():
+    """Test if durations are multiplied and divided by decimals."""
+    interpreter = Interpreter(SymbolTableManager(), numeric=Numeric.DECIMAL)
+    interpreter.evaluate('var shift = 9:30 - 8:00')
+    assert interpreter.evaluate('shift * 1.5') == Duration('2h15m')
+    assert interpreter.evaluate('shift / 2') == Duration('45m')
+
+
+def test_snapshots_keep_exact_numbers(tmp_path):
+    """Test if integers and decimals are restored from a snapshot exactly."""
+    symbol_table = SymbolTableManager()
+    Interpreter(symbol_table, numeric=Numeric.INTEGER).evaluate('var big = 2 ^ 100 + 1')
+    decimals = Interpreter(symbol_table, numeric=Numeric.DECIMAL)
+    decimals.evaluate('var total = 0.1 + 0.2')
+    decimals.save(tmp_path / 'session.snapshot')
+    restored = Interpreter(SymbolTableManager())
+    restored.restore(tmp_path / 'session.snapshot')
+    assert restored.evaluate('big') == 2 ** 100 + 1
+    assert restored.evaluate('total') == Decimal('0.3')
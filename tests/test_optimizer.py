@@ -0,0 +1,94 @@
+"""Module with tests of folding constant subtrees of ASTs."""
+
+import sys
+
+import pytest
+
+from core.interpreter import Interpreter
+from core.optimizer import children
+from core.symbol_table_manager import Symbol, SymbolType
+from core.tokens.literal import Numeric
+
+
+@pytest.mark.parametrize('code,tree', [
+    ('10 - 10 + 10 * 10 / 2', 'Number 50.0'),
+    ('2 ^ 10', 'Number 1024.0'),
+    ('12:15 - 8:30', 'Duration 3h45m'),
+    ('if 10 < 30 then "Hi, µLang"', 'String "Hi, µLang"'),
+    ('if 30 < 10 then "Hi, µLang"', 'Constant None'),
+    ('var complex_case = 2 ^ 10', 'VariableDeclaration complex_case\n  Number 1024.0'),
+])
+def test_folding_literals(code: str, tree: str):
+    """Test if subtrees made of literals are folded into a single literal."""
+    assert Interpreter().dump(code) == tree
+
+
+@pytest.mark.parametrize('code,error', [
+    ('10 / 0', ZeroDivisionError),
+    ('9999999 ^ 99999999', OverflowError),
+    ('8:00 - 9:00', UserWarning),
+])
+def test_folding_preserves_errors(code: str, error: type[Exception]):
+    """Test if subtrees raising on evaluation are kept, so they raise as before."""
+    interpreter = Interpreter()
+    assert interpreter.dump(code) == Interpreter(optimize=False).dump(code)
+    with pytest.raises(error):
+        interpreter.evaluate(code)
+
+
+def test_dumping_nested_nodes():
+    """Test if children are rendered in order, indented below their parents."""
+    tree = Interpreter(optimize=False).dump('if 1 < 2 then pay(1 + 2, "x") else 3')
+    assert tree.splitlines() == [
+        'IfStatement',
+        '  LessThan',
+        '    Number 1',
+        '    Number 2',
+        '  FunctionCall pay',
+        '    Addition',
+        '      Number 1',
+        '      Number 2',
+        '    String "x"',
+        '  Number 3',
+    ]
+
+
+def test_dumping_deep_chain():
+    """Test if an AST deeper than the recursion limit is rendered."""
+    terms = sys.getrecursionlimit() * 2
+    lines = Interpreter(optimize=False).dump('1' + ' + 1' * terms).splitlines()
+    assert len(lines) == 2 * terms + 1
+    assert lines[terms] == ' ' * 2 * terms + 'Number 1'
+
+
+def leaves(tree) -> list:
+    """Supply leaves of an AST from left to right."""
+    nodes = children(tree)
+    return [leaf for node in nodes for leaf in leaves(node)] if nodes else [tree]
+
+
+@pytest.mark.parametrize('numeric', list(Numeric))
+def test_repeated_literals_are_shared(numeric: Numeric):
+    """Test if equal literals, even of other statements, are the same token."""
+    interpreter = Interpreter(optimize=False, numeric=numeric)
+    first = interpreter.prepare('if 9:00 - 8:00 < 9:00 - 7:00 then 8 else "late"')
+    second = interpreter.prepare('if 10:00 - 8:00 < 2:00 - 1:00 then 8 * 2 else "late"')
+    nine, eight, _, seven, number, late = leaves(first)
+    assert nine is leaves(first)[2] and eight is leaves(second)[1]
+    assert number is leaves(second)[4] and late is leaves(second)[-1]
+    assert seven is not leaves(second)[3]
+    assert interpreter.execute(first) == 8
+
+
+@pytest.mark.parametrize('code', [
+    'var shift = if 8:00 < 9:00 then 2 ^ 3 else pay(8, "late")',
+    'fun pay(hours, note) = hours * 20 == 100',
+])
+def test_nodes_have_no_dict(code: str):
+    """Test if every node of an AST, and a symbol, has slots instead of a `__dict__`."""
+    stack = [Interpreter(optimize=False).prepare(code)]
+    while stack:
+        node = stack.pop()
+        assert not hasattr(node, '__dict__'), type(node).__name__
+        stack.extend(children(node))
+    assert not hasattr(Symbol('hours', SymbolType.VARIABLE, 8), '__dict__')
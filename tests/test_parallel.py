@@ -0,0 +1,41 @@
+"""Module with tests of evaluating programs in parallel."""
+
+import pytest
+
+from core.batch import Status
+from core.grammar import ParsingError
+from core.parallel import evaluate_parallel
+
+PROGRAMS = [
+    'var hours = 8; hours',
+    '9:30 - 8:00',
+    'hours',
+    '1 / 0',
+    'var hours = 6\nhours',
+    'var hours = 8\nhours +',
+]
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_order_and_isolation(workers: int):
+    """Test if results, errors of syntax included, keep the order of isolated programs."""
+    results = list(evaluate_parallel(PROGRAMS, workers=workers, chunksize=2))
+    assert [result.index for result in results] == list(range(len(PROGRAMS)))
+    assert [result.source for result in results] == PROGRAMS
+    assert results[0].value == ['hours = 8.0', 8.0]
+    assert str(results[1].value[0]) == '1h30m'
+    assert results[2].status is Status.ERROR
+    assert isinstance(results[2].error, NameError)
+    assert isinstance(results[3].error, ZeroDivisionError)
+    assert results[4].value == ['hours = 6.0', 6.0]
+    assert results[5].status is Status.ERROR
+    assert isinstance(results[5].error, ParsingError)
+    assert str(results[5].error) == 'Unexpected end of code'
+    assert results[5].error.__notes__ == ['In a statement at line 2: hours +']
+
+
+@pytest.mark.parametrize('workers,chunksize', [(0, 1), (2, 0)])
+def test_invalid_arguments(workers: int, chunksize: int):
+    """Test if a non-positive number of workers or chunk size is rejected."""
+    with pytest.raises(ValueError):
+        evaluate_parallel(PROGRAMS, workers=workers, chunksize=chunksize)
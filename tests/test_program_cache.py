@@ -0,0 +1,127 @@
+"""Module with tests of caching parsed programs on disk."""
+
+from pathlib import Path
+
+import pytest
+
+import main
+from core import interpreter as interpreter_module
+from core import program_cache
+from core.cache import ParseCache
+from core.interpreter import Backend, Interpreter
+from core.script import run_file
+from core.symbol_table_manager import SymbolTableManager
+from core.tokens.literal import Duration, Numeric
+
+PROGRAM = '''var start = 8:15
+var end = 17:30; var worked = end - start
+fun pay(hours) = hours * 20
+pay(8)
+worked
+pay(8)
+'''
+RESULTS = ['start = 08:15', 'end = 17:30', 'worked = 9h15m', 'fun pay(hours)', 160.0,
+           Duration('9h15m'), 160.0]
+
+
+@pytest.fixture(name='path')
+def fixture_path(tmp_path: Path) -> Path:
+    """Supply the path of a program."""
+    path = tmp_path / 'program.u'
+    path.write_text(PROGRAM, encoding='utf-8')
+    return path
+
+
+def run(path: Path, interpreter: Interpreter | None = None) -> list:
+    """Run a program with the cache, in a fresh interpreter if not given."""
+    return list(run_file(str(path), interpreter or Interpreter(SymbolTableManager()), cache=True))
+
+
+def test_second_run_does_not_parse(path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test if a program run again is loaded from the cache and gives the same results."""
+    assert run(path) == RESULTS
+    assert (path.parent / '__ucache__' / 'program.u.float.ucache').exists()
+
+    def prepare(*_):
+        raise AssertionError('Parsed a cached program.')
+    monkeypatch.setattr(Interpreter, 'prepare', prepare)
+    assert run(path) == RESULTS
+
+
+def test_loaded_statements_are_resolved_once(path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test if statements loaded from the cache reuse their resolved ASTs, as parsed code does."""
+    run(path)
+    cache = ParseCache()
+    assert run(path, Interpreter(SymbolTableManager(), parse_cache=cache)) == RESULTS
+
+    def resolve(*_):
+        raise AssertionError('Resolved a cached statement again.')
+    monkeypatch.setattr(interpreter_module, 'resolve', resolve)
+    for backend in Backend:
+        interpreter = Interpreter(SymbolTableManager(), backend=backend, parse_cache=cache)
+        assert run(path, interpreter) == RESULTS
+
+
+def test_changed_program_is_parsed_again(path: Path):
+    """Test if a cache of a program changed since is not used."""
+    run(path)
+    path.write_text(PROGRAM.replace('hours * 20', 'hours * 25'), encoding='utf-8')
+    assert run(path)[-1] == 200.0
+    assert run(path)[-1] == 200.0
+
+
+@pytest.mark.parametrize('corrupt', [
+    lambda data: b'',
+    lambda data: data[:20],
+    lambda data: data[:-1] + bytes([data[-1] ^ 1]),
+    lambda data: data[:4] + b'\xff\xff' + data[6:],
+])
+def test_corrupted_cache_is_replaced(path: Path, corrupt):
+    """Test if a cache which cannot be read is ignored and written again."""
+    run(path)
+    cached = path.parent / '__ucache__' / 'program.u.float.ucache'
+    data = cached.read_bytes()
+    cached.write_bytes(corrupt(data))
+    assert run(path) == RESULTS
+    assert cached.read_bytes() == data
+
+
+def test_modes_have_caches_of_their_own(path: Path):
+    """Test if a program run in another numeric mode is not given ASTs of floats."""
+    run(path)
+    assert run(path, Interpreter(SymbolTableManager(), numeric=Numeric.INTEGER))[4] == 160
+    assert isinstance(run(path, Interpreter(SymbolTableManager(), numeric=Numeric.INTEGER))[4], int)
+    assert len(list((path.parent / '__ucache__').iterdir())) == 2
+
+
+def test_failed_programs_are_not_cached(tmp_path: Path):
+    """Test if a program stopped by an error is not cached and the error names its line."""
+    path = tmp_path / 'failing.u'
+    path.write_text('1 + 1\nvar = 2\n', encoding='utf-8')
+    with pytest.raises(ValueError) as error:
+        run(path)
+    assert 'In a statement at line 2: var = 2' in error.value.__notes__
+    assert not (tmp_path / '__ucache__').exists()
+
+
+def test_uncacheable_programs_still_run(tmp_path: Path):
+    """Test if a program too deeply nested to pickle, or a read-only cache, is only not cached."""
+    path = tmp_path / 'deep.u'
+    path.write_text(' + '.join(['1'] * 5000), encoding='utf-8')
+    interpreter = Interpreter(SymbolTableManager(), backend=Backend.STACK, optimize=False)
+    assert list(program_cache.run_file(path, interpreter)) == [5000.0]
+    assert not list((tmp_path / '__ucache__').glob('*.ucache'))
+
+    blocked = tmp_path / 'blocked'
+    blocked.write_text('not a directory', encoding='utf-8')
+    path.write_text(PROGRAM, encoding='utf-8')
+    assert list(program_cache.run_file(path, Interpreter(SymbolTableManager()), blocked)) == RESULTS
+
+
+def test_scripts_are_not_cached_by_default(path: Path, capsys: pytest.CaptureFixture[str]):
+    """Test if running a script streams it without writing a cache unless asked to."""
+    assert main.run(str(path)) == 0
+    assert not (path.parent / '__ucache__').exists()
+    assert main.run(str(path), cache=True) == 0
+    assert (path.parent / '__ucache__' / 'program.u.float.ucache').exists()
+    assert capsys.readouterr().out.splitlines()[-1] == '160.0'
@@ -0,0 +1,112 @@
+"""Module with tests of reactive variables, recomputed when variables they depend on change."""
+
+import pytest
+
+from core.interpreter import Backend, Interpreter
+from core.tokens.literal import Duration
+
+
+@pytest.fixture(name='interpreter', params=list(Backend), ids=lambda backend: backend.value)
+def fixture_interpreter(request: pytest.FixtureRequest) -> Interpreter:
+    """Supply a reactive interpreter with every backend in turn."""
+    return Interpreter(backend=request.param, reactive=True)
+
+
+def test_redeclaring_recomputes_dependents(interpreter: Interpreter):
+    """Test if variables declared from a redeclared variable are updated."""
+    for code in ('var start = 8:00', 'var end = 17:30', 'var worked = end - start'):
+        interpreter.evaluate(code)
+    assert interpreter.evaluate('var start = 9:00') == 'start = 09:00\nworked = 8h30m'
+    assert interpreter.evaluate('worked') == Duration('8h30m')
+
+
+def test_dependents_are_recomputed_in_topological_order(interpreter: Interpreter):
+    """Test if a variable is recomputed after all variables it depends on."""
+    for code in (
+        'var hours = 8',
+        'var pay = hours * 2',
+        'var unrelated = 1',
+        'var overtime = hours - 6',
+        'var total = hours + overtime',
+        'var pay = total * 20',
+    ):
+        interpreter.evaluate(code)
+    assert interpreter.evaluate('var hours = 10').splitlines() == [
+        'hours = 10.0', 'overtime = 4.0', 'total = 14.0', 'pay = 280.0',
+    ]
+    assert interpreter.evaluate('pay') == 280
+
+
+@pytest.mark.parametrize('code', ['var a = a + 1', 'var a = c * 2'])
+def test_cycles_are_rejected(interpreter: Interpreter, code: str):
+    """Test if a variable depending on itself is rejected and nothing changes."""
+    for declaration in ('var a = 1', 'var b = a + 1', 'var c = b + 1'):
+        interpreter.evaluate(declaration)
+    with pytest.raises(ValueError, match='depend'):
+        interpreter.evaluate(code)
+    assert [interpreter.evaluate(name) for name in 'abc'] == [1, 2, 3]
+    assert interpreter.evaluate('var a = 5') == 'a = 5.0\nb = 6.0\nc = 7.0'
+
+
+def test_failed_recomputation_changes_nothing(interpreter: Interpreter):
+    """Test if an error in a dependent leaves all variables as they were."""
+    for code in ('var hours = 8', 'var rate = 160 / hours', 'var pay = rate * hours'):
+        interpreter.evaluate(code)
+    with pytest.raises(ZeroDivisionError):
+        interpreter.evaluate('var hours = 0')
+    assert [interpreter.evaluate(name) for name in ('hours', 'rate', 'pay')] == [8, 20, 160]
+
+
+def test_variables_read_by_functions_are_dependencies(interpreter: Interpreter):
+    """Test if a variable computed by a function is updated when a variable its body reads is."""
+    for code in (
+        'var rate = 10',
+        'fun pay(hours) = hours * rate',
+        'fun daily(hours) = pay(hours) + 5',
+        'var wage = daily(8)',
+    ):
+        interpreter.evaluate(code)
+    assert interpreter.evaluate('var rate = 20') == 'rate = 20.0\nwage = 165.0'
+    assert interpreter.evaluate('wage') == 165
+
+
+def test_redeclaring_function_recomputes_dependents(interpreter: Interpreter):
+    """Test if variables calling a redeclared function are updated, with its new dependencies."""
+    for code in (
+        'var rate = 10', 'var bonus = 1', 'fun pay(hours) = hours * rate', 'var p = pay(8)',
+    ):
+        interpreter.evaluate(code)
+    assert interpreter.evaluate('fun pay(hours) = hours + bonus') == 'fun pay(hours)\np = 9.0'
+    assert interpreter.evaluate('var rate = 20') == 'rate = 20.0'
+    assert interpreter.evaluate('var bonus = 2') == 'bonus = 2.0\np = 10.0'
+
+
+def test_functions_take_part_in_cycles(interpreter: Interpreter):
+    """Test if a variable cannot depend on itself through a function, but recursion is fine."""
+    for code in ('var factor = 2', 'fun scaled(x) = x * factor'):
+        interpreter.evaluate(code)
+    with pytest.raises(ValueError, match='depend'):
+        interpreter.evaluate('var factor = scaled(2)')
+    assert interpreter.evaluate('factor') == 2
+    interpreter.evaluate('fun fib(n) = if n < 2 then n else fib(n - 1) + fib(n - 2)')
+    assert interpreter.evaluate('var f = fib(10)') == 'f = 55.0'
+
+
+def test_failed_function_redeclaration_changes_nothing(interpreter: Interpreter):
+    """Test if a redeclared function breaking a dependent is not declared."""
+    for code in ('fun rate(hours) = 160 / hours', 'var hours = 8', 'var r = rate(hours)'):
+        interpreter.evaluate(code)
+    with pytest.raises(ZeroDivisionError):
+        interpreter.evaluate('fun rate(hours) = hours / 0')
+    assert interpreter.evaluate('rate(4)') == 40
+    assert interpreter.evaluate('r') == 20
+
+
+def test_eager_interpreter_keeps_stale_values():
+    """Test if variables are not recomputed unless the interpreter is reactive."""
+    interpreter = Interpreter()
+    interpreter.evaluate('var hours = 8')
+    interpreter.evaluate('var pay = hours * 20')
+    with pytest.raises(UserWarning):
+        interpreter.evaluate('var hours = 10')
+    assert interpreter.evaluate('pay') == 160
@@ -0,0 +1,76 @@
+"""Module with tests of running µLang scripts."""
+
+import pytest
+
+import main
+from core.script import run_file, run_script, split_statements
+
+
+@pytest.mark.parametrize('lines,statements', [
+    (['9 + 4\n'], [(1, '9 + 4')]),
+    (['var a = 1; var b = 2\n', '\n', 'a\n'], [(1, 'var a = 1'), (1, 'var b = 2'), (3, 'a')]),
+    (['"semi;colon"; 1\n'], [(1, '"semi;colon"'), (1, '1')]),
+    (['var text = "two\n', 'lines"\n', '2\n'], [(1, 'var text = "two\nlines"'), (3, '2')]),
+    ([';;\n', '   \n'], []),
+])
+def test_splitting_statements(lines: list[str], statements: list[tuple[int, str]]):
+    """Test if statements are split at newlines and semicolons outside strings."""
+    assert list(split_statements(lines)) == statements
+
+
+def test_statements_share_symbol_table():
+    """Test if a statement sees variables declared by the previous ones."""
+    results = run_script(['var hours = 8\n', 'hours\n'])
+    assert list(results) == ['hours = 8.0', 8.0]
+
+
+def test_results_are_streamed():
+    """Test if results are produced before the rest of a script is read."""
+    def lines():
+        yield '1 + 1\n'
+        raise AssertionError('Read ahead of the evaluated statement.')
+
+    assert next(run_script(lines())) == 2
+
+
+def test_error_points_at_line():
+    """Test if an error of a statement stops a script and names its line."""
+    with pytest.raises(ZeroDivisionError) as error:
+        list(run_script(['1 + 1\n', '1 / 0\n', '2 + 2\n']))
+    assert error.value.__notes__ == ['In a statement at line 2: 1 / 0']
+
+
+def test_running_file(tmp_path):
+    """Test if a `.u` file is run statement by statement."""
+    path = tmp_path / 'program.u'
+    path.write_text('var a = 2 ^ 10; a\n', encoding='utf-8')
+    assert list(run_file(str(path))) == ['a = 1024.0', 1024.0]
+
+
+@pytest.mark.parametrize('arguments,status,last', [
+    (['--lenient', '{path}'], 0, '2.0'),
+    (['{path}', '--lenient'], 0, '2.0'),
+    (['{path}'], 1, 'a = 1.0'),
+    (['--numeric', 'integer', '{path}', '--lenient'], 0, '2'),
+])
+def test_running_file_from_command_line(
+    tmp_path, capsys: pytest.CaptureFixture[str], arguments: list[str], status: int, last: str,
+):
+    """Test if options are applied to a script wherever they are given."""
+    path = tmp_path / 'redeclared.u'
+    path.write_text('var a = 1\nvar a = 2\na\n', encoding='utf-8')
+    assert main.main([argument.format(path=path) for argument in arguments]) == status
+    assert capsys.readouterr().out.splitlines()[-1] == last
+
+
+@pytest.mark.parametrize('arguments', [
+    ['--numeric', 'foo'],
+    ['--cache'],
+    ['script.u', '--reactive'],
+])
+def test_invalid_command_line_is_rejected(arguments: list[str], capsys: pytest.CaptureFixture[str]):
+    """Test if invalid options end with a usage error rather than a traceback."""
+    with pytest.raises(SystemExit) as exit_:
+        main.main(arguments)
+    assert exit_.value.code == 2
+    assert 'usage:' in capsys.readouterr().err
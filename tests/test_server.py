@@ -0,0 +1,117 @@
+"""Module with tests of the asyncio server of µLang sessions."""
+
+import asyncio
+import json
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import pytest
+
+from core.interpreter import Interpreter
+from core.server import Server
+
+Client = tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+def serve(server: Server, test: Callable[[str, int], Awaitable[None]]) -> None:
+    """Run a test against the server listening on a free port."""
+    async def run() -> None:
+        listening = await server.start()
+        host, port = listening.sockets[0].getsockname()[:2]
+        async with listening:
+            await test(host, port)
+        server.close()
+    asyncio.run(run())
+
+
+async def request(client: Client, code: str) -> dict[str, Any]:
+    """Send a line of code and decode the response."""
+    reader, writer = client
+    writer.write(code.encode() + b'\n')
+    return json.loads(await reader.readline())
+
+
+def test_sessions_are_isolated():
+    """Test if every connection has its own variables."""
+    async def test(host: str, port: int) -> None:
+        first = await asyncio.open_connection(host, port)
+        second = await asyncio.open_connection(host, port)
+        assert await request(first, 'var hours = 8') == {'status': 'ok', 'value': 'hours = 8.0'}
+        assert await request(first, 'hours * 2') == {'status': 'ok', 'value': '16.0'}
+        assert (await request(second, 'hours'))['status'] == 'error'
+        for _, writer in (first, second):
+            writer.close()
+    serve(Server(), test)
+
+
+def test_errors_are_reported():
+    """Test if errors are responses, which keep the session open."""
+    async def test(host: str, port: int) -> None:
+        client = await asyncio.open_connection(host, port)
+        assert await request(client, '1 / 0') == {
+            'status': 'error', 'message': 'You cannot divide by 0.',
+        }
+        assert (await request(client, '9 + $'))['status'] == 'lexing error'
+        assert (await request(client, '8:00 - 9:00'))['status'] == 'warning'
+        assert await request(client, '9:30 - 8:00') == {'status': 'ok', 'value': '1h30m'}
+        client[1].close()
+    serve(Server(), test)
+
+
+def test_slow_evaluation_times_out(monkeypatch: pytest.MonkeyPatch):
+    """Test if a client is answered once the timeout passes and the session goes on."""
+    evaluate = Interpreter.evaluate
+
+    def slow_evaluate(self: Interpreter, code: str, *arguments: Any) -> Any:
+        if code.startswith('var'):
+            time.sleep(0.2)
+        return evaluate(self, code, *arguments)
+    monkeypatch.setattr(Interpreter, 'evaluate', slow_evaluate)
+
+    async def test(host: str, port: int) -> None:
+        client = await asyncio.open_connection(host, port)
+        assert (await request(client, 'var hours = 8'))['status'] == 'timeout'
+        # The declaration still took effect, before the next request.
+        assert await request(client, 'hours') == {'status': 'ok', 'value': '8.0'}
+        client[1].close()
+    serve(Server(timeout=0.05), test)
+
+
+def test_slow_session_does_not_block_others(monkeypatch: pytest.MonkeyPatch):
+    """Test if other sessions are answered while one session's evaluation is still running."""
+    release = threading.Event()
+    evaluate = Interpreter.evaluate
+
+    def blocking_evaluate(self: Interpreter, code: str, *arguments: Any) -> Any:
+        if code.startswith('fib'):
+            release.wait(5)
+        return evaluate(self, code, *arguments)
+    monkeypatch.setattr(Interpreter, 'evaluate', blocking_evaluate)
+
+    async def test(host: str, port: int) -> None:
+        slow = await asyncio.open_connection(host, port)
+        other = await asyncio.open_connection(host, port)
+        await request(slow, 'fun fib(n) = if n < 2 then n else fib(n - 1) + fib(n - 2)')
+        answer = asyncio.ensure_future(request(slow, 'fib(20)'))
+        await asyncio.sleep(0.05)
+        assert await asyncio.wait_for(request(other, '9:30 - 8:00'), 1) == {
+            'status': 'ok', 'value': '1h30m',
+        }
+        assert not answer.done()
+        release.set()
+        assert await answer == {'status': 'ok', 'value': '6765.0'}
+        for _, writer in (slow, other):
+            writer.close()
+    serve(Server(timeout=10), test)
+
+
+def test_long_request_closes_connection():
+    """Test if a request over the limit is refused and the connection closed."""
+    async def test(host: str, port: int) -> None:
+        client = await asyncio.open_connection(host, port)
+        assert (await request(client, '1 + ' * 100 + '1'))['status'] == 'error'
+        assert await client[0].readline() == b''
+        client[1].close()
+    serve(Server(line_limit=64), test)
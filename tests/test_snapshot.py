@@ -0,0 +1,102 @@
+"""Module with tests of saving variables of a session into snapshots and restoring them."""
+
+import struct
+from pathlib import Path
+
+import pytest
+
+from core import snapshot
+from core.interpreter import Interpreter
+from core.symbol_table_manager import Symbol, SymbolTableManager, SymbolType
+from core.tokens.literal import Duration, Time
+
+
+@pytest.fixture(name='path')
+def fixture_path(tmp_path: Path) -> Path:
+    """Supply a path of a snapshot of a session with variables of every type and a function."""
+    interpreter = Interpreter(SymbolTableManager())
+    for code in (
+        'var start = 8:15',
+        'var end = 17:30',
+        'var worked = end - start',
+        'var rate = 21.5',
+        'var note = "overtime"',
+        'var senior = rate > 20',
+        'var nothing = if rate > 30 then 1',
+        'fun pay(hours) = hours * rate',
+    ):
+        interpreter.evaluate(code)
+    path = tmp_path / 'session.snapshot'
+    assert interpreter.save(path) == ['pay']
+    return path
+
+
+def test_restores_values(path: Path):
+    """Test if restored variables have the saved values and types."""
+    interpreter = Interpreter(SymbolTableManager())
+    assert interpreter.restore(path) == 7
+    assert interpreter.evaluate('start') == Time('8:15')
+    assert interpreter.evaluate('worked') == Duration('9h15m')
+    assert interpreter.evaluate('rate * 2') == 43.0
+    assert interpreter.evaluate('note') == 'overtime'
+    assert interpreter.evaluate('senior') is True
+    assert interpreter.evaluate('nothing') is None
+    assert interpreter.symbol_table['pay'] is None
+
+
+def test_restoring_replaces_variables_without_warnings(path: Path):
+    """Test if variables declared before restoring are replaced and others kept."""
+    interpreter = Interpreter(SymbolTableManager())
+    interpreter.evaluate('var rate = 10')
+    interpreter.evaluate('var kept = 1')
+    interpreter.restore(path)
+    assert interpreter.evaluate('rate + kept') == 22.5
+
+
+def test_restored_variables_are_not_reactive(path: Path):
+    """Test if a restored variable is not recomputed from variables it was declared from."""
+    interpreter = Interpreter(SymbolTableManager(), reactive=True)
+    for code in ('var start = 8:00', 'var end = 17:00', 'var worked = end - start'):
+        interpreter.evaluate(code)
+    interpreter.restore(path)
+    assert interpreter.evaluate('var start = 9:00') == 'start = 09:00'
+    assert interpreter.evaluate('worked') == Duration('9h15m')
+
+
+@pytest.mark.parametrize('corrupt,message', [
+    (lambda data: b'not a snapshot', 'is not a µLang snapshot'),
+    (lambda data: data[:4] + struct.pack('<H', 99) + data[6:], 'has version 99'),
+    (lambda data: data[:-1] + bytes([data[-1] ^ 1]), 'is corrupted'),
+    (lambda data: data[:-5], 'is corrupted'),
+])
+def test_incompatible_snapshots_are_rejected(path: Path, corrupt, message: str):
+    """Test if an incompatible snapshot is rejected and no variable is declared."""
+    path.write_bytes(corrupt(path.read_bytes()))
+    interpreter = Interpreter(SymbolTableManager())
+    with pytest.raises(ValueError, match=message):
+        interpreter.restore(path)
+    assert not interpreter.symbol_table.slots
+
+
+def test_unsupported_values_are_rejected(tmp_path: Path):
+    """Test if a variable of a type µLang does not produce is not saved."""
+    symbol_table = SymbolTableManager()
+    symbol_table.declare(Symbol('numbers', SymbolType.VARIABLE, [1, 2]))
+    with pytest.raises(ValueError, match='Cannot save variable `numbers` of type `list`'):
+        snapshot.save(symbol_table, tmp_path / 'session.snapshot')
+    assert not list(tmp_path.iterdir())
+
+
+def test_declare_many_matches_declare():
+    """Test if declaring symbols at once gives the same slots and shape as one by one."""
+    symbols = [Symbol(name, SymbolType.VARIABLE, value) for name, value in (
+        ('a', 1), ('b', 2), ('a', 3), ('c', 4),
+    )]
+    one_by_one = SymbolTableManager()
+    for symbol in symbols:
+        one_by_one.declare(Symbol(symbol.name, symbol.type, symbol.value), replace=True)
+    at_once = SymbolTableManager()
+    at_once.declare_many(symbols)
+    assert at_once.shape == one_by_one.shape
+    assert [symbol.value for symbol in at_once.slots] == [3, 2, 4]
+    assert at_once.resolve('c') == one_by_one.resolve('c')
@@ -0,0 +1,78 @@
+"""Module with tests of scopes of the symbol table and resolution of variables to slots."""
+
+import pytest
+
+from core.cache import ParseCache
+from core.interpreter import Backend, Interpreter
+from core.symbol_table_manager import Scope, Symbol, SymbolTableManager, SymbolType
+from core.tokens.statement import SlotInvocation
+
+
+def variable(name: str, value: float) -> Symbol:
+    """Create a symbol of a variable."""
+    return Symbol(name, SymbolType.VARIABLE, value)
+
+
+def test_nested_scope_resolves_names_of_enclosing_scopes():
+    """Test if names are looked up in the innermost scope declaring them."""
+    outer = SymbolTableManager()
+    outer['rate'] = variable('rate', 20)
+    outer['hours'] = variable('hours', 8)
+    inner = SymbolTableManager(outer)
+    inner['hours'] = variable('hours', 4)
+
+    assert inner.lookup('rate') == 20
+    assert inner.lookup('hours') == 4
+    assert outer.lookup('hours') == 8
+    assert inner.resolve('rate') == (1, 0)
+    assert inner.resolve('hours') == (0, 0)
+    assert inner.resolve('days') is None
+    assert outer['rate'].scope is Scope.GLOBAL
+    assert inner['hours'].scope is Scope.LOCAL
+    with pytest.raises(NameError):
+        inner.lookup('days')
+
+
+def test_redeclaration_keeps_slot():
+    """Test if redeclaring a variable replaces its value in the same slot."""
+    symbol_table = SymbolTableManager()
+    symbol_table['hours'] = variable('hours', 8)
+    shape = symbol_table.shape
+    with pytest.raises(UserWarning):
+        symbol_table['hours'] = variable('hours', 6)
+    assert symbol_table.resolve('hours') == (0, 0)
+    assert symbol_table.lookup('hours') == 6
+    assert symbol_table.shape is shape
+
+
+@pytest.mark.parametrize('backend', list(Backend), ids=lambda backend: backend.value)
+def test_variables_are_read_from_slots(backend: Backend):
+    """Test if declared variables are resolved to slots and evaluate the same."""
+    outer = SymbolTableManager()
+    outer['rate'] = variable('rate', 20)
+    interpreter = Interpreter(SymbolTableManager(outer), backend=backend)
+    interpreter.evaluate('var hours = 8')
+
+    tree = interpreter.parse('rate * hours - days')
+    assert isinstance(tree.left.left, SlotInvocation)
+    assert (tree.left.left.depth, tree.left.left.index) == (1, 0)
+    assert (tree.left.right.depth, tree.left.right.index) == (0, 0)
+    assert not isinstance(tree.right, SlotInvocation)
+
+    interpreter.evaluate('var days = 2')
+    assert interpreter.evaluate('rate * hours - days') == 158
+
+
+def test_declaring_in_enclosing_scope_invalidates_resolution():
+    """Test if a name is resolved again once a scope in between declares it."""
+    outer = SymbolTableManager()
+    outer['hours'] = variable('hours', 8)
+    inner = SymbolTableManager(outer)
+    interpreter = Interpreter(inner, parse_cache=ParseCache())
+    function = interpreter.compile('hours * 2')
+    assert interpreter.evaluate('hours * 2') == 16
+
+    interpreter.evaluate('var hours = 3')
+    assert interpreter.evaluate('hours * 2') == 6
+    # Compiled code keeps the slot it was resolved to.
+    assert function() == 16
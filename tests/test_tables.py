@@ -0,0 +1,51 @@
+"""Module with tests of the precomputed parse tables."""
+
+import subprocess
+import sys
+
+import pytest
+
+from core import tables
+from core.interpreter import Interpreter
+from core.parser import Parser
+
+
+def test_tables_are_up_to_date():
+    """Test if the precomputed tables were generated for the current grammar."""
+    assert tables.stored_hash() == tables.grammar_hash(*tables.current_grammar()), \
+        "Grammar changed, regenerate the tables with `python -m core.tables`."
+
+
+@pytest.mark.parametrize('code', [
+    '10 - 10 + 10 * 10 / 2',
+    '5 / 10 ^ 2',
+    '12:15 - 8:30',
+    'if 10 < 30 then "Hi, µLang"',
+    'var complex_case = 2 ^ 10',
+])
+def test_precomputed_tables_parse_as_rply(code: str):
+    """Test if the stored tables parse code the same as tables constructed by `rply`."""
+    parser_generator = Parser()
+    parser_generator.parse()
+    precomputed = Interpreter(parser=parser_generator.get_parser())
+    constructed = Interpreter(parser=parser_generator.get_parser(precomputed=False))
+    assert precomputed.evaluate(code) == constructed.evaluate(code)
+
+
+def test_outdated_tables_are_constructed_at_runtime(monkeypatch: pytest.MonkeyPatch):
+    """Test if a changed grammar falls back to constructing tables with a warning."""
+    monkeypatch.setattr(tables, 'stored_hash', lambda: None)
+    parser_generator = Parser()
+    parser_generator.parse()
+    with pytest.warns(UserWarning, match='out of date'):
+        parser = parser_generator.get_parser()
+    assert Interpreter(parser=parser).evaluate('2 ^ 10') == 1024
+
+
+def test_evaluation_does_not_import_rply():
+    """Test if evaluating code with precomputed tables leaves `rply` unloaded."""
+    code = "import sys; from main import evaluate; evaluate('1 + 1'); print('rply' in sys.modules)"
+    output = subprocess.run(
+        [sys.executable, '-c', code], check=True, capture_output=True, text=True
+    ).stdout
+    assert output.strip() == 'False'
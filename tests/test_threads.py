@@ -0,0 +1,108 @@
+"""Module with stress tests of evaluating code from many threads sharing one parser."""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from core.cache import MemoCache, ParseCache
+from core.interpreter import Backend, Interpreter, shared_parser
+from core.parallel import evaluate_parallel
+from core.symbol_table_manager import SymbolTableManager
+from core.tokens.literal import Duration
+
+THREADS = 8
+
+
+@pytest.fixture(autouse=True, name='switch_often')
+def fixture_switch_often():
+    """Switch threads as often as possible, so races show up in short tests."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+@pytest.mark.parametrize('backend', list(Backend))
+def test_interpreters_of_threads_are_isolated(backend: Backend):
+    """Test if threads sharing a small parse cache evaluate with their own variables."""
+    parse_cache = ParseCache(capacity=4)
+
+    def work(worker: int) -> list[object]:
+        interpreter = Interpreter(SymbolTableManager(), backend=backend, parse_cache=parse_cache)
+        if worker % 2:
+            # Variables declared in another order give the same code another shape.
+            interpreter.evaluate('var padding = 0')
+        interpreter.evaluate(f'var start = {worker}:00')
+        interpreter.evaluate(f'var rate = {worker}')
+        results = []
+        for step in range(200):
+            results.append(interpreter.evaluate(f'{12 + step % 10}:00 - start'))
+            results.append(interpreter.evaluate('rate * 2'))
+        return results
+
+    with ThreadPoolExecutor(THREADS) as executor:
+        outcomes = list(executor.map(work, range(THREADS)))
+    for worker, results in enumerate(outcomes):
+        assert results[0::2] == [Duration((12 + step % 10 - worker) * 60) for step in range(200)]
+        assert results[1::2] == [worker * 2.0] * 200
+    assert len(parse_cache) <= 4
+
+
+def test_memoized_function_is_shared():
+    """Test if a memoized function called from many threads keeps a consistent cache."""
+    interpreter = Interpreter(SymbolTableManager())
+    interpreter.evaluate('fun fib(n) = if n < 2 then n else fib(n - 1) + fib(n - 2)')
+    memo = interpreter.memoize('fib', capacity=16)
+    function = interpreter.symbol_table['fib'].value
+
+    def work(worker: int) -> list[float]:
+        return [function(float((worker + step) % 40)) for step in range(100)]
+
+    with ThreadPoolExecutor(THREADS) as executor:
+        outcomes = list(executor.map(work, range(THREADS)))
+    fibonacci = [0, 1]
+    while len(fibonacci) < 40:
+        fibonacci.append(fibonacci[-1] + fibonacci[-2])
+    for worker, results in enumerate(outcomes):
+        assert results == [fibonacci[(worker + step) % 40] for step in range(100)]
+    assert len(memo) <= 16
+
+
+@pytest.mark.parametrize('cache', [ParseCache(capacity=8), MemoCache(capacity=8)])
+def test_caches_stay_bounded(cache: ParseCache | MemoCache):
+    """Test if a cache looked up and filled from many threads at once keeps its capacity."""
+    def work(worker: int) -> list[bool]:
+        correct = []
+        for step in range(2000):
+            key = (worker * step) % 13
+            if isinstance(cache, MemoCache):
+                correct.append(cache.call(abs, (-key,)) == key)
+                continue
+            shape = ('shape', worker % 2)
+            tree = cache.get(key, shape)
+            if tree is None:
+                cache.put(key, shape, (key, shape))
+            correct.append(tree in (None, (key, shape)))
+        return correct
+
+    with ThreadPoolExecutor(THREADS) as executor:
+        outcomes = list(executor.map(work, range(THREADS)))
+    assert all(all(correct) for correct in outcomes)
+    assert len(cache) <= 8
+
+
+def test_grammar_is_built_once():
+    """Test if threads asking for the parser at once get the same one."""
+    with ThreadPoolExecutor(THREADS) as executor:
+        parsers = list(executor.map(lambda _: shared_parser(), range(THREADS)))
+    assert all(parser is parsers[0] for parser in parsers)
+
+
+def test_threads_evaluate_programs_in_order():
+    """Test if worker threads keep the order of programs, which do not share variables."""
+    programs = [f'var hours = {number}; hours * 2' for number in range(300)]
+    results = list(evaluate_parallel(programs, workers=4, threads=True))
+    assert [result.value for result in results] == [
+        [f'hours = {float(number)}', number * 2.0] for number in range(300)
+    ]
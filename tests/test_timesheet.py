@@ -0,0 +1,126 @@
+"""Module with tests of aggregating timesheets read from CSV and logs."""
+
+import io
+
+import pytest
+
+from core.diagnostics import Diagnostics
+from core.interpreter import Backend, Interpreter
+from core.symbol_table_manager import SymbolTableManager
+from core.timesheet import (
+    Aggregate,
+    Timesheet,
+    parse_duration,
+    read_csv,
+    read_log,
+    summarize,
+)
+from core.tokens.literal import Duration
+
+CSV = """employee,date,start,end,break
+alice,2024-05-01,8:00,16:30,0h30m
+bob,2024-05-01,9:15,17:00,0h45m
+alice,2024-05-02,7:45,15:00,0h15m
+"""
+
+
+@pytest.mark.parametrize('backend', list(Backend))
+def test_totals_by_group(backend: Backend):
+    """Test if durations are totalled overall and by the values of a column."""
+    timesheet = Timesheet(
+        group_by='employee', interpreter=Interpreter(SymbolTableManager(), backend=backend)
+    ).consume(*read_csv(io.StringIO(CSV)))
+    assert timesheet.total.total == Duration('23h30m')
+    assert timesheet.total.minimum == Duration('7h15m')
+    assert timesheet.total.maximum == Duration('8h30m')
+    assert timesheet.groups['alice'].total == Duration('15h45m')
+    assert timesheet.groups['bob'].count == 1
+
+
+def test_expression_uses_parsers_and_variables():
+    """Test if columns are parsed by their parsers and variables of the interpreter are read."""
+    interpreter = Interpreter(SymbolTableManager())
+    interpreter.evaluate('var overtime = 8:30 - 8:00')
+    timesheet = Timesheet(
+        'end - start - break + overtime', parsers={'break': parse_duration},
+        interpreter=interpreter,
+    ).consume(*read_csv(io.StringIO(CSV)))
+    assert timesheet.total.total == Duration('23h30m') - Duration('1h30m') + Duration('1h30m')
+    assert [symbol.name for symbol in interpreter.symbol_table.slots] == ['overtime']
+
+
+def test_logs_skip_unmatched_lines():
+    """Test if lines of a log the pattern does not match are skipped."""
+    log = io.StringIO(
+        '[info] alice in 8:00 out 9:30\n'
+        '[warn] disk almost full\n'
+        '[info] bob in 10:00 out 12:00\n'
+    )
+    header, rows = read_log(log, r'(?P<employee>\w+) in (?P<start>\S+) out (?P<end>\S+)')
+    assert header == ['employee', 'start', 'end']
+    timesheet = Timesheet(group_by='employee').consume(header, rows)
+    assert timesheet.total.count == 2
+    assert timesheet.groups['bob'].total == Duration('2h')
+
+
+def test_errors_name_rows():
+    """Test if a malformed row is reported with its number or skipped if asked to."""
+    rows = [['8:00', '9:00'], ['8:00', 'noon'], ['10:00', '11:30']]
+    with pytest.raises(Exception) as error:
+        Timesheet().consume(['start', 'end'], rows)
+    assert 'In row 2' in ''.join(error.value.__notes__)
+    timesheet = Timesheet(skip_errors=True).consume(['start', 'end'], rows)
+    assert timesheet.skipped == 1
+    assert timesheet.total.total == Duration('2h30m')
+
+
+@pytest.mark.parametrize('backend', list(Backend))
+def test_warnings_of_rows_are_collected(backend: Backend):
+    """Test if an interpreter with diagnostics collects warnings of rows, e.g. night shifts."""
+    diagnostics = Diagnostics()
+    interpreter = Interpreter(SymbolTableManager(), backend=backend, diagnostics=diagnostics)
+    rows = [['8:00', '16:00'], ['22:00', '6:00'], ['9:00', '12:00']]
+    timesheet = Timesheet(interpreter=interpreter).consume(['start', 'end'], rows)
+    assert timesheet.total.count == 3
+    assert timesheet.total.total == Duration('8h') + Duration('16h') + Duration('3h')
+    assert [str(warning) for warning in diagnostics.warnings] == [
+        'warning at line 2: Did you mean `22:00 - 06:00`?'
+    ]
+    with pytest.raises(UserWarning) as error:
+        Timesheet().consume(['start', 'end'], rows)
+    assert 'In row 2' in ''.join(error.value.__notes__)
+
+
+@pytest.mark.parametrize('header,rows,expected', [
+    ([], [], ValueError),
+    (['start', 'end'], [['8:00', '9:00']], ValueError),
+])
+def test_missing_columns_are_rejected(header, rows, expected):
+    """Test if a missing column to group by is rejected before reading rows."""
+    with pytest.raises(expected, match='no column `employee`'):
+        Timesheet(group_by='employee').consume(header, rows)
+
+
+def test_non_durations_are_rejected():
+    """Test if an expression evaluating to something but a duration is rejected."""
+    aggregate = Aggregate()
+    with pytest.raises(TypeError, match='have to evaluate to durations'):
+        aggregate.add(1.5)  # type: ignore[arg-type]
+    assert aggregate.count == 0
+    assert aggregate.mean is None
+
+
+def test_rows_are_read_lazily(tmp_path):
+    """Test if rows are consumed one at a time instead of read at once."""
+    consumed = []
+
+    def rows():
+        for hour in range(8, 12):
+            consumed.append(hour)
+            assert len(consumed) == hour - 7
+            yield [f'{hour}:00', f'{hour}:45']
+
+    assert Timesheet().consume(['start', 'end'], rows()).total.total == Duration('3h')
+    path = tmp_path / 'shifts.csv'
+    path.write_text(CSV, encoding='utf-8')
+    assert summarize(str(path), Timesheet()).total.count == 3
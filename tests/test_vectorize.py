@@ -0,0 +1,93 @@
+"""Module with tests of evaluating expressions over columns of values."""
+
+import array
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from core.interpreter import Interpreter
+from core.tokens.literal import Duration, Numeric, Time
+
+numpy = pytest.importorskip('numpy')
+
+
+@pytest.fixture(name='interpreter')
+def fixture_interpreter() -> Interpreter:
+    """Supply an interpreter with a declared variable."""
+    interpreter = Interpreter()
+    interpreter.evaluate('var bonus = 10')
+    return interpreter
+
+
+@pytest.mark.parametrize('code', [
+    'rate * hours - bonus',
+    'hours ^ 2 / rate + 1',
+    'rate - hours * 2 ^ 3 > bonus',
+    'if hours > 6 then rate * hours',
+    'if hours > 6 then 48 / hours - 6',
+    'if hours > 6 then rate * hours else bonus - hours',
+    'if hours > 6 then 48 / hours else 0',
+    'hours ^ 0.5',
+    'bonus * 2',
+])
+def test_columns_match_rows(interpreter: Interpreter, code: str):
+    """Test if evaluating columns gives the same results as evaluating every row."""
+    rate = numpy.array([12.5, 10, 0.5, 31.25])
+    hours = array.array('i', [8, 6, 0, -4])
+    results = interpreter.vectorize(code)({'rate': rate, 'hours': hours})
+
+    assert len(results) == len(rate)
+    for row, result in enumerate(results.tolist()):
+        declarations = Interpreter()
+        declarations.evaluate('var bonus = 10')
+        declarations.evaluate(f'var rate = {rate[row]}')
+        declarations.evaluate(f'var hours = {hours[row]}')
+        assert result == declarations.evaluate(code), f'Mismatch in row {row}.'
+
+
+def test_errors_of_rows(interpreter: Interpreter):
+    """Test if an error of a row is raised as when evaluating the row alone."""
+    with pytest.raises(ZeroDivisionError) as error:
+        interpreter.vectorize('8 / hours')({'hours': [8, 0]})
+    assert error.value.__notes__ == ['In row 1.']
+
+
+def test_non_numeric_columns(interpreter: Interpreter):
+    """Test if columns of other types than numbers are evaluated row by row."""
+    results = interpreter.vectorize('end - start')(
+        {'start': [Time('8:00'), Time('9:15')], 'end': [Time('16:30'), Time('17:00')]}
+    )
+    assert list(results) == [Duration('8h30m'), Duration('7h45m')]
+
+
+@pytest.mark.parametrize('numeric,code,columns,expected', [
+    (Numeric.INTEGER, 'a * b + 1', {'a': [2 ** 53, 3], 'b': [1, 2]}, [2 ** 53 + 1, 7]),
+    (Numeric.DECIMAL, 'rate * 0.1', {'rate': [3, 7]}, [Decimal('0.3'), Decimal('0.7')]),
+])
+def test_exact_numeric_modes(numeric: Numeric, code: str, columns: dict[str, Any], expected):
+    """Test if columns of an exact numeric mode give the exact results of every row."""
+    interpreter = Interpreter(numeric=numeric)
+    results = interpreter.vectorize(code)(columns)
+    assert results.tolist() == expected
+    for row, result in enumerate(expected):
+        declarations = Interpreter(numeric=numeric)
+        for name, column in columns.items():
+            declarations.evaluate(f'var {name} = {column[row]}')
+        assert declarations.evaluate(code) == result
+
+
+@pytest.mark.parametrize('columns', [
+    {'hours': [1, 2], 'rate': [1, 2, 3]},
+    {'hours': [[1, 2], [3, 4]]},
+])
+def test_invalid_columns(interpreter: Interpreter, columns: dict[str, Any]):
+    """Test if columns of different lengths or dimensions are rejected."""
+    with pytest.raises(ValueError):
+        interpreter.vectorize('hours * rate')(columns)
+
+
+def test_statement_cannot_be_vectorized(interpreter: Interpreter):
+    """Test if a declaration is rejected."""
+    with pytest.raises(TypeError):
+        interpreter.vectorize('var pay = 10')